@@ -4,33 +4,75 @@ WeDealize AI Agent Orchestrator
 """
 
 import asyncio
+import itertools
 import logging
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from enum import Enum
 
+from sqlalchemy import func, or_
+
 # 내부 모듈
 from .supplier_discovery_agent import (
     SupplierDiscoveryAgent,
     SearchCriteria,
+    SearchBudget,
     DiscoveredSupplier,
     AlibabaCrawler,
     GlobalSourcesCrawler,
     WebSearchCrawler
 )
+from .supplier_verifier import SupplierVerifier
 from ..parsers.catalog_parser import CatalogParser, ExtractedProduct
 from ..models.database import (
-    Supplier, Product, Catalog, CrawlJob,
+    Supplier, Product, Category, Catalog, CrawlJob, PriceHistory,
     SupplierStatus, CrawlStatus,
     init_database, get_session
 )
+from ..services.job_queue import JobQueue, JobWorker, JobContext, JobOutcome, JobHandler
+from ..services.metrics import track_stage, summarize_timings, mark_process_dead
+from ..services.search_index import ProductSearchIndex
+from ..services.certifications import CertificationIndex, register_listeners as register_certification_listeners
+from ..services.vector_index import VectorIndex
+from ..services.embedding_pipeline import EmbeddingPipeline
+from ..services.price_refresh import RefreshEngine
+from ..services.entity_resolution import SupplierResolver
+from ..services.discovery_cache import DiscoveryCache
+from ..services.contact_enrichment import ContactEnricher, EnrichmentProgress
+from ..crawlers.rate_limit import RateLimiterRegistry
+from ..crawlers.browser_pool import BrowserPool, PLAYWRIGHT_AVAILABLE
+from ..crawlers.http_cache import HttpCache
+from ..crawlers.frontier import CrawlFrontier
+from ..crawlers.catalog_crawler import CatalogCrawler
+from ..crawlers.politeness import PolitenessPolicy
+from ..crawlers.email_extractor import EmailExtractor
+from ..config.settings import CrawlerConfig, DataSourceConfig, LLMConfig, SchedulerConfig, ScoringWeights, settings
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# 진행 이벤트 콜백: (event, data)
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+
+@dataclass
+class _JobResources:
+    """작업 큐 작업 1건 전용 DB 세션과 그 세션에 묶인 컴포넌트"""
+    session: Any
+    supplier_resolver: SupplierResolver
+    embedding_pipeline: Optional[EmbeddingPipeline]
+
+
+# 실행 중인 작업의 DB 자원 (핸들러 태스크마다 따로, 작업 밖에서는 None → 공유 세션)
+_job_resources: ContextVar[Optional[_JobResources]] = ContextVar("orchestrator_job_resources", default=None)
+
+
 class PipelineStage(Enum):
     IDLE = "idle"
     DISCOVERING = "discovering"
@@ -50,10 +92,12 @@ class PipelineResult:
     catalogs_parsed: int = 0
     errors: List[str] = None
     execution_time_seconds: float = 0
+    stage_timings: Dict[str, float] = None  # {"interpret": 0.4, "discover": 3.1, ...}
     details: Dict[str, Any] = None
 
     def __post_init__(self):
         self.errors = self.errors or []
+        self.stage_timings = self.stage_timings or {}
         self.details = self.details or {}
 
 
@@ -74,27 +118,226 @@ class SupplierDiscoveryOrchestrator:
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
 
+        # 데이터 소스별 요청 속도 제한 (동시 파이프라인 공유)
+        source_defaults = DataSourceConfig()
+        self.source_rate_limiters = RateLimiterRegistry(
+            default_rate=self.config.get("default_source_rate", source_defaults.default_source_rate),
+            rates=self.config.get("source_rate_limits", source_defaults.source_rate_limits)
+        )
+
+        # 후보 점수 가중치 (ScoringWeights 또는 dict)
+        scoring_weights = self.config.get("scoring_weights")
+        if isinstance(scoring_weights, dict):
+            scoring_weights = ScoringWeights(**scoring_weights)
+
+        # LLM 일괄 검증 (config 에 llm_client 가 있을 때만)
+        llm_client = self.config.get("llm_client")
+        llm_defaults = LLMConfig()
+        verifier = SupplierVerifier(
+            llm_client,
+            batch_token_budget=llm_defaults.verification_batch_tokens,
+            max_batch_size=llm_defaults.verification_max_batch_size,
+            max_concurrent_batches=llm_defaults.verification_max_concurrency,
+            cache_ttl_seconds=llm_defaults.verification_cache_ttl_seconds,
+            weight=llm_defaults.verification_weight
+        ) if llm_client else None
+
         # 컴포넌트 초기화
-        self.discovery_agent = SupplierDiscoveryAgent()
+        self.discovery_agent = SupplierDiscoveryAgent(
+            llm_client=llm_client,
+            rate_limiters=self.source_rate_limiters,
+            default_source_timeout=self.config.get(
+                "default_source_timeout", source_defaults.default_source_timeout_seconds
+            ),
+            source_timeouts=self.config.get("source_timeouts", source_defaults.source_timeouts),
+            cache=DiscoveryCache(
+                self.config.get("discovery_cache_path", source_defaults.cache_path),
+                default_ttl_seconds=source_defaults.default_cache_ttl_seconds,
+                ttls=self.config.get("discovery_cache_ttls", source_defaults.cache_ttls),
+                stale_seconds=source_defaults.cache_stale_seconds
+            ) if self.config.get("discovery_cache_enabled", source_defaults.cache_enabled) else None,
+            scoring_weights=scoring_weights,
+            verifier=verifier,
+            search_budget=SearchBudget(
+                max_results=self.config.get("max_results_per_source", source_defaults.max_results_per_source),
+                max_pages=self.config.get("max_pages_per_source", source_defaults.max_pages_per_source)
+            )
+        )
+        self.target_confident_suppliers = self.config.get(
+            "target_confident_suppliers", source_defaults.target_confident_suppliers
+        )
+        self.confident_score_threshold = self.config.get(
+            "confident_score_threshold", source_defaults.confident_score_threshold
+        )
         self.catalog_parser = CatalogParser()
 
         # 데이터베이스
         db_url = self.config.get("database_url", "sqlite:///wedealize.db")
         self.engine = init_database(db_url)
-        self.db_session = get_session(self.engine)
+        self._shared_session = get_session(self.engine)
+
+        # 상품 전문 검색 인덱스 (FTS5 / tsvector)
+        self.search_index = ProductSearchIndex(self.engine)
+        self.search_index.ensure()
+
+        # 인증 역색인 (Product/Supplier 저장 시 자동 동기화)
+        register_certification_listeners()
+        self.certification_index = CertificationIndex(self.db_session)
+        self.certification_index.ensure()
+
+        # 임베딩 ANN 인덱스 (유사 상품 / 의미 검색)
+        self.embedding_client = self.config.get("embedding_client")  # async embed(texts) -> List[List[float]]
+        self.vector_index = VectorIndex(self.config.get("vector_index_path", "./data/vector_index"))
+
+        # 임베딩 일괄 생성 (텍스트 해시 캐시)
+        self._shared_embedding_pipeline = self._make_embedding_pipeline(self._shared_session)
+
+        # 공급사 중복 판별 (소스 간 병합 + 기존 공급사 매칭)
+        self._shared_supplier_resolver = SupplierResolver(self._shared_session)
+        self._shared_supplier_resolver.ensure_index()
+
+        # 작업 큐 (다중 워커 파이프라인, 기본값은 환경 변수 WORKER_CONCURRENCY 등을 반영한 settings.worker)
+        self.job_queue = JobQueue(self.engine, self.config.get("worker_config", settings.worker))
+
+        # 크롤링 예절 정책 (모든 크롤러 요청 공유: 호스트 간격, 전역 동시 요청 수, robots.txt)
+        crawler_defaults = CrawlerConfig()
+        self.politeness = self.config.get("politeness") or PolitenessPolicy.from_config(crawler_defaults)
+
+        # 공유 브라우저 풀 (마켓플레이스 크롤러 / 이메일 추출, playwright 설치 시)
+        self.browser_pool = BrowserPool(
+            browsers=self.config.get("browser_pool_size", crawler_defaults.browser_pool_size),
+            contexts_per_browser=crawler_defaults.browser_contexts_per_browser,
+            max_pages_per_context=crawler_defaults.browser_max_pages_per_context,
+            user_agent=crawler_defaults.user_agent,
+            blocked_resource_types=crawler_defaults.browser_blocked_resources
+        ) if PLAYWRIGHT_AVAILABLE and self.config.get("use_browser", True) else None
+
+        # 크롤러 공용 디스크 HTTP 캐시
+        self.http_cache = HttpCache(
+            self.config.get("http_cache_path", crawler_defaults.http_cache_path),
+            max_bytes=crawler_defaults.http_cache_max_mb * 1024 * 1024,
+            offline=self.config.get("http_cache_offline", crawler_defaults.http_cache_offline)
+        ) if self.config.get("http_cache_enabled", crawler_defaults.http_cache_enabled) else None
+
+        # 카탈로그 크롤링 (디스크 프런티어 → 재시작 시 이어서, 방문한 URL 은 다시 안 가져옴)
+        self.crawl_frontier = CrawlFrontier(
+            self.config.get("frontier_path", crawler_defaults.frontier_path),
+            bloom_capacity=crawler_defaults.frontier_bloom_capacity
+        )
+        self.catalog_crawler = CatalogCrawler(
+            self.crawl_frontier,
+            download_path=self.config.get("catalog_path", crawler_defaults.catalog_path),
+            http_cache=self.http_cache,
+            politeness=self.politeness,
+            timeout_seconds=crawler_defaults.timeout_seconds,
+            max_pages_per_site=crawler_defaults.catalog_max_pages_per_site,
+            max_depth=crawler_defaults.catalog_max_depth,
+            max_documents_per_site=crawler_defaults.catalog_max_documents_per_site
+        )
+        self.discovery_agent.catalog_crawler = self.catalog_crawler
+
+        # 연락처 이메일 추출 (연결 풀 / keep-alive 를 쓰는 공유 httpx 클라이언트)
+        self.email_extractor = EmailExtractor(
+            browser_pool=self.browser_pool if self.config.get("email_use_browser", False) else None,
+            http_cache=self.http_cache,
+            politeness=self.politeness,
+            timeout_seconds=crawler_defaults.timeout_seconds,
+            max_connections=crawler_defaults.http_max_connections,
+            max_keepalive_connections=crawler_defaults.http_max_keepalive_connections,
+            keepalive_expiry_seconds=crawler_defaults.http_keepalive_expiry_seconds,
+            http2=crawler_defaults.http2_enabled,
+            max_contact_pages=crawler_defaults.email_max_contact_pages,
+            max_page_bytes=crawler_defaults.email_max_page_bytes,
+            stop_after_footer=crawler_defaults.email_stop_after_footer
+        )
 
         # 데이터 소스 등록
         self._register_data_sources()
 
-        # 상태
+        # 상태 (여러 파이프라인이 동시에 돌면 current_stage 는 마지막으로 바뀐 단계, 실행별 단계는 running_pipelines)
         self.current_stage = PipelineStage.IDLE
         self.current_job_id = None
+        self.last_result: Optional[PipelineResult] = None
+        self.running_pipelines: Dict[int, Dict[str, Any]] = {}
+        self._pipeline_ids = itertools.count(1)
+
+    # ==================== DB 세션 ====================
+
+    @property
+    def db_session(self):
+        """현재 DB 세션 (작업 큐 핸들러 안에서는 작업 전용 세션, 그 밖에서는 공유 세션)"""
+        resources = _job_resources.get()
+        return resources.session if resources is not None else self._shared_session
+
+    @property
+    def supplier_resolver(self) -> SupplierResolver:
+        resources = _job_resources.get()
+        return resources.supplier_resolver if resources is not None else self._shared_supplier_resolver
+
+    @property
+    def embedding_pipeline(self) -> Optional[EmbeddingPipeline]:
+        resources = _job_resources.get()
+        return resources.embedding_pipeline if resources is not None else self._shared_embedding_pipeline
+
+    def _make_embedding_pipeline(self, session) -> Optional[EmbeddingPipeline]:
+        if not self.embedding_client:
+            return None
+        return EmbeddingPipeline(
+            session,
+            self.embedding_client,
+            model_name=self.config.get("embedding_model", "text-embedding-3-small"),
+            vector_index=self.vector_index
+        )
+
+    @contextmanager
+    def _job_session(self):
+        """
+        작업 1건 전용 세션 구간 (구간 안의 db_session / supplier_resolver / embedding_pipeline 이 이 세션을 사용)
+
+        워커는 작업마다 핸들러 태스크를 따로 만들므로 동시에 도는 작업끼리 세션을 공유하지 않습니다.
+        """
+        session = get_session(self.engine)
+        token = _job_resources.set(_JobResources(
+            session=session,
+            supplier_resolver=SupplierResolver(session),
+            embedding_pipeline=self._make_embedding_pipeline(session)
+        ))
+        try:
+            yield session
+        finally:
+            _job_resources.reset(token)
+            session.close()
+
+    def _with_job_session(self, handler: JobHandler) -> JobHandler:
+        async def run(ctx: JobContext) -> Optional[JobOutcome]:
+            with self._job_session():
+                return await handler(ctx)
+        return run
+
+    @contextmanager
+    def _db_transaction(self):
+        """
+        현재 세션 DB 구간 (성공 시 커밋, 오류 시 롤백)
+
+        구간 안에서는 await 하지 않습니다 → 동시에 도는 파이프라인의 DB 작업이 서로 끼어들지 않고,
+        한 파이프라인의 오류가 세션을 실패 상태로 남겨 다른 파이프라인까지 실패시키지 않습니다.
+        """
+        try:
+            yield self.db_session
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
 
     def _register_data_sources(self):
         """크롤러 데이터 소스 등록"""
         # Alibaba
         self.discovery_agent.register_data_source(
-            AlibabaCrawler(api_key=self.config.get("alibaba_api_key"))
+            AlibabaCrawler(
+                api_key=self.config.get("alibaba_api_key"),
+                browser_pool=self.browser_pool,
+                politeness=self.politeness
+            )
         )
 
         # Global Sources
@@ -103,11 +346,23 @@ class SupplierDiscoveryOrchestrator:
         # Web Search
         self.discovery_agent.register_data_source(WebSearchCrawler())
 
+    async def aclose(self):
+        """공유 자원 정리 (브라우저 풀, 이메일 추출기 / 카탈로그 크롤러 클라이언트, 프런티어, HTTP 캐시, robots.txt 클라이언트)"""
+        if self.browser_pool is not None:
+            await self.browser_pool.close()
+        await self.email_extractor.aclose()
+        await self.catalog_crawler.aclose()
+        await self.politeness.aclose()
+        self.crawl_frontier.close()
+        if self.http_cache is not None:
+            self.http_cache.close()
+
     async def run_discovery_pipeline(
         self,
         query: str,
         auto_crawl: bool = True,
-        auto_parse: bool = True
+        auto_parse: bool = True,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> PipelineResult:
         """
         전체 탐색 파이프라인 실행
@@ -116,98 +371,187 @@ class SupplierDiscoveryOrchestrator:
             query: 자연어 검색 쿼리
             auto_crawl: 자동으로 카탈로그 크롤링 수행
             auto_parse: 자동으로 카탈로그 파싱 수행
+            progress_callback: (event, data) 진행 이벤트 수신 ("stage", "counts", "supplier", "error")
         """
         start_time = datetime.now()
         result = PipelineResult(stage=PipelineStage.IDLE)
+        trackers = {}
+        run_id = next(self._pipeline_ids)
+        self.running_pipelines[run_id] = {"query": query, "stage": PipelineStage.IDLE.value, "started_at": start_time.isoformat()}
+
+        def notify(event: str, data: Dict[str, Any]):
+            if progress_callback is None:
+                return
+            try:
+                progress_callback(event, data)
+            except Exception as e:
+                logger.warning(f"진행 이벤트 전달 실패 ({event}): {e}")
+
+        def enter(stage: PipelineStage, label: str = None):
+            self.current_stage = stage
+            self.running_pipelines[run_id]["stage"] = stage.value
+            notify("stage", {"stage": label or stage.value})
 
         try:
             # 1. 검색 조건 해석
             logger.info(f"검색 쿼리 해석 중: {query}")
-            self.current_stage = PipelineStage.DISCOVERING
+            enter(PipelineStage.DISCOVERING, "interpreting")
 
-            criteria = await self.discovery_agent.interpret_search_query(query)
+            with track_stage("interpret") as trackers["interpret"]:
+                criteria = await self.discovery_agent.interpret_search_query(query)
             logger.info(f"해석된 조건: {criteria}")
+            notify("criteria", {"criteria": asdict(criteria)})
 
-            # 2. 공급사 탐색
+            # 2. 공급사 탐색 + 3. DB 저장 (먼저 응답한 소스 결과부터 바로 저장)
             logger.info("공급사 탐색 시작...")
-            suppliers = await self.discovery_agent.discover_suppliers(criteria)
-            result.suppliers_discovered = len(suppliers)
-            logger.info(f"발견된 공급사: {len(suppliers)}개")
-
-            # 3. 공급사 정보 DB 저장
-            saved_suppliers = await self._save_suppliers(suppliers, query)
+            enter(PipelineStage.DISCOVERING)
+            saved_by_id: Dict[int, Supplier] = {}
+            store_seconds = 0.0
+            with track_stage("discover") as trackers["discover"]:
+                batches = self.discovery_agent.discover_suppliers_iter(
+                    criteria,
+                    enough=self.target_confident_suppliers,
+                    min_confidence=self.confident_score_threshold
+                )
+                async for batch in batches:
+                    trackers["discover"].add_items(len(batch.suppliers))
+                    result.suppliers_discovered += len(batch.suppliers)
+                    source_info = result.details.setdefault("sources", {}).setdefault(
+                        batch.source, {"found": 0, "pages": 0}
+                    )
+                    source_info["found"] += len(batch.suppliers)
+                    if batch.suppliers:
+                        source_info["pages"] += 1
+                    source_info.update({
+                        "elapsed_seconds": round(batch.elapsed_seconds, 3),
+                        "cached": batch.cached,
+                        "finished": batch.final,
+                        "error": batch.error,
+                    })
+                    notify("source", {"source": batch.source, **source_info})
+                    if not batch.suppliers:
+                        continue
+
+                    with track_stage("store_suppliers") as store:
+                        saved = await self._save_suppliers(batch.suppliers, query)
+                        store.add_items(len(saved))
+                    store_seconds += store.elapsed
+                    for supplier in saved:
+                        if supplier.id not in saved_by_id:
+                            saved_by_id[supplier.id] = supplier
+                            notify("supplier", self._supplier_event(supplier))
+                    notify("counts", {"suppliers_found": len(saved_by_id)})
+
+            saved_suppliers = sorted(
+                saved_by_id.values(), key=lambda s: s.ai_confidence_score or 0.0, reverse=True
+            )
+            logger.info(f"발견된 공급사: {result.suppliers_discovered}개 (저장 {len(saved_suppliers)}개)")
 
             # 4. 카탈로그 크롤링 (옵션)
-            if auto_crawl and suppliers:
-                self.current_stage = PipelineStage.CRAWLING
+            if auto_crawl and saved_suppliers:
+                enter(PipelineStage.CRAWLING)
                 logger.info("카탈로그 크롤링 시작...")
-                catalogs = await self._crawl_catalogs(saved_suppliers[:10])  # 상위 10개만
+                with track_stage("crawl") as trackers["crawl"]:
+                    catalogs = await self._crawl_catalogs(saved_suppliers[:10])  # 상위 10개만
+                    trackers["crawl"].add_items(len(catalogs))
                 result.catalogs_parsed = len(catalogs)
+                notify("counts", {"catalogs_found": len(catalogs)})
 
             # 5. 카탈로그 파싱 (옵션)
             if auto_parse and result.catalogs_parsed > 0:
-                self.current_stage = PipelineStage.PARSING
+                enter(PipelineStage.PARSING)
                 logger.info("카탈로그 파싱 시작...")
-                products = await self._parse_catalogs(catalogs)
+                with track_stage("parse") as trackers["parse"]:
+                    products = await self._parse_catalogs(catalogs)
+                    trackers["parse"].add_items(len(products))
                 result.products_extracted = len(products)
 
                 # 상품 정보 DB 저장
-                await self._save_products(products, saved_suppliers)
+                enter(PipelineStage.STORING)
+                with track_stage("store_products") as trackers["store_products"]:
+                    await self._save_products(products, saved_suppliers)
+                    trackers["store_products"].add_items(len(products))
+                notify("counts", {"products_extracted": len(products)})
 
-            self.current_stage = PipelineStage.COMPLETED
             result.stage = PipelineStage.COMPLETED
+            enter(PipelineStage.COMPLETED)
 
         except Exception as e:
             logger.error(f"파이프라인 오류: {str(e)}")
-            self.current_stage = PipelineStage.ERROR
             result.stage = PipelineStage.ERROR
             result.errors.append(str(e))
+            notify("error", {"message": str(e)})
+            enter(PipelineStage.ERROR)
+        finally:
+            self.running_pipelines.pop(run_id, None)
 
         # 실행 시간 계산
         result.execution_time_seconds = (datetime.now() - start_time).total_seconds()
+        result.stage_timings = summarize_timings(trackers)
+        if "discover" in trackers:
+            result.stage_timings["store_suppliers"] = round(store_seconds, 3)
+        self.last_result = result
 
         return result
 
+    @staticmethod
+    def _supplier_event(supplier: Supplier) -> Dict[str, Any]:
+        """진행 이벤트용 공급사 요약"""
+        return {
+            "id": supplier.id,
+            "name": supplier.name,
+            "country": supplier.country,
+            "website": supplier.website,
+            "certifications": supplier.certifications or [],
+            "source": supplier.discovery_source,
+            "confidence_score": supplier.ai_confidence_score,
+        }
+
     async def _save_suppliers(
         self,
         suppliers: List[DiscoveredSupplier],
         original_query: str
     ) -> List[Supplier]:
-        """공급사 정보 DB 저장"""
+        """공급사 정보 DB 저장 (소스 간 중복 병합 후 기존 공급사와 매칭)"""
         saved = []
 
-        for s in suppliers:
-            # 중복 체크
-            existing = self.db_session.query(Supplier).filter(
-                Supplier.name == s.name,
-                Supplier.country == s.country
-            ).first()
-
-            if existing:
-                # 기존 데이터 업데이트
-                existing.ai_confidence_score = s.confidence_score
-                existing.updated_at = datetime.utcnow()
-                saved.append(existing)
-            else:
-                # 새로 추가
-                supplier = Supplier(
-                    name=s.name,
-                    country=s.country,
-                    website=s.website,
-                    certifications=s.certifications,
-                    discovery_source=s.source,
-                    discovery_query=original_query,
-                    ai_confidence_score=s.confidence_score,
-                    email=s.contact_info.get("email"),
-                    status=SupplierStatus.DISCOVERED
-                )
-                self.db_session.add(supplier)
-                saved.append(supplier)
+        with self._db_transaction():
+            for s in self.supplier_resolver.merge_discovered(suppliers):
+                # 중복 체크 (정규화 상호 / 도메인 / MinHash 후보)
+                existing = self.supplier_resolver.find_existing(s)
+
+                if existing:
+                    # 기존 데이터 업데이트
+                    existing.ai_confidence_score = s.confidence_score
+                    existing.website = existing.website or s.website
+                    existing.email = existing.email or s.contact_info.get("email")
+                    if s.certifications:
+                        existing.certifications = list(dict.fromkeys((existing.certifications or []) + s.certifications))
+                    existing.updated_at = datetime.utcnow()
+                    if existing not in saved:
+                        saved.append(existing)
+                else:
+                    # 새로 추가
+                    supplier = Supplier(
+                        name=s.name,
+                        country=s.country,
+                        website=s.website,
+                        certifications=s.certifications,
+                        discovery_source=s.source,
+                        discovery_query=original_query,
+                        ai_confidence_score=s.confidence_score,
+                        email=s.contact_info.get("email"),
+                        status=SupplierStatus.DISCOVERED
+                    )
+                    self.db_session.add(supplier)
+                    saved.append(supplier)
 
-        self.db_session.commit()
+            self.db_session.flush()
+            for supplier in saved:
+                self.supplier_resolver.index_supplier(supplier)
         return saved
 
-    async def _crawl_catalogs(self, suppliers: List[Supplier]) -> List[Dict]:
+    async def _crawl_catalogs(self, suppliers: List[Supplier], recrawl: bool = False) -> List[Dict]:
         """공급사 웹사이트에서 카탈로그 크롤링"""
         catalogs = []
 
@@ -228,7 +572,8 @@ class SupplierDiscoveryOrchestrator:
                         product_categories=[],
                         contact_info={},
                         raw_data={}
-                    )
+                    ),
+                    recrawl=recrawl
                 )
 
                 if catalog_info.get("catalogs_found"):
@@ -261,70 +606,384 @@ class SupplierDiscoveryOrchestrator:
         self,
         products: List[ExtractedProduct],
         suppliers: List[Supplier]
-    ):
+    ) -> List[Product]:
         """상품 정보 DB 저장"""
         supplier_map = {s.name: s.id for s in suppliers}
+        saved = []
 
-        for p in products:
-            product = Product(
-                supplier_id=suppliers[0].id if suppliers else None,  # 임시
-                name=p.name,
-                sku=p.sku,
-                description=p.description,
-                specifications=p.specifications,
-                unit_price_min=p.unit_price_min,
-                unit_price_max=p.unit_price_max,
-                currency=p.currency,
-                price_unit=p.price_unit,
-                moq=p.moq,
-                moq_unit=p.moq_unit,
-                certifications=p.certifications
-            )
-            self.db_session.add(product)
+        with self._db_transaction():
+            for p in products:
+                product = Product(
+                    supplier_id=suppliers[0].id if suppliers else None,  # 임시
+                    name=p.name,
+                    sku=p.sku,
+                    description=p.description,
+                    specifications=p.specifications,
+                    unit_price_min=p.unit_price_min,
+                    unit_price_max=p.unit_price_max,
+                    currency=p.currency,
+                    price_unit=p.price_unit,
+                    moq=p.moq,
+                    moq_unit=p.moq_unit,
+                    certifications=p.certifications
+                )
+                self.db_session.add(product)
+                saved.append(product)
 
-        self.db_session.commit()
+        # 임베딩은 백그라운드 작업으로 생성
+        self._enqueue_embedding([p.id for p in saved])
+        return saved
+
+    async def _refresh_products(self, products: List[ExtractedProduct], supplier: Supplier) -> List[Product]:
+        """
+        갱신된 카탈로그 상품 반영 (SKU → 상품명 순으로 기존 상품 매칭)
+
+        가격이 바뀐 상품은 PriceHistory 에 이전 가격을 남기고, 새 상품은 추가합니다.
+        """
+        with self._db_transaction():
+            existing = self.db_session.query(Product).filter(Product.supplier_id == supplier.id).all()
+            by_sku = {p.sku: p for p in existing if p.sku}
+            by_name = {p.name.lower(): p for p in existing if p.name}
+
+            now = datetime.utcnow()
+            created, updated = [], []
+            for p in products:
+                product = (by_sku.get(p.sku) if p.sku else None) or by_name.get(p.name.lower())
+                if product is None:
+                    created.append(p)
+                    continue
+
+                if (product.unit_price_min, product.unit_price_max) != (p.unit_price_min, p.unit_price_max):
+                    if product.unit_price_min is not None:
+                        self.db_session.add(PriceHistory(
+                            product_id=product.id,
+                            price_min=product.unit_price_min,
+                            price_max=product.unit_price_max,
+                            currency=product.currency,
+                            moq=product.moq,
+                            source="catalog"
+                        ))
+                    product.unit_price_min = p.unit_price_min
+                    product.unit_price_max = p.unit_price_max
+                    product.currency = p.currency
+                    product.last_price_update = now
+                product.moq = p.moq if p.moq is not None else product.moq
+                product.moq_unit = p.moq_unit or product.moq_unit
+                updated.append(product)
+
+        saved = await self._save_products(created, [supplier]) if created else []
+        return updated + saved
+
+    def _enqueue_embedding(self, product_ids: List[int]):
+        """신규 상품 임베딩 작업 등록 (임베딩 클라이언트가 설정된 경우)"""
+        if self.embedding_pipeline is None or not product_ids:
+            return
+        self.job_queue.enqueue("embed_products", payload={"product_ids": product_ids})
 
     async def search_products(
         self,
         query: str,
-        filters: Dict[str, Any] = None
+        filters: Dict[str, Any] = None,
+        limit: int = 100,
+        offset: int = 0,
+        alternatives: List[str] = ()
     ) -> List[Product]:
         """
         저장된 상품 검색
         (프론트엔드 API용)
+
+        검색어가 있으면 전문 검색 인덱스로 찾고 관련도 순으로 정렬합니다.
+        alternatives 는 대신 일치해도 되는 검색어입니다 (예: 해석된 영문 키워드 + 사용자가 쓴 한국어 상품명).
         """
         # 기본 쿼리
         q = self.db_session.query(Product)
 
         # 텍스트 검색
         if query:
-            q = q.filter(
-                Product.name.ilike(f"%{query}%") |
-                Product.description.ilike(f"%{query}%")
-            )
+            matches = self.search_index.match_subquery(query, alternatives)
+            if matches is not None:
+                q = q.join(matches, Product.id == matches.c.product_id).order_by(matches.c.rank.desc())
+            else:
+                # 인덱스 미지원 DB
+                q = q.filter(or_(*(
+                    Product.name.ilike(f"%{text}%") | Product.name_ko.ilike(f"%{text}%") |
+                    Product.description.ilike(f"%{text}%")
+                    for text in (query, *alternatives) if text
+                )))
 
         # 필터 적용
-        if filters:
-            if filters.get("country"):
-                q = q.join(Supplier).filter(Supplier.country == filters["country"])
+        q = self._apply_product_filters(q, filters)
 
-            if filters.get("certifications"):
-                # JSON 배열 필터링 (DB별로 다름)
-                pass
+        return q.offset(offset).limit(limit).all()
 
-            if filters.get("price_max"):
-                q = q.filter(Product.unit_price_max <= filters["price_max"])
+    def _apply_product_filters(self, q, filters: Optional[Dict[str, Any]]):
+        """상품 검색 필터 (카테고리, 국가, 인증, 가격, MOQ)"""
+        if not filters:
+            return q
 
-            if filters.get("moq_max"):
-                q = q.filter(Product.moq <= filters["moq_max"])
+        if filters.get("category"):
+            # 카테고리명 (영문은 대소문자 무시, 한국어 이름도 허용)
+            category = filters["category"].strip()
+            q = q.join(Category, Product.category_id == Category.id).filter(
+                or_(func.lower(Category.name) == category.lower(), Category.name_ko == category)
+            )
+
+        if filters.get("country"):
+            # 국가 1개 또는 목록 (목록이면 하나라도 일치)
+            countries = filters["country"]
+            if isinstance(countries, str):
+                countries = [countries]
+            q = q.join(Supplier).filter(Supplier.country.in_(countries))
+
+        if filters.get("certifications"):
+            # 인증 역색인 (product_certifications) - 상위 인증 롤업, AND/OR
+            q = self.certification_index.filter_products(
+                q,
+                filters["certifications"],
+                mode=filters.get("certification_mode", "all")
+            )
+
+        if filters.get("price_max"):
+            q = q.filter(Product.unit_price_max <= filters["price_max"])
 
-        return q.limit(100).all()
+        if filters.get("moq_max"):
+            q = q.filter(Product.moq <= filters["moq_max"])
+
+        return q
+
+    async def find_similar_products(self, product_id: int, k: int = 10) -> List[Tuple[Product, float]]:
+        """
+        유사 상품 검색 (ANN 인덱스)
+
+        Returns:
+            [(상품, 코사인 유사도), ...] 유사도 순
+        """
+        product = self.db_session.get(Product, product_id)
+        if product is None or product.embedding is None:
+            return []
+
+        self.vector_index.reload_if_changed()
+        matches = self.vector_index.search(product.embedding, k=k, exclude=[product_id])
+        return self._load_ranked_products(matches)
+
+    async def semantic_search(
+        self,
+        query: str,
+        filters: Dict[str, Any] = None,
+        k: int = 20
+    ) -> List[Tuple[Product, float]]:
+        """
+        의미 기반 상품 검색 (쿼리 임베딩 → ANN 인덱스)
+
+        필터가 있으면 후보를 넉넉히 가져온 뒤 DB에서 필터링합니다.
+        """
+        if self.embedding_client is None:
+            raise RuntimeError("임베딩 클라이언트가 설정되지 않아 의미 검색을 사용할 수 없습니다")
+
+        vectors = await self.embedding_client.embed([query])
+        self.vector_index.reload_if_changed()
+        candidates = self.vector_index.search(vectors[0], k=k * 4 if filters else k)
+        if not candidates:
+            return []
+
+        scores = dict(candidates)
+        q = self._apply_product_filters(
+            self.db_session.query(Product.id).filter(Product.id.in_(scores.keys())),
+            filters
+        )
+        allowed = {row.id for row in q.all()}
+        return self._load_ranked_products([(pid, s) for pid, s in candidates if pid in allowed][:k])
+
+    def _load_ranked_products(self, ranked: List[Tuple[int, float]]) -> List[Tuple[Product, float]]:
+        """(product_id, score) 순서를 유지하며 Product 로드"""
+        if not ranked:
+            return []
+        ids = [pid for pid, _ in ranked]
+        products = {p.id: p for p in self.db_session.query(Product).filter(Product.id.in_(ids)).all()}
+        return [(products[pid], score) for pid, score in ranked if pid in products]
+
+    # ==================== 작업 큐 기반 파이프라인 ====================
+
+    def enqueue_discovery(self, query: str, auto_crawl: bool = True, auto_parse: bool = True, priority: int = 0) -> int:
+        """
+        탐색 파이프라인을 작업 큐에 등록
+
+        discover_suppliers → fetch_catalog (공급사별) → parse_catalog (카탈로그별)
+        단계가 각각 별도 작업으로 분리되어 여러 워커가 병렬로 처리합니다.
+        """
+        return self.job_queue.enqueue(
+            "discover_suppliers",
+            payload={"auto_crawl": auto_crawl, "auto_parse": auto_parse},
+            search_query=query,
+            priority=priority
+        )
+
+    def job_handlers(self) -> Dict[str, JobHandler]:
+        """작업 유형별 핸들러 (작업마다 전용 DB 세션)"""
+        handlers = {
+            "discover_suppliers": self._handle_discovery_job,
+            "fetch_catalog": self._handle_fetch_catalog_job,
+            "parse_catalog": self._handle_parse_catalog_job,
+            "embed_products": self._handle_embedding_job,
+            "enrich_contacts": self._handle_contact_enrichment_job,
+        }
+        return {job_type: self._with_job_session(handler) for job_type, handler in handlers.items()}
+
+    async def _handle_discovery_job(self, ctx: JobContext) -> JobOutcome:
+        """공급사 탐색 작업: 탐색 → 저장 → 카탈로그 수집 작업 등록"""
+        query = ctx.job.search_query
+
+        # 1. 탐색 + 저장 (체크포인트가 있으면 재탐색하지 않음)
+        saved = ctx.get_checkpoint(PipelineStage.DISCOVERING.value)
+        if saved is None:
+            criteria = await self.discovery_agent.interpret_search_query(query)
+            suppliers = await self.discovery_agent.discover_suppliers(criteria)
+            saved_suppliers = await self._save_suppliers(suppliers, query)
+            saved = {
+                "found": len(suppliers),
+                "supplier_ids": [s.id for s in saved_suppliers],
+            }
+            ctx.checkpoint(PipelineStage.DISCOVERING.value, saved)
+
+        # 2. 후속 작업 등록 (재시작 시 중복 등록 방지)
+        if ctx.payload.get("auto_crawl", True) and not ctx.get_checkpoint(PipelineStage.CRAWLING.value):
+            suppliers = self.db_session.query(Supplier).filter(
+                Supplier.id.in_(saved["supplier_ids"][:10]),  # 상위 10개만
+                Supplier.website.isnot(None)
+            ).all()
+            for supplier in suppliers:
+                ctx.enqueue(
+                    "fetch_catalog",
+                    supplier_id=supplier.id,
+                    target_url=supplier.website,
+                    payload={"auto_parse": ctx.payload.get("auto_parse", True)}
+                )
+            ctx.checkpoint(PipelineStage.CRAWLING.value, {"enqueued": len(suppliers)})
+
+        return JobOutcome(items_found=saved["found"], items_saved=len(saved["supplier_ids"]))
+
+    async def _handle_fetch_catalog_job(self, ctx: JobContext) -> JobOutcome:
+        """카탈로그 수집 작업: 공급사 1곳 크롤링 → 파싱 작업 등록"""
+        supplier = self.db_session.get(Supplier, ctx.job.supplier_id)
+        if supplier is None:
+            return JobOutcome()
+
+        catalogs = ctx.get_checkpoint(PipelineStage.CRAWLING.value)
+        if catalogs is None:
+            catalogs = await self._crawl_catalogs([supplier], recrawl=ctx.payload.get("refresh", False))
+            ctx.checkpoint(PipelineStage.CRAWLING.value, {"catalogs": catalogs})
+        else:
+            catalogs = catalogs["catalogs"]
+
+        if ctx.payload.get("auto_parse", True) and not ctx.get_checkpoint(PipelineStage.PARSING.value):
+            for catalog in catalogs:
+                if catalog.get("file_path"):
+                    ctx.enqueue(
+                        "parse_catalog",
+                        supplier_id=supplier.id,
+                        payload={"file_path": catalog["file_path"], "refresh": ctx.payload.get("refresh", False)}
+                    )
+            ctx.checkpoint(PipelineStage.PARSING.value, {"enqueued": len(catalogs)})
+
+        return JobOutcome(items_found=len(catalogs))
+
+    async def _handle_parse_catalog_job(self, ctx: JobContext) -> JobOutcome:
+        """카탈로그 파싱 작업: 파일 1개 파싱 → 상품 저장"""
+        supplier = self.db_session.get(Supplier, ctx.job.supplier_id)
+        if supplier is None:
+            return JobOutcome()
+
+        products = await self.catalog_parser.parse(ctx.payload["file_path"])
+        with track_stage("store_products") as t:
+            if ctx.payload.get("refresh"):
+                saved = await self._refresh_products(products, supplier)
+            else:
+                saved = await self._save_products(products, [supplier])
+            t.add_items(len(saved))
+        return JobOutcome(items_found=len(products), items_saved=len(saved))
+
+    def enqueue_embedding_backfill(self, start_after_id: int = 0) -> int:
+        """기존 상품 임베딩 백필 작업 등록 (재시작 시 체크포인트부터 재개)"""
+        return self.job_queue.enqueue("embed_products", payload={"backfill": True, "start_after_id": start_after_id})
+
+    async def _handle_embedding_job(self, ctx: JobContext) -> JobOutcome:
+        """임베딩 작업: 신규 상품 목록 또는 전체 백필"""
+        if self.embedding_pipeline is None:
+            logger.warning("임베딩 클라이언트 미설정: 임베딩 작업 건너뜀")
+            return JobOutcome()
+
+        if ctx.payload.get("backfill"):
+            resume = ctx.get_checkpoint("embedding") or {}
+            progress = await self.embedding_pipeline.backfill(
+                start_after_id=resume.get("last_product_id", ctx.payload.get("start_after_id", 0)),
+                progress_callback=lambda p: ctx.checkpoint("embedding", {
+                    "last_product_id": p.last_product_id,
+                    "processed": p.processed,
+                    "total": p.total,
+                })
+            )
+        else:
+            progress = await self.embedding_pipeline.embed_products(ctx.payload.get("product_ids", []))
+
+        return JobOutcome(
+            items_found=progress.processed,
+            items_saved=progress.processed,
+            details={"cache_hits": progress.cache_hits, "embedded": progress.embedded}
+        )
+
+    async def run_contact_enrichment(
+        self,
+        only_missing: bool = True,
+        progress_callback: Optional[Callable[[EnrichmentProgress], None]] = None
+    ) -> EnrichmentProgress:
+        """공급사 웹사이트 일괄 스캔 → Supplier.email / ContactAttempt 저장"""
+        crawler_defaults = CrawlerConfig()
+        enricher = ContactEnricher(self.db_session, self.email_extractor)
+        return await enricher.enrich(
+            only_missing=only_missing,
+            progress_callback=progress_callback,
+            concurrency=self.config.get("email_concurrency", crawler_defaults.email_concurrency),
+            per_domain=crawler_defaults.email_per_domain,
+            deadline_seconds=crawler_defaults.email_site_deadline_seconds,
+            retries=crawler_defaults.email_retries
+        )
+
+    def enqueue_contact_enrichment(self, only_missing: bool = True) -> int:
+        """연락처 일괄 보강 작업 등록"""
+        return self.job_queue.enqueue("enrich_contacts", payload={"only_missing": only_missing})
+
+    async def _handle_contact_enrichment_job(self, ctx: JobContext) -> JobOutcome:
+        """연락처 보강 작업: 이메일 없는 공급사 웹사이트 스캔 (최근 스캔한 곳은 건너뛰므로 재시작 시 남은 곳부터)"""
+        progress = await self.run_contact_enrichment(
+            only_missing=ctx.payload.get("only_missing", True),
+            progress_callback=lambda p: ctx.checkpoint("enrich_contacts", {
+                "suppliers": p.suppliers,
+                "found": p.found,
+                "total": p.total,
+            })
+        )
+        return JobOutcome(
+            items_found=progress.suppliers,
+            items_saved=progress.found,
+            details={"sites": progress.sites, "failed": progress.failed, "retried": progress.retried}
+        )
 
     def get_pipeline_status(self) -> Dict[str, Any]:
         """현재 파이프라인 상태 반환"""
+        last = self.last_result
         return {
             "stage": self.current_stage.value,
             "job_id": self.current_job_id,
+            "running": list(self.running_pipelines.values()),
+            "last_run": {
+                "stage": last.stage.value,
+                "execution_time_seconds": last.execution_time_seconds,
+                "stage_timings": last.stage_timings,
+                "suppliers_discovered": last.suppliers_discovered,
+                "products_extracted": last.products_extracted,
+                "errors": last.errors,
+            } if last else None,
+            "queue": self.job_queue.count_by_status(),
             "timestamp": datetime.utcnow().isoformat()
         }
 
@@ -339,8 +998,13 @@ class CrawlScheduler:
     - 카탈로그 갱신 체크 (월 1회)
     """
 
-    def __init__(self, orchestrator: SupplierDiscoveryOrchestrator):
+    def __init__(
+        self,
+        orchestrator: SupplierDiscoveryOrchestrator,
+        max_concurrent_pipelines: int = SchedulerConfig.max_concurrent_pipelines
+    ):
         self.orchestrator = orchestrator
+        self.max_concurrent_pipelines = max_concurrent_pipelines
         self.scheduled_queries = [
             "organic olive oil manufacturer Europe",
             "premium matcha powder Japan wholesale",
@@ -349,26 +1013,131 @@ class CrawlScheduler:
             "organic snacks supplier USA",
         ]
 
-    async def run_daily_discovery(self):
-        """일일 공급사 탐색"""
-        for query in self.scheduled_queries:
-            try:
-                result = await self.orchestrator.run_discovery_pipeline(
-                    query,
-                    auto_crawl=True,
-                    auto_parse=True
+    async def run_daily_discovery(self) -> List[PipelineResult]:
+        """
+        일일 공급사 탐색
+
+        쿼리들을 동시에 실행하고, 소스별 요청 간격은 오케스트레이터의
+        공유 토큰 버킷이 지킵니다 (고정 sleep 없음).
+        파이프라인들은 오케스트레이터 세션을 공유하지만 DB 구간(_db_transaction)은 await 없이
+        커밋 / 롤백까지 끝나므로 서로 끼어들지 않고, 한 쿼리의 DB 오류는 그 쿼리만 실패시킵니다.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_pipelines)
+
+        async def run_query(query: str) -> Optional[PipelineResult]:
+            async with semaphore:
+                try:
+                    result = await self.orchestrator.run_discovery_pipeline(
+                        query,
+                        auto_crawl=True,
+                        auto_parse=True
+                    )
+                    logger.info(f"일일 탐색 완료 ({query}): {result.suppliers_discovered}개 발견")
+                    return result
+                except Exception as e:
+                    logger.error(f"일일 탐색 실패 ({query}): {e}")
+                    return None
+
+        start_time = datetime.now()
+        results = await asyncio.gather(*(run_query(q) for q in self.scheduled_queries))
+        logger.info(
+            f"일일 탐색 배치 완료: {len(self.scheduled_queries)}개 쿼리, "
+            f"{(datetime.now() - start_time).total_seconds():.1f}초"
+        )
+        return [r for r in results if r is not None]
+
+    async def run_price_update(self, crawler_config: CrawlerConfig = None) -> Dict[str, int]:
+        """
+        가격 정보 업데이트 (증분)
+
+        공급사 웹사이트와 카탈로그 원본 URL 을 조건부 GET 으로 확인하고,
+        내용이 바뀐 것만 작업 큐에 재수집/재파싱 작업으로 등록합니다.
+        """
+        crawler_config = crawler_config or CrawlerConfig()
+        db = self.orchestrator.db_session
+        engine = RefreshEngine(
+            db,
+            timeout_seconds=crawler_config.timeout_seconds,
+            politeness=self.orchestrator.politeness
+        )
+        counts = {"checked": 0, "changed": 0, "not_modified": 0, "unchanged": 0, "error": 0, "bytes": 0}
+
+        def record(result) -> bool:
+            counts["checked"] += 1
+            counts["bytes"] += result.bytes_downloaded
+            counts["changed" if result.changed else result.status] += 1
+            return result.changed
+
+        async def check_website(url: str, suppliers: List[Supplier]):
+            result = await engine.check(url, kind="website", supplier_id=suppliers[0].id)
+            if record(result):
+                for supplier in suppliers:
+                    self.orchestrator.job_queue.enqueue(
+                        "fetch_catalog",
+                        supplier_id=supplier.id,
+                        target_url=supplier.website,
+                        payload={"auto_parse": True, "refresh": True}
+                    )
+
+        async def check_catalog(url: str, catalogs: List[Catalog]):
+            result = await engine.check(
+                url, kind="catalog", supplier_id=catalogs[0].supplier_id, catalog_id=catalogs[0].id
+            )
+            if not record(result):
+                return
+            paths = []
+            with self.orchestrator._db_transaction():
+                for catalog in catalogs:
+                    path = Path(catalog.file_path or Path(crawler_config.catalog_path) / f"catalog_{catalog.id}_{catalog.file_name or 'refresh'}")
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_bytes(result.content)
+                    catalog.file_path = str(path)
+                    catalog.file_size = len(result.content)
+                    catalog.is_parsed = False
+                    paths.append((catalog.supplier_id, path))
+            for supplier_id, path in paths:
+                self.orchestrator.job_queue.enqueue(
+                    "parse_catalog",
+                    supplier_id=supplier_id,
+                    payload={"file_path": str(path), "refresh": True}
                 )
-                logger.info(f"일일 탐색 완료 ({query}): {result.suppliers_discovered}개 발견")
+
+        async def guarded(check, url: str, targets: list):
+            # 한 URL 의 오류(DB 포함)가 다른 체크를 중단시키지 않도록
+            try:
+                await check(url, targets)
             except Exception as e:
-                logger.error(f"일일 탐색 실패 ({query}): {e}")
+                counts["checked"] += 1
+                counts["error"] += 1
+                logger.warning(f"가격 업데이트 확인 실패 ({url}): {e}")
+
+        # URL 기준 중복 제거 (CrawlFingerprint.url 은 유일, 같은 사이트 / 파일은 한 번만 요청)
+        websites: Dict[str, List[Supplier]] = {}
+        for supplier in db.query(Supplier).filter(
+            Supplier.website.isnot(None),
+            Supplier.status != SupplierStatus.INACTIVE
+        ).all():
+            websites.setdefault(supplier.website, []).append(supplier)
+        catalog_urls: Dict[str, List[Catalog]] = {}
+        for catalog in db.query(Catalog).filter(Catalog.source_url.isnot(None)).all():
+            catalog_urls.setdefault(catalog.source_url, []).append(catalog)
 
-            # 요청 간 딜레이
-            await asyncio.sleep(60)
+        start_time = datetime.now()
+        try:
+            # 세션은 공유하지만 각 체크의 DB 구간은 await 없이 커밋 / 롤백까지 끝나므로 서로 끼어들지 않음
+            await asyncio.gather(
+                *(guarded(check_website, url, group) for url, group in websites.items()),
+                *(guarded(check_catalog, url, group) for url, group in catalog_urls.items())
+            )
+        finally:
+            await engine.aclose()
 
-    async def run_price_update(self):
-        """가격 정보 업데이트"""
-        # TODO: 기존 공급사 웹사이트 재크롤링
-        pass
+        logger.info(
+            f"가격 업데이트 확인 완료: {counts['checked']}개 URL, 변경 {counts['changed']}, "
+            f"304 {counts['not_modified']}, 동일 {counts['unchanged']}, 오류 {counts['error']} "
+            f"({counts['bytes'] / 1024:.0f}KB, {(datetime.now() - start_time).total_seconds():.1f}초)"
+        )
+        return counts
 
 
 # 실행 예시
@@ -399,5 +1168,20 @@ async def main():
         print(f"오류: {result.errors}")
 
 
+async def run_worker(config: Dict[str, Any] = None):
+    """
+    작업 큐 워커 실행
+
+    같은 DB를 바라보는 프로세스를 여러 개(단일/다중 노드) 띄우면
+    discovery / crawl / parse 작업을 병렬로 처리하고, 재시작 시 이어서 처리합니다.
+    """
+    orchestrator = SupplierDiscoveryOrchestrator(config)
+    worker = JobWorker(orchestrator.job_queue, orchestrator.job_handlers())
+    try:
+        await worker.run()
+    finally:
+        mark_process_dead()
+
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,540 @@
+"""
+WeDealize Query Interpreter
+규칙 기반 검색어 해석 (LLM 호출 전 단계)
+
+- 상품 / 국가·지역 / 인증 / 검색 의도어 한·영 사전을 Aho-Corasick 오토마톤 하나로 컴파일
+- 검색어를 한 번만 훑어 모든 사전 항목을 동시에 찾음 (사전 크기와 무관하게 검색어 길이에 비례)
+- MOQ / 가격 표현은 미리 컴파일한 정규식으로 추출
+- 검색어 중 해석된 비율로 신뢰도 계산 → 낮을 때만 LLM 사용 (SupplierDiscoveryAgent)
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# ==================== 사전 ====================
+
+# 표준 키워드 → (카테고리, 표기들)
+PRODUCTS: Dict[str, Tuple[str, List[str]]] = {
+    # oils
+    "olive oil": ("oils", ["올리브오일", "올리브 오일", "올리브유", "olive oil", "extra virgin olive oil", "evoo"]),
+    "avocado oil": ("oils", ["아보카도오일", "아보카도 오일", "avocado oil"]),
+    "sesame oil": ("oils", ["참기름", "sesame oil"]),
+    "perilla oil": ("oils", ["들기름", "perilla oil"]),
+    "coconut oil": ("oils", ["코코넛오일", "코코넛 오일", "coconut oil"]),
+    "sunflower oil": ("oils", ["해바라기유", "해바라기씨유", "sunflower oil"]),
+    "grapeseed oil": ("oils", ["포도씨유", "grapeseed oil", "grape seed oil"]),
+    "canola oil": ("oils", ["카놀라유", "canola oil", "rapeseed oil"]),
+    "truffle oil": ("oils", ["트러플오일", "트러플 오일", "truffle oil"]),
+    # beverages / tea / coffee
+    "matcha": ("tea", ["말차", "맛차", "matcha", "matcha powder"]),
+    "green tea": ("tea", ["녹차", "green tea"]),
+    "black tea": ("tea", ["홍차", "black tea"]),
+    "herbal tea": ("tea", ["허브차", "허브티", "herbal tea"]),
+    "rooibos": ("tea", ["루이보스", "rooibos"]),
+    "coffee beans": ("coffee", ["원두", "커피원두", "커피 원두", "coffee beans", "green coffee"]),
+    "coffee": ("coffee", ["커피", "coffee"]),
+    "juice": ("beverages", ["주스", "쥬스", "juice", "nfc juice"]),
+    "coconut water": ("beverages", ["코코넛워터", "코코넛 워터", "coconut water"]),
+    "kombucha": ("beverages", ["콤부차", "kombucha"]),
+    "mineral water": ("beverages", ["생수", "미네랄워터", "mineral water", "spring water"]),
+    "wine": ("beverages", ["와인", "wine"]),
+    "beer": ("beverages", ["맥주", "beer", "craft beer"]),
+    "sake": ("beverages", ["사케", "sake"]),
+    "beverages": ("beverages", ["음료", "beverage", "beverages", "drinks"]),
+    "energy drink": ("beverages", ["에너지음료", "에너지 음료", "energy drink"]),
+    "plant-based milk": ("beverages", ["식물성우유", "오트밀크", "아몬드우유", "oat milk", "almond milk", "plant-based milk", "soy milk", "두유"]),
+    # sweeteners
+    "honey": ("sweeteners", ["꿀", "벌꿀", "honey"]),
+    "manuka honey": ("sweeteners", ["마누카꿀", "마누카 꿀", "마누카", "manuka honey", "manuka"]),
+    "maple syrup": ("sweeteners", ["메이플시럽", "메이플 시럽", "maple syrup"]),
+    "agave syrup": ("sweeteners", ["아가베시럽", "아가베 시럽", "agave syrup", "agave"]),
+    "sugar": ("sweeteners", ["설탕", "sugar", "cane sugar"]),
+    "stevia": ("sweeteners", ["스테비아", "stevia"]),
+    # dairy
+    "cheese": ("dairy", ["치즈", "cheese"]),
+    "parmesan": ("dairy", ["파마산", "파르미지아노", "parmesan", "parmigiano reggiano"]),
+    "mozzarella": ("dairy", ["모짜렐라", "모차렐라", "mozzarella"]),
+    "butter": ("dairy", ["버터", "butter"]),
+    "yogurt": ("dairy", ["요거트", "요구르트", "yogurt", "yoghurt"]),
+    "milk powder": ("dairy", ["분유", "우유분말", "milk powder"]),
+    "cream": ("dairy", ["생크림", "cream"]),
+    # sauces / condiments
+    "sauce": ("sauces", ["소스", "sauce", "sauces"]),
+    "soy sauce": ("sauces", ["간장", "soy sauce"]),
+    "gochujang": ("sauces", ["고추장", "gochujang"]),
+    "doenjang": ("sauces", ["된장", "doenjang", "soybean paste"]),
+    "balsamic vinegar": ("sauces", ["발사믹", "발사믹식초", "balsamic", "balsamic vinegar"]),
+    "vinegar": ("sauces", ["식초", "vinegar"]),
+    "pasta sauce": ("sauces", ["파스타소스", "파스타 소스", "pasta sauce", "tomato sauce"]),
+    "hot sauce": ("sauces", ["핫소스", "hot sauce", "chili sauce", "sriracha"]),
+    "mayonnaise": ("sauces", ["마요네즈", "mayonnaise"]),
+    "ketchup": ("sauces", ["케첩", "케찹", "ketchup"]),
+    "mustard": ("sauces", ["머스타드", "겨자", "mustard"]),
+    "fish sauce": ("sauces", ["피쉬소스", "액젓", "fish sauce"]),
+    # snacks / confectionery / bakery
+    "snacks": ("snacks", ["스낵", "과자", "snack", "snacks"]),
+    "chips": ("snacks", ["칩", "감자칩", "chips", "crisps"]),
+    "nuts": ("snacks", ["견과", "견과류", "nuts", "mixed nuts"]),
+    "almonds": ("snacks", ["아몬드", "almond", "almonds"]),
+    "dried fruit": ("snacks", ["건과일", "말린과일", "dried fruit", "dried fruits"]),
+    "granola": ("snacks", ["그래놀라", "granola"]),
+    "protein bar": ("snacks", ["프로틴바", "단백질바", "protein bar", "energy bar"]),
+    "chocolate": ("confectionery", ["초콜릿", "초콜렛", "chocolate", "cocoa"]),
+    "candy": ("confectionery", ["사탕", "캔디", "candy", "gummies", "젤리"]),
+    "cookies": ("bakery", ["쿠키", "비스킷", "cookies", "biscuits"]),
+    "bread": ("bakery", ["빵", "bread"]),
+    # grains / noodles
+    "rice": ("grains", ["쌀", "rice"]),
+    "quinoa": ("grains", ["퀴노아", "quinoa"]),
+    "oats": ("grains", ["귀리", "오트밀", "oats", "oatmeal"]),
+    "flour": ("grains", ["밀가루", "flour"]),
+    "pasta": ("noodles", ["파스타", "pasta", "spaghetti"]),
+    "noodles": ("noodles", ["면", "국수", "라면", "noodles", "ramen", "instant noodles"]),
+    # seafood / meat
+    "seafood": ("seafood", ["수산물", "해산물", "seafood"]),
+    "salmon": ("seafood", ["연어", "salmon"]),
+    "tuna": ("seafood", ["참치", "tuna"]),
+    "shrimp": ("seafood", ["새우", "shrimp", "prawn"]),
+    "seaweed": ("seafood", ["김", "미역", "다시마", "해조류", "seaweed", "laver", "nori", "kelp"]),
+    "beef": ("meat", ["소고기", "쇠고기", "beef", "wagyu", "와규"]),
+    "pork": ("meat", ["돼지고기", "pork"]),
+    "chicken": ("meat", ["닭고기", "chicken", "poultry"]),
+    "ham": ("meat", ["햄", "프로슈토", "ham", "prosciutto", "jamon"]),
+    # produce / spices
+    "fruits": ("produce", ["과일", "fruit", "fruits"]),
+    "vegetables": ("produce", ["채소", "야채", "vegetable", "vegetables"]),
+    "avocado": ("produce", ["아보카도", "avocado"]),
+    "mango": ("produce", ["망고", "mango"]),
+    "kimchi": ("produce", ["김치", "kimchi"]),
+    "mushrooms": ("produce", ["버섯", "mushroom", "mushrooms", "truffle", "트러플"]),
+    "spices": ("spices", ["향신료", "스파이스", "spice", "spices", "seasoning", "시즈닝"]),
+    "pepper": ("spices", ["후추", "black pepper"]),
+    "salt": ("spices", ["소금", "천일염", "salt", "sea salt"]),
+    "saffron": ("spices", ["사프란", "saffron"]),
+    "vanilla": ("spices", ["바닐라", "vanilla"]),
+    "ginseng": ("supplements", ["인삼", "홍삼", "ginseng", "red ginseng"]),
+    "supplements": ("supplements", ["건강기능식품", "영양제", "supplement", "supplements"]),
+    "superfood": ("supplements", ["슈퍼푸드", "superfood", "chia seeds", "치아씨드"]),
+    # frozen
+    "frozen food": ("frozen", ["냉동식품", "냉동", "frozen", "frozen food"]),
+    "ice cream": ("frozen", ["아이스크림", "ice cream", "gelato", "젤라또"]),
+    "dumplings": ("frozen", ["만두", "dumplings"]),
+}
+
+# 표준 국가/지역명 → 표기들 ("이탈리아산" 처럼 한글 접미사는 부분 일치로 처리)
+COUNTRIES: Dict[str, List[str]] = {
+    "Italy": ["이탈리아", "이태리", "italy", "italian"],
+    "France": ["프랑스", "france", "french"],
+    "Spain": ["스페인", "spain", "spanish"],
+    "Greece": ["그리스", "greece", "greek"],
+    "Portugal": ["포르투갈", "portugal", "portuguese"],
+    "Germany": ["독일", "germany", "german"],
+    "Netherlands": ["네덜란드", "netherlands", "dutch", "holland"],
+    "Belgium": ["벨기에", "belgium", "belgian"],
+    "Switzerland": ["스위스", "switzerland", "swiss"],
+    "Austria": ["오스트리아", "austria", "austrian"],
+    "United Kingdom": ["영국", "uk", "united kingdom", "british", "england"],
+    "Ireland": ["아일랜드", "ireland", "irish"],
+    "Denmark": ["덴마크", "denmark", "danish"],
+    "Norway": ["노르웨이", "norway", "norwegian"],
+    "Sweden": ["스웨덴", "sweden", "swedish"],
+    "Finland": ["핀란드", "finland", "finnish"],
+    "Poland": ["폴란드", "poland", "polish"],
+    "Turkey": ["터키", "튀르키예", "turkey", "turkish"],
+    "USA": ["미국", "usa", "u.s.a.", "u.s.", "united states", "american"],  # 대문자 "US" 는 원문에서 따로 확인
+    "Canada": ["캐나다", "canada", "canadian"],
+    "Mexico": ["멕시코", "mexico", "mexican"],
+    "Brazil": ["브라질", "brazil", "brazilian"],
+    "Argentina": ["아르헨티나", "argentina", "argentinian"],
+    "Chile": ["칠레", "chile", "chilean"],
+    "Peru": ["페루", "peru", "peruvian"],
+    "Colombia": ["콜롬비아", "colombia", "colombian"],
+    "Japan": ["일본", "japan", "japanese"],
+    "China": ["중국", "china", "chinese"],
+    "South Korea": ["한국", "국산", "국내", "korea", "south korea", "korean"],
+    "Taiwan": ["대만", "taiwan", "taiwanese"],
+    "Vietnam": ["베트남", "vietnam", "vietnamese"],
+    "Thailand": ["태국", "thailand", "thai"],
+    "Indonesia": ["인도네시아", "indonesia", "indonesian"],
+    "Malaysia": ["말레이시아", "malaysia", "malaysian"],
+    "Philippines": ["필리핀", "philippines", "filipino"],
+    "Singapore": ["싱가포르", "singapore"],
+    "India": ["인도", "india", "indian"],
+    "Sri Lanka": ["스리랑카", "sri lanka", "ceylon"],
+    "Australia": ["호주", "오스트레일리아", "australia", "australian"],
+    "New Zealand": ["뉴질랜드", "new zealand", "nz"],
+    "South Africa": ["남아공", "남아프리카", "south africa"],
+    "Morocco": ["모로코", "morocco", "moroccan"],
+    "Egypt": ["이집트", "egypt", "egyptian"],
+    "Tunisia": ["튀니지", "tunisia"],
+    "Kenya": ["케냐", "kenya"],
+    "Ethiopia": ["에티오피아", "ethiopia", "ethiopian"],
+    "Israel": ["이스라엘", "israel"],
+    "UAE": ["아랍에미리트", "두바이", "uae", "dubai"],
+    "Europe": ["유럽", "europe", "european", "eu"],
+    "Southeast Asia": ["동남아", "동남아시아", "southeast asia"],
+    "South America": ["남미", "south america", "latin america"],
+    "Middle East": ["중동", "middle east"],
+}
+
+# 인증 표기 → 표준 인증명 (services.certifications 의 표준명과 동일)
+CERTIFICATIONS: Dict[str, List[str]] = {
+    "Organic": ["유기농", "오가닉", "organic", "bio"],
+    "USDA Organic": ["usda organic", "usda 유기농"],
+    "EU Organic": ["eu organic", "eu 유기농"],
+    "JAS Organic": ["jas organic", "jas"],
+    "HACCP": ["haccp", "해썹", "해섭"],
+    "ISO 22000": ["iso22000", "iso 22000"],
+    "FSSC 22000": ["fssc22000", "fssc 22000"],
+    "BRCGS": ["brc", "brcgs"],
+    "IFS Food": ["ifs", "ifs food"],
+    "GMP": ["gmp"],
+    "FDA Registered": ["fda", "fda registered", "fda 등록"],
+    "Halal": ["할랄", "halal"],
+    "Kosher": ["코셔", "kosher"],
+    "Non-GMO": ["non-gmo", "non gmo", "nongmo", "gmo free", "gmo-free", "유전자변형없는", "non-gmo 인증"],
+    "Vegan": ["비건", "vegan", "채식"],
+    "Gluten-Free": ["글루텐프리", "글루텐 프리", "gluten-free", "gluten free"],
+    "Fair Trade": ["공정무역", "fair trade", "fairtrade"],
+    "Rainforest Alliance": ["rainforest alliance"],
+    "DOP": ["dop"],
+    "PDO": ["pdo", "원산지명칭보호"],
+    "AOC": ["aoc"],
+    "UMF Certified": ["umf"],
+}
+
+# 검색 의도어 (해석된 것으로 간주, 조건에는 반영하지 않음)
+INTENT_WORDS = [
+    "공급업체", "공급사", "공급처", "제조사", "제조업체", "생산자", "수출업체", "수입", "도매", "벌크", "대량",
+    "업체", "수출", "찾아줘", "찾아주세요", "추천", "구매", "인증된", "인증", "원산지", "제품", "상품",
+    "supplier", "suppliers", "manufacturer", "manufacturers", "producer", "producers", "exporter", "exporters", "export",
+    "wholesale", "wholesaler", "bulk", "b2b", "factory", "vendor", "vendors", "distributor", "oem",
+    "private label", "certified", "from", "with", "in", "the", "a", "and", "for", "of", "made", "premium",
+    # 문의 / 요청 표현 (키워드로 보내면 검색 인덱스의 필수 단어가 되어 결과가 비어 버림)
+    "contact", "contact us", "us", "we", "our", "me", "i", "please", "find", "looking", "need", "want",
+    "buy", "sell", "selling", "supply", "quote", "quotation", "company", "companies", "to", "or",
+]
+
+
+# ==================== Aho-Corasick ====================
+
+class AhoCorasick:
+    """
+    다중 패턴 문자열 매칭 오토마톤
+
+    add(pattern, value) 로 패턴 등록 후 build(), find(text) 는 (start, end, value) 목록 반환.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]  # (패턴 길이, 값)
+        self._built = False
+
+    def add(self, pattern: str, value: Any):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), value))
+        self._built = False
+
+    def build(self):
+        """실패 링크 계산 (BFS), 출력은 실패 링크를 따라 병합"""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[child] = self._goto[f].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+        self._built = True
+
+    def find(self, text: str) -> List[Tuple[int, int, Any]]:
+        if not self._built:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, value in out[node]:
+                matches.append((i - length + 1, i + 1, value))
+        return matches
+
+
+# ==================== MOQ / 가격 ====================
+
+def _number(name: str) -> str:
+    """숫자 + 선택적 배수 단위 ("1,000", "2.5", "5k", "3천", "1만") 패턴 (named group)"""
+    return rf"(?P<{name}>\d{{1,3}}(?:,\d{{3}})+|\d+(?:\.\d+)?)\s*(?P<{name}_mult>k|천|만)?"
+
+
+_MULTIPLIERS = {"k": 1000, "천": 1000, "만": 10000}
+
+_MOQ_PATTERN = re.compile(
+    r"(?:moq|minimum order(?: quantity)?|min\.? order|최소\s*주문(?:량|수량)?|최소\s*발주(?:량)?)\s*"
+    r"(?:[:=]|is|of)?\s*"
+    r"(?P<pre>under|below|less than|up to|max(?:imum)?|over|above|at least|min(?:imum)?|이하|이상|미만|초과)?\s*"
+    + _number("num") +
+    r"\s*(?:개|pcs|pieces|units?|kg|톤|tons?|박스|boxes|cases?|병|bottles?|ea)?\s*"
+    r"(?P<post>이하|이상|미만|초과|or less|or more|max|min)?",
+    re.IGNORECASE
+)
+
+_CURRENCY_PREFIX = r"(?:\$|usd\s*)"
+_CURRENCY_SUFFIX = r"(?:달러|불|usd|\$)"
+
+_PRICE_RANGE_PATTERN = re.compile(
+    _CURRENCY_PREFIX + "?" + _number("lo") + r"\s*" + _CURRENCY_SUFFIX + r"?\s*(?:-|~|to|에서|and)\s*"
+    + _CURRENCY_PREFIX + "?" + _number("hi") + r"\s*" + _CURRENCY_SUFFIX + "?",
+    re.IGNORECASE
+)
+_CURRENCY_MARK = re.compile(r"\$|usd|달러|불")
+
+_PRICE_BOUND_PATTERN = re.compile(
+    r"(?P<pre>under|below|less than|up to|max|over|above|at least|from)?\s*"
+    r"(?:" + _CURRENCY_PREFIX + _number("num") + r"|" + _number("num2") + r"\s*" + _CURRENCY_SUFFIX + r")"
+    r"\s*(?:per\s*\w+|/\s*\w+)?\s*(?P<post>이하|이상|미만|초과|or less|or more|and under|and up)?",
+    re.IGNORECASE
+)
+
+_UPPER_WORDS = {"under", "below", "less than", "up to", "max", "maximum", "이하", "미만", "or less", "and under"}
+_LOWER_WORDS = {"over", "above", "at least", "min", "minimum", "이상", "초과", "or more", "and up", "from"}
+
+
+def _to_number(value: str, multiplier: Optional[str]) -> float:
+    number = float(value.replace(",", ""))
+    return number * _MULTIPLIERS.get((multiplier or "").lower(), 1)
+
+
+def _bound_direction(pre: Optional[str], post: Optional[str], default: str) -> str:
+    for word in (post, pre):
+        if word:
+            word = word.lower()
+            if word in _UPPER_WORDS:
+                return "max"
+            if word in _LOWER_WORDS:
+                return "min"
+    return default
+
+
+# ==================== 해석기 ====================
+
+@dataclass
+class QueryInterpretation:
+    """규칙 기반 해석 결과 (LLM 응답과 같은 필드 + 신뢰도)"""
+    keywords: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    countries: List[str] = field(default_factory=list)
+    certifications: List[str] = field(default_factory=list)
+    min_moq: Optional[int] = None
+    max_moq: Optional[int] = None
+    price_range: Optional[Tuple[Optional[float], Optional[float]]] = None
+    confidence: float = 0.0
+    unmatched: List[str] = field(default_factory=list)  # 해석하지 못한 단어
+    terms: List[str] = field(default_factory=list)  # 원문 검색 표현 (상품으로 해석된 표현 "고추장" + 키워드로 보존한 영문 단어)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """LLM 응답(JSON)과 같은 형식"""
+        return {
+            "keywords": self.keywords,
+            "categories": self.categories,
+            "countries": self.countries,
+            "certifications": self.certifications,
+            "min_moq": self.min_moq,
+            "max_moq": self.max_moq,
+            "price_range": list(self.price_range) if self.price_range else None,
+        }
+
+
+_HANGUL = re.compile(r"[가-힣]")
+_TOKEN = re.compile(r"[\w\-]+", re.UNICODE)
+# 한글 조사/접미사 (해석된 단어 바로 뒤에 붙으면 함께 해석된 것으로 간주)
+# 대문자로 쓴 "US" (소문자 "us" 는 대명사라 사전에서 제외, 대소문자는 정규화 전 원문에서 확인)
+_US_ABBREVIATION = re.compile(r"(?<![A-Za-z])US(?![A-Za-z])")
+_KOREAN_SUFFIX = re.compile(r"^(?:산|의|을|를|이|가|은|는|와|과|에서|으로|로|제품|인증|용|급)+")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and (ch.isalnum() or ch in "-_")
+
+
+class QueryInterpreter:
+    """
+    규칙 기반 검색어 해석기
+
+    interpreter = QueryInterpreter()
+    result = interpreter.interpret("유기농 인증된 이탈리아산 올리브오일 공급업체, MOQ 500개 이하")
+    result.confidence  # 1.0 → LLM 생략
+    """
+
+    def __init__(
+        self,
+        products: Dict[str, Tuple[str, List[str]]] = None,
+        countries: Dict[str, List[str]] = None,
+        certifications: Dict[str, List[str]] = None,
+        intent_words: Iterable[str] = None
+    ):
+        self._matcher = AhoCorasick()
+        for keyword, (category, forms) in (products or PRODUCTS).items():
+            for form in forms + [keyword]:
+                self._matcher.add(self._normalize(form), ("product", keyword, category))
+        self._match_us = "USA" in (countries or COUNTRIES)
+        for country, forms in (countries or COUNTRIES).items():
+            for form in forms:
+                self._matcher.add(self._normalize(form), ("country", country, None))
+        for cert, forms in (certifications or CERTIFICATIONS).items():
+            for form in forms:
+                self._matcher.add(self._normalize(form), ("certification", cert, None))
+        for word in (intent_words if intent_words is not None else INTENT_WORDS):
+            self._matcher.add(self._normalize(word), ("intent", None, None))
+        self._matcher.build()
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        text = unicodedata.normalize("NFKC", text).lower()
+        return re.sub(r"\s+", " ", text).strip()
+
+    def _select(self, text: str, matches: List[Tuple[int, int, Any]]) -> List[Tuple[int, int, Any]]:
+        """
+        단어 경계 검사 후 겹치지 않는 가장 긴 매치 선택
+
+        영문 패턴은 단어 경계가 필요하고("us" ≠ "sauce"), 한글 패턴은 조사/접미사가 붙으므로 부분 일치 허용.
+        단, 한 글자 한글 패턴("면", "김", "쌀")은 다른 단어 안에서 흔히 나오므로("가능하면")
+        단어 첫머리에서 시작하고 단어 끝이나 조사/접미사 앞에서 끝날 때만 인정.
+        """
+        valid = []
+        for start, end, value in matches:
+            pattern = text[start:end]
+            if not _HANGUL.search(pattern):
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and _is_word_char(text[end]):
+                    continue
+            elif len(pattern) == 1:
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end < len(text) and text[end].isalnum() and not _KOREAN_SUFFIX.match(text[end:]):
+                    continue
+            valid.append((start, end, value))
+
+        valid.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        selected = []
+        last_end = 0
+        for m in valid:
+            if m[0] >= last_end:
+                selected.append(m)
+                last_end = m[1]
+        return selected
+
+    def interpret(self, query: str) -> QueryInterpretation:
+        text = self._normalize(query)
+        result = QueryInterpretation()
+        covered = [False] * len(text)
+
+        def cover(start: int, end: int):
+            for i in range(start, end):
+                covered[i] = True
+            # 한글 조사/접미사 ("이탈리아산", "올리브오일을")
+            suffix = _KOREAN_SUFFIX.match(text[end:])
+            if suffix:
+                for i in range(end, end + suffix.end()):
+                    covered[i] = True
+
+        # 1. MOQ / 가격 (숫자 표현)
+        for m in _MOQ_PATTERN.finditer(text):
+            value = int(_to_number(m.group("num"), m.group("num_mult")))
+            if _bound_direction(m.group("pre"), m.group("post"), "max") == "min":
+                result.min_moq = value
+            else:
+                result.max_moq = value
+            cover(m.start(), m.end())
+
+        price_min = price_max = None
+        for m in _PRICE_RANGE_PATTERN.finditer(text):
+            if any(covered[m.start():m.end()]) or not _CURRENCY_MARK.search(m.group(0)):
+                continue
+            price_min = _to_number(m.group("lo"), m.group("lo_mult"))
+            price_max = _to_number(m.group("hi"), m.group("hi_mult"))
+            cover(m.start(), m.end())
+        for m in _PRICE_BOUND_PATTERN.finditer(text):
+            num = m.group("num") or m.group("num2")
+            if not num or any(covered[m.start():m.end()]):
+                continue
+            value = _to_number(num, m.group("num_mult") or m.group("num2_mult"))
+            if _bound_direction(m.group("pre"), m.group("post"), "max") == "min":
+                price_min = value
+            else:
+                price_max = value
+            cover(m.start(), m.end())
+        if price_min is not None or price_max is not None:
+            result.price_range = (price_min, price_max)
+
+        # 2. 사전 매칭 (Aho-Corasick 한 번)
+        has_product = False
+        for start, end, (kind, value, category) in self._select(text, self._matcher.find(text)):
+            if any(covered[start:end]):
+                continue
+            cover(start, end)
+            if kind == "product":
+                has_product = True
+                if text[start:end] not in result.terms:
+                    result.terms.append(text[start:end])
+                if value not in result.keywords:
+                    result.keywords.append(value)
+                if category not in result.categories:
+                    result.categories.append(category)
+            elif kind == "country" and value not in result.countries:
+                result.countries.append(value)
+            elif kind == "certification" and value not in result.certifications:
+                result.certifications.append(value)
+
+        # 전부 대문자인 검색어("CONTACT US")는 구분할 수 없으므로 제외
+        if self._match_us and not query.isupper() and _US_ABBREVIATION.search(query):
+            if "USA" not in result.countries:
+                result.countries.append("USA")
+
+        # 3. 해석되지 않은 단어 (영문은 키워드로 보존)
+        for m in _TOKEN.finditer(text):
+            if not all(covered[m.start():m.end()]):
+                word = text[m.start():m.end()]
+                result.unmatched.append(word)
+                if not _HANGUL.search(word) and not any(c.isdigit() for c in word) and len(word) > 2:
+                    result.keywords.append(word)
+                    result.terms.append(word)
+
+        result.confidence = self._confidence(text, covered, has_product)
+        return result
+
+    @staticmethod
+    def _confidence(text: str, covered: List[bool], has_product: bool) -> float:
+        """
+        해석 신뢰도 (0-1)
+
+        의미 있는 글자(공백/구두점 제외) 중 해석된 비율. 상품을 하나도 찾지 못하면
+        무엇을 찾는지 모르는 것이므로 0.5 를 넘지 않습니다.
+        """
+        meaningful = [covered[i] for i, ch in enumerate(text) if ch.isalnum()]
+        if not meaningful:
+            return 0.0
+        coverage = sum(meaningful) / len(meaningful)
+        return round(coverage if has_product else min(coverage, 0.5), 3)
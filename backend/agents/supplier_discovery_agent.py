@@ -3,12 +3,30 @@ WeDealize AI Agent - Supplier Discovery
 전세계 F&B 공급사를 자동으로 탐색하고 정보를 수집하는 AI Agent
 """
 
+import re
 import json
 import asyncio
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import logging
+import time
+from html import unescape
+from urllib.parse import urlencode
+from typing import List, Dict, Any, Optional, AsyncIterator
+from dataclasses import dataclass, asdict
 from enum import Enum
-from abc import ABC, abstractmethod
+from abc import ABC
+
+from ..services.metrics import track_stage
+from ..crawlers.rate_limit import RateLimiterRegistry
+from ..crawlers.browser_pool import BrowserPool
+from ..crawlers.catalog_crawler import CatalogCrawler
+from ..crawlers.politeness import PolitenessPolicy
+from ..services.discovery_cache import DiscoveryCache, criteria_cache_key
+from ..config.settings import ScoringWeights
+from .query_interpreter import QueryInterpreter
+from .supplier_scoring import SupplierScorer, top_suppliers
+from .supplier_verifier import SupplierVerifier
+
+logger = logging.getLogger(__name__)
 
 
 class AgentState(Enum):
@@ -46,6 +64,33 @@ class DiscoveredSupplier:
     raw_data: Dict[str, Any]      # 원본 데이터
 
 
+@dataclass
+class SearchPage:
+    """데이터 소스 검색 결과 1페이지"""
+    suppliers: List[DiscoveredSupplier]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (None = 마지막 페이지)
+    page_number: int = 1
+
+
+@dataclass
+class SearchBudget:
+    """데이터 소스 1곳 검색 한도 (None = 제한 없음)"""
+    max_results: Optional[int] = None
+    max_pages: Optional[int] = None
+
+
+@dataclass
+class DiscoveryBatch:
+    """데이터 소스 1곳의 탐색 결과 1페이지 (점수 부여 완료)"""
+    source: str
+    suppliers: List[DiscoveredSupplier]
+    elapsed_seconds: float        # 소스 검색 시작 후 경과 시간
+    error: Optional[str] = None   # 시간 초과 / 예외 시 메시지
+    cached: bool = False          # 캐시에서 반환 (외부 사이트 요청 없음)
+    page_number: int = 1
+    final: bool = True            # 이 소스의 마지막 배치
+
+
 class SupplierDiscoveryAgent:
     """
     AI 기반 공급사 탐색 에이전트
@@ -57,7 +102,20 @@ class SupplierDiscoveryAgent:
     4. 카탈로그/가격표 수집 지시
     """
 
-    def __init__(self, llm_client=None, db_session=None):
+    def __init__(
+        self,
+        llm_client=None,
+        db_session=None,
+        rate_limiters: Optional[RateLimiterRegistry] = None,
+        llm_fallback_threshold: float = 0.6,
+        default_source_timeout: float = 20.0,
+        source_timeouts: Optional[Dict[str, float]] = None,
+        cache: Optional[DiscoveryCache] = None,
+        scoring_weights: Optional[ScoringWeights] = None,
+        verifier: Optional[SupplierVerifier] = None,
+        search_budget: Optional[SearchBudget] = None,
+        catalog_crawler: Optional[CatalogCrawler] = None
+    ):
         self.llm_client = llm_client  # LLM API 클라이언트 (OpenAI, Claude 등)
         self.db_session = db_session
         self.state = AgentState.IDLE
@@ -66,14 +124,60 @@ class SupplierDiscoveryAgent:
         # 데이터 소스 (크롤러들)
         self.data_sources = []
 
+        # 소스별 요청 속도 제한 (동시 실행되는 모든 탐색이 공유)
+        self.rate_limiters = rate_limiters
+
+        # 소스별 검색 제한 시간 (초, 속도 제한 대기 포함)
+        self.default_source_timeout = default_source_timeout
+        self.source_timeouts = dict(source_timeouts or {})
+
+        # 소스별 검색 한도 (최대 결과 / 페이지 수)
+        self.search_budget = search_budget or SearchBudget()
+
+        # 공급사 웹사이트 카탈로그 크롤러 (크롤 프런티어 기반)
+        self.catalog_crawler = catalog_crawler
+
+        # 소스별 탐색 결과 캐시 (없으면 항상 외부 검색)
+        self.cache = cache
+        self._revalidating: Dict[tuple, asyncio.Task] = {}
+
+        # 후보 점수 계산 (벡터 연산, 가중치 설정 가능)
+        self.scorer = SupplierScorer(scoring_weights)
+
+        # LLM 일괄 검증 (LLM 클라이언트가 있을 때만)
+        self.verifier = verifier or (SupplierVerifier(llm_client) if llm_client else None)
+
+        # 규칙 기반 검색어 해석 (신뢰도가 이 값 미만일 때만 LLM 호출)
+        self.query_interpreter = QueryInterpreter()
+        self.llm_fallback_threshold = llm_fallback_threshold
+
     async def interpret_search_query(self, natural_query: str) -> SearchCriteria:
         """
         자연어 검색 쿼리를 구조화된 검색 조건으로 변환
 
         예시 입력: "유기농 인증된 이탈리아산 올리브오일 공급업체, MOQ 500개 이하"
+
+        규칙 기반 해석기로 먼저 해석하고, 신뢰도가 낮을 때만 LLM 을 호출합니다.
         """
+        interpretation = self.query_interpreter.interpret(natural_query)
+        parsed = interpretation.to_dict()
+
+        if self.llm_client and interpretation.confidence < self.llm_fallback_threshold:
+            logger.info(f"규칙 해석 신뢰도 낮음 ({interpretation.confidence}): LLM 해석 사용")
+            parsed = await self._llm_parse_query(natural_query)
 
-        # LLM을 사용하여 쿼리 해석
+        return SearchCriteria(
+            keywords=parsed.get("keywords", []),
+            categories=parsed.get("categories", []),
+            countries=parsed.get("countries", []),
+            certifications=parsed.get("certifications", []),
+            min_moq=parsed.get("min_moq"),
+            max_moq=parsed.get("max_moq"),
+            price_range=tuple(parsed["price_range"]) if parsed.get("price_range") else None
+        )
+
+    async def _llm_parse_query(self, natural_query: str) -> Dict:
+        """LLM을 사용하여 쿼리 해석"""
         prompt = f"""
         다음 검색 요청을 분석하여 JSON 형식으로 구조화해주세요.
 
@@ -94,144 +198,216 @@ class SupplierDiscoveryAgent:
         인증 예시: Organic, HACCP, ISO22000, Halal, Kosher, Non-GMO, Vegan, Fair Trade
         """
 
-        if self.llm_client:
-            # 실제 LLM 호출
-            response = await self.llm_client.complete(prompt)
-            parsed = json.loads(response)
-        else:
-            # 데모용 파싱
-            parsed = self._demo_parse_query(natural_query)
-
-        return SearchCriteria(
-            keywords=parsed.get("keywords", []),
-            categories=parsed.get("categories", []),
-            countries=parsed.get("countries", []),
-            certifications=parsed.get("certifications", []),
-            min_moq=parsed.get("min_moq"),
-            max_moq=parsed.get("max_moq"),
-            price_range=tuple(parsed["price_range"]) if parsed.get("price_range") else None
-        )
+        response = await self.llm_client.complete(prompt)
+        return json.loads(response)
 
-    def _demo_parse_query(self, query: str) -> Dict:
-        """데모용 쿼리 파싱"""
-        query_lower = query.lower()
+    async def discover_suppliers(
+        self,
+        criteria: SearchCriteria,
+        top_k: Optional[int] = None
+    ) -> List[DiscoveredSupplier]:
+        """
+        주어진 조건에 맞는 공급사 탐색 (모든 소스 결과를 모아 점수순 반환)
 
-        result = {
-            "keywords": [],
-            "categories": [],
-            "countries": [],
-            "certifications": [],
-            "min_moq": None,
-            "max_moq": None,
-            "price_range": None
-        }
+        Args:
+            top_k: 상위 K개만 반환 (None 이면 전체)
+        """
+        discovered = []
+        async for batch in self.discover_suppliers_iter(criteria):
+            discovered.extend(batch.suppliers)
 
-        # 키워드 추출
-        keywords_map = {
-            "올리브오일": "olive oil",
-            "말차": "matcha",
-            "꿀": "honey",
-            "치즈": "cheese",
-            "소스": "sauce",
-            "스낵": "snacks",
-            "음료": "beverages"
-        }
-        for ko, en in keywords_map.items():
-            if ko in query_lower or en in query_lower:
-                result["keywords"].append(en)
-
-        # 국가 추출
-        countries_map = {
-            "이탈리아": "Italy",
-            "일본": "Japan",
-            "프랑스": "France",
-            "미국": "USA",
-            "뉴질랜드": "New Zealand",
-            "유럽": "Europe"
-        }
-        for ko, en in countries_map.items():
-            if ko in query_lower:
-                result["countries"].append(en)
-
-        # 인증 추출
-        certs_map = {
-            "유기농": "Organic",
-            "haccp": "HACCP",
-            "할랄": "Halal",
-            "비건": "Vegan",
-            "non-gmo": "Non-GMO"
-        }
-        for ko, en in certs_map.items():
-            if ko in query_lower:
-                result["certifications"].append(en)
+        # 점수순 (top_k 지정 시 힙으로 상위 K개만)
+        return top_suppliers(discovered, top_k)
 
-        # MOQ 추출
-        import re
-        moq_match = re.search(r'moq\s*(\d+)', query_lower)
-        if moq_match:
-            result["max_moq"] = int(moq_match.group(1))
+    async def discover_suppliers_iter(
+        self,
+        criteria: SearchCriteria,
+        enough: Optional[int] = None,
+        min_confidence: float = 0.7
+    ) -> AsyncIterator[DiscoveryBatch]:
+        """
+        소스별 탐색 결과를 페이지 단위로 도착 순서대로 반환
 
-        return result
+        가장 느린 소스를 기다리지 않고 먼저 응답한 소스의 결과부터 점수를 매겨 내보냅니다.
+        점수 계산 / LLM 검증은 소스별 작업 안에서 실행되어 다른 소스 검색과 겹칩니다.
+        소스마다 마지막 배치는 final=True 이며, 제한 시간을 넘기거나 실패한 소스는 error 가 담깁니다.
+        소비자가 중간에 순회를 멈추면 남은 소스 검색은 취소됩니다.
 
-    async def discover_suppliers(self, criteria: SearchCriteria) -> List[DiscoveredSupplier]:
-        """
-        주어진 조건에 맞는 공급사 탐색
+        Args:
+            enough: 점수가 min_confidence 이상인 공급사가 이만큼 모이면 남은 검색 취소 (None = 끝까지)
         """
         self.state = AgentState.SEARCHING
-        discovered = []
-
-        # 각 데이터 소스에서 병렬로 검색
-        tasks = []
-        for source in self.data_sources:
-            task = source.search(criteria)
-            tasks.append(task)
+        queue: asyncio.Queue = asyncio.Queue()
+        tasks = [asyncio.ensure_future(self._stream_source(source, criteria, queue)) for source in self.data_sources]
+
+        pending = len(tasks)
+        confident = 0
+        try:
+            while pending:
+                batch = await queue.get()
+                if batch.final:
+                    pending -= 1
+                yield batch
+
+                if enough is not None:
+                    confident += sum(1 for s in batch.suppliers if s.confidence_score >= min_confidence)
+                    if confident >= enough:
+                        logger.info(f"신뢰도 {min_confidence} 이상 공급사 {confident}개 확보: 남은 검색 취소")
+                        return
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.state = AgentState.IDLE
+
+    async def _stream_source(self, source: "DataSource", criteria: SearchCriteria, queue: asyncio.Queue):
+        """
+        소스 1곳 검색 → 페이지마다 점수를 매겨 queue 로 전달 (캐시 우선)
 
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, list):
-                    discovered.extend(result)
+        항상 final=True 배치로 끝나며, 시간 초과 / 예외는 그 배치의 error 로 변환합니다.
+        """
+        started = time.monotonic()
+
+        def emit(suppliers: List[DiscoveredSupplier], page_number: int = 1, final: bool = False,
+                 error: Optional[str] = None, cached: bool = False):
+            queue.put_nowait(DiscoveryBatch(
+                source.name, suppliers, time.monotonic() - started,
+                error=error, cached=cached, page_number=page_number, final=final
+            ))
+
+        page_number = 0
+        try:
+            cached = self._cached_results(source, criteria)
+            if cached is not None:
+                emit(await self._evaluate_suppliers(cached, criteria) if cached else [], final=True, cached=True)
+                return
+
+            raw: List[Dict[str, Any]] = []
+            async for page in self._search_pages(source, criteria):
+                page_number = page.page_number
+                raw.extend(asdict(s) for s in page.suppliers)  # 점수 부여 전 원본을 캐시
+                if page.suppliers:
+                    # AI로 결과 평가 및 점수 부여
+                    emit(await self._evaluate_suppliers(page.suppliers, criteria), page_number)
+
+            if self.cache is not None:
+                self.cache.put(criteria_cache_key(criteria), source.name, raw)
+            emit([], page_number, final=True)
+        except asyncio.TimeoutError:
+            timeout = self.source_timeouts.get(source.name, self.default_source_timeout)
+            logger.warning(f"데이터 소스 시간 초과 ({source.name}, {timeout}초)")
+            emit([], page_number, final=True, error=f"timeout after {timeout}s")
+        except Exception as e:
+            logger.warning(f"데이터 소스 검색 실패 ({source.name}): {e}")
+            emit([], page_number, final=True, error=str(e))
+
+    async def _search_pages(self, source: "DataSource", criteria: SearchCriteria) -> AsyncIterator[SearchPage]:
+        """
+        데이터 소스 1곳 페이지 순회 (페이지마다 속도 제한, 검색 한도, 지표 기록)
 
-        # AI로 결과 평가 및 점수 부여
-        scored_suppliers = await self._evaluate_suppliers(discovered, criteria)
+        제한 시간은 소스 검색 시작부터의 경과 시간 기준입니다 (속도 제한 대기 포함).
+        호출 측이 받은 페이지를 처리하는 동안(yield 중)은 이 소스의 시간으로 치지 않습니다.
+        """
+        timeout = self.source_timeouts.get(source.name, self.default_source_timeout)
+        pages = source.search_iter(criteria, self.search_budget)
+        deadline = time.monotonic() + timeout
+
+        def remaining() -> float:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise asyncio.TimeoutError()
+            return left
+
+        try:
+            while True:
+                if self.rate_limiters:
+                    await asyncio.wait_for(self.rate_limiters.acquire(source.name), remaining())
+
+                with track_stage("source_search", source=source.name) as t:
+                    try:
+                        page = await asyncio.wait_for(pages.__anext__(), remaining())
+                    except StopAsyncIteration:
+                        page = None
+                    if page is not None:
+                        t.add_items(len(page.suppliers))
+
+                if page is None:
+                    return
+                yielded_at = time.monotonic()
+                yield page
+                deadline += time.monotonic() - yielded_at
+                if page.next_cursor is None:
+                    return
+        finally:
+            await pages.aclose()
+
+    async def _search_source(self, source: "DataSource", criteria: SearchCriteria) -> List[DiscoveredSupplier]:
+        """데이터 소스 1곳 전체 검색 (모든 페이지 수집)"""
+        results: List[DiscoveredSupplier] = []
+        async for page in self._search_pages(source, criteria):
+            results.extend(page.suppliers)
+        return results
+
+    # ==================== 탐색 결과 캐시 ====================
+
+    def _cached_results(self, source: "DataSource", criteria: SearchCriteria) -> Optional[List[DiscoveredSupplier]]:
+        """
+        캐시된 소스 결과 (점수 부여 전 원본의 새 복사본)
 
-        self.state = AgentState.IDLE
-        return scored_suppliers
+        TTL 이 지난 항목은 그대로 반환하되 백그라운드 재검증을 시작합니다.
+        """
+        if self.cache is None:
+            return None
+        key = criteria_cache_key(criteria)
+        entry = self.cache.get(key, source.name)
+        if entry is None:
+            return None
+
+        if entry.is_stale:
+            self._revalidate(source, criteria, key)
+        with track_stage("discovery_cache", source=source.name) as t:
+            suppliers = [DiscoveredSupplier(**data) for data in entry.suppliers]
+            t.add_items(len(suppliers))
+        return suppliers
+
+    def _revalidate(self, source: "DataSource", criteria: SearchCriteria, key: str):
+        """오래된 캐시 항목 백그라운드 갱신 (같은 키는 동시에 한 번만)"""
+        task_key = (key, source.name)
+        if task_key in self._revalidating:
+            return
+
+        async def refresh():
+            try:
+                suppliers = await self._search_source(source, criteria)
+                self.cache.put(key, source.name, [asdict(s) for s in suppliers])
+                logger.info(f"탐색 캐시 갱신 ({source.name}): {len(suppliers)}개")
+            except Exception as e:
+                logger.warning(f"탐색 캐시 갱신 실패 ({source.name}): {e}")
+            finally:
+                self._revalidating.pop(task_key, None)
+
+        self._revalidating[task_key] = asyncio.ensure_future(refresh())
 
     async def _evaluate_suppliers(
         self,
         suppliers: List[DiscoveredSupplier],
-        criteria: SearchCriteria
+        criteria: SearchCriteria,
+        top_k: Optional[int] = None
     ) -> List[DiscoveredSupplier]:
         """
-        발견된 공급사들을 AI로 평가하고 점수 부여
-        """
-        for supplier in suppliers:
-            score = 0.0
-
-            # 인증 매칭 점수
-            if criteria.certifications:
-                matched = set(supplier.certifications) & set(criteria.certifications)
-                score += 0.3 * (len(matched) / len(criteria.certifications))
-
-            # 국가 매칭
-            if criteria.countries:
-                if supplier.country in criteria.countries:
-                    score += 0.2
+        발견된 공급사들을 평가하고 점수 부여 (점수순, top_k 지정 시 상위 K개만)
 
-            # 웹사이트 존재
-            if supplier.website:
-                score += 0.1
-
-            # 기본 점수
-            score += 0.4 * supplier.confidence_score
-
-            supplier.confidence_score = min(score, 1.0)
+        규칙 점수를 먼저 계산하고, LLM 검증기가 있으면 후보를 배치로 묶어 검증해 점수를 보정합니다.
+        """
+        if self.verifier is None:
+            return self.scorer.evaluate(suppliers, criteria, top_k=top_k)
 
-        # 점수순 정렬
-        return sorted(suppliers, key=lambda x: x.confidence_score, reverse=True)
+        scored = self.scorer.evaluate(suppliers, criteria)
+        with track_stage("llm_verify") as t:
+            verified = await self.verifier.verify(scored, criteria)
+            t.add_items(len(verified))
+        return top_suppliers(verified, top_k)
 
-    async def request_catalog(self, supplier: DiscoveredSupplier) -> Dict[str, Any]:
+    async def request_catalog(self, supplier: DiscoveredSupplier, recrawl: bool = False) -> Dict[str, Any]:
         """
         공급사에 카탈로그/가격표 요청
 
@@ -239,6 +415,9 @@ class SupplierDiscoveryAgent:
         1. 웹사이트에서 직접 다운로드
         2. 자동 이메일 요청
         3. 연락처 폼 자동 작성
+
+        Args:
+            recrawl: 이전 방문 기록을 무시하고 사이트를 처음부터 다시 크롤링
         """
         result = {
             "supplier_id": supplier.name,
@@ -247,10 +426,16 @@ class SupplierDiscoveryAgent:
             "status": "pending"
         }
 
-        # TODO: 실제 구현
-        # 1. 웹사이트 크롤링으로 카탈로그 링크 찾기
-        # 2. PDF/Excel 다운로드
-        # 3. 없으면 연락 시도
+        # 1~2. 웹사이트 크롤링으로 카탈로그 링크 찾기 + PDF/Excel 다운로드
+        if self.catalog_crawler is not None and supplier.website:
+            self.state = AgentState.CRAWLING
+            try:
+                result["catalogs_found"] = await self.catalog_crawler.crawl_site(supplier.website, recrawl=recrawl)
+            finally:
+                self.state = AgentState.IDLE
+            result["status"] = "found" if result["catalogs_found"] else "not_found"
+
+        # TODO: 3. 없으면 연락 시도
 
         return result
 
@@ -260,29 +445,101 @@ class SupplierDiscoveryAgent:
 
 
 class DataSource(ABC):
-    """데이터 소스 추상 클래스"""
+    """
+    데이터 소스 추상 클래스
+
+    둘 중 하나를 구현합니다.
+    - fetch_page(criteria, cursor): 결과 1페이지 + 다음 페이지 커서 (페이지 단위 스트리밍)
+    - search(criteria): 전체 결과 목록 (기존 방식, 1페이지짜리 search_iter 로 변환됨)
+    """
+
+    name: str = "unknown"  # 지표/로그용 소스 이름 (Supplier.discovery_source 와 동일)
+
+    async def fetch_page(self, criteria: SearchCriteria, cursor: Optional[str] = None) -> SearchPage:
+        """결과 1페이지 (기본: search() 결과 전체를 마지막 페이지로 반환)"""
+        if type(self).search is DataSource.search:
+            raise NotImplementedError(f"{type(self).__name__} must implement fetch_page() or search()")
+        return SearchPage(await self.search(criteria))
+
+    async def search_iter(
+        self,
+        criteria: SearchCriteria,
+        budget: Optional[SearchBudget] = None,
+        cursor: Optional[str] = None
+    ) -> AsyncIterator[SearchPage]:
+        """
+        페이지 단위 검색 (다음 커서가 없거나 한도에 도달하면 종료)
+
+        Args:
+            budget: 최대 결과 / 페이지 수 (마지막 페이지는 max_results 에 맞춰 잘림)
+            cursor: 이어서 검색할 페이지 커서
+        """
+        budget = budget or SearchBudget()
+        remaining = budget.max_results
+        page_number = 0
+        while budget.max_pages is None or page_number < budget.max_pages:
+            page = await self.fetch_page(criteria, cursor)
+            page_number += 1
+            page.page_number = page_number
+            if remaining is not None:
+                page.suppliers = page.suppliers[:remaining]
+                remaining -= len(page.suppliers)
+                if remaining <= 0:
+                    page.next_cursor = None
+            yield page
+
+            cursor = page.next_cursor
+            if cursor is None:
+                return
 
-    @abstractmethod
     async def search(self, criteria: SearchCriteria) -> List[DiscoveredSupplier]:
-        """검색 조건에 맞는 공급사 검색"""
-        pass
+        """검색 조건에 맞는 공급사 전체 (기본: search_iter 로 모든 페이지 수집)"""
+        results: List[DiscoveredSupplier] = []
+        async for page in self.search_iter(criteria):
+            results.extend(page.suppliers)
+        return results
 
 
 class AlibabaCrawler(DataSource):
     """Alibaba.com 크롤러"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    name = "alibaba"
+
+    # 검색 결과의 업체 미니사이트 링크 (https://<store>.en.alibaba.com/...)
+    STORE_LINK_PATTERN = re.compile(
+        r'<a[^>]+href="(?:https?:)?//([a-z0-9-]+)\.en\.alibaba\.com[^"]*"[^>]*>(.*?)</a>',
+        re.IGNORECASE | re.DOTALL
+    )
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        browser_pool: Optional[BrowserPool] = None,
+        politeness: Optional[PolitenessPolicy] = None
+    ):
+        """
+        Args:
+            browser_pool: 공유 브라우저 풀 (없으면 데모 데이터 반환)
+            politeness: 크롤링 예절 정책 (검색 결과 페이지 요청 간격 / robots.txt)
+        """
         self.api_key = api_key
         self.base_url = "https://www.alibaba.com"
-
-    async def search(self, criteria: SearchCriteria) -> List[DiscoveredSupplier]:
-        """Alibaba에서 공급사 검색"""
-        # TODO: 실제 크롤링 구현
-        # Playwright/Selenium으로 검색 페이지 접근
-        # 검색 결과 파싱
+        self.browser_pool = browser_pool
+        self.politeness = politeness
+
+    async def fetch_page(self, criteria: SearchCriteria, cursor: Optional[str] = None) -> SearchPage:
+        """Alibaba 공급사 검색 1페이지 (업체 탭 검색 결과 렌더링 후 파싱, 커서 = 페이지 번호)"""
+        if self.browser_pool is not None:
+            page_no = int(cursor or 1)
+            query = " ".join(criteria.keywords or criteria.categories)
+            params = {"tab": "supplier", "SearchText": query, "page": page_no}
+            url = f"{self.base_url}/trade/search?{urlencode(params)}"
+            html = await self.browser_pool.fetch_html(url, politeness=self.politeness)
+            suppliers = self._parse_search_results(html, criteria, url) if html else []
+            return SearchPage(suppliers, next_cursor=str(page_no + 1) if suppliers else None)
 
         # 데모 데이터
-        return [
+        return SearchPage([
             DiscoveredSupplier(
                 name="Shandong Jining Green Food Co., Ltd.",
                 country="China",
@@ -294,12 +551,41 @@ class AlibabaCrawler(DataSource):
                 contact_info={"email": "sales@example.com"},
                 raw_data={}
             )
-        ]
+        ])
+
+    def _parse_search_results(
+        self,
+        html: str,
+        criteria: SearchCriteria,
+        search_url: str
+    ) -> List[DiscoveredSupplier]:
+        """검색 결과 HTML → 공급사 목록 (미니사이트 링크 기준, 업체당 1건)"""
+        suppliers = []
+        seen = set()
+        for store, inner in self.STORE_LINK_PATTERN.findall(html):
+            name = " ".join(unescape(re.sub(r"<[^>]+>", " ", inner)).split())
+            if store in seen or len(name) < 3:
+                continue
+            seen.add(store)
+            suppliers.append(DiscoveredSupplier(
+                name=name,
+                country="",
+                website=f"https://{store}.en.alibaba.com",
+                source="alibaba",
+                confidence_score=0.6,
+                certifications=[],
+                product_categories=list(criteria.categories),
+                contact_info={},
+                raw_data={"store": store, "search_url": search_url}
+            ))
+        return suppliers
 
 
 class GlobalSourcesCrawler(DataSource):
     """GlobalSources.com 크롤러"""
 
+    name = "globalsources"
+
     async def search(self, criteria: SearchCriteria) -> List[DiscoveredSupplier]:
         # TODO: 실제 구현
         return []
@@ -308,6 +594,8 @@ class GlobalSourcesCrawler(DataSource):
 class TradeKoreaCrawler(DataSource):
     """TradeKorea.com 크롤러 (한국 공급사)"""
 
+    name = "tradekorea"
+
     async def search(self, criteria: SearchCriteria) -> List[DiscoveredSupplier]:
         # TODO: 실제 구현
         return []
@@ -316,6 +604,8 @@ class TradeKoreaCrawler(DataSource):
 class WebSearchCrawler(DataSource):
     """일반 웹 검색 크롤러 (Google, Bing)"""
 
+    name = "web_search"
+
     async def search(self, criteria: SearchCriteria) -> List[DiscoveredSupplier]:
         """
         웹 검색으로 공급사 웹사이트 직접 발견
@@ -0,0 +1,93 @@
+"""
+WeDealize Supplier Scoring
+탐색된 공급사 후보 점수 계산 / 상위 K개 선택
+
+- 후보 목록을 한 번 훑어 특성 배열로 인코딩 (인증 = 후보 x 조건 인증 불리언 행렬, 국가 = 조건 국가 코드)
+- 점수는 numpy 벡터 연산 한 번으로 계산 (후보 수천 개 기준)
+- 가중치는 ScoringWeights 로 설정 (config/settings.py)
+- 상위 K개만 필요하면 전체 정렬 대신 힙으로 선택
+"""
+
+import heapq
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..config.settings import ScoringWeights
+
+
+class SupplierScorer:
+    """
+    공급사 후보 점수 계산기
+
+    scorer = SupplierScorer(ScoringWeights(certification=0.4, country=0.2, website=0.1, base=0.3))
+    top = scorer.evaluate(suppliers, criteria, top_k=10)
+    """
+
+    def __init__(self, weights: Optional[ScoringWeights] = None):
+        self.weights = weights or ScoringWeights()
+
+    def score(self, suppliers: Sequence, criteria) -> np.ndarray:
+        """
+        후보별 점수 (0~1, suppliers 순서)
+
+        인증 일치율 x certification + 국가 일치 x country + 웹사이트 x website + 원본 신뢰도 x base
+        """
+        n = len(suppliers)
+        w = self.weights
+        if n == 0:
+            return np.zeros(0, dtype=np.float64)
+
+        base = np.fromiter((s.confidence_score or 0.0 for s in suppliers), dtype=np.float64, count=n)
+        has_website = np.fromiter((bool(s.website) for s in suppliers), dtype=bool, count=n)
+        scores = w.base * base + w.website * has_website
+
+        if criteria.certifications:
+            cert_index: Dict[str, int] = {c: i for i, c in enumerate(dict.fromkeys(criteria.certifications))}
+            rows: List[int] = []
+            cols: List[int] = []
+            for row, supplier in enumerate(suppliers):
+                for cert in supplier.certifications or ():
+                    col = cert_index.get(cert)
+                    if col is not None:
+                        rows.append(row)
+                        cols.append(col)
+            # 같은 인증이 중복돼도 한 칸이므로 집합 교집합과 같은 결과
+            matrix = np.zeros((n, len(cert_index)), dtype=bool)
+            matrix[rows, cols] = True
+            scores += w.certification * (matrix.sum(axis=1) / len(criteria.certifications))
+
+        if criteria.countries:
+            country_index = {c: i for i, c in enumerate(criteria.countries)}
+            codes = np.fromiter((country_index.get(s.country, -1) for s in suppliers), dtype=np.int32, count=n)
+            scores += w.country * (codes >= 0)
+
+        return np.minimum(scores, 1.0)
+
+    def evaluate(self, suppliers: Sequence, criteria, top_k: Optional[int] = None) -> List:
+        """
+        점수를 confidence_score 에 반영하고 점수순으로 반환
+
+        Args:
+            top_k: 상위 K개만 반환 (None 이면 전체)
+        """
+        scores = self.score(suppliers, criteria)
+        for supplier, value in zip(suppliers, scores.tolist()):
+            supplier.confidence_score = value
+        return [suppliers[i] for i in top_indices(scores, top_k)]
+
+
+def top_indices(scores: np.ndarray, k: Optional[int] = None) -> List[int]:
+    """점수 상위 K개 인덱스 (동점은 앞선 순서 우선)"""
+    n = len(scores)
+    if k is None or k >= n:
+        return np.argsort(-scores, kind="stable").tolist()
+    values = scores.tolist()
+    return heapq.nlargest(k, range(n), key=values.__getitem__)
+
+
+def top_suppliers(suppliers: Sequence, k: Optional[int] = None) -> List:
+    """이미 점수가 매겨진 후보에서 confidence_score 상위 K개 (여러 배치 병합용)"""
+    if k is None or k >= len(suppliers):
+        return sorted(suppliers, key=lambda s: s.confidence_score, reverse=True)
+    return heapq.nlargest(k, suppliers, key=lambda s: s.confidence_score)
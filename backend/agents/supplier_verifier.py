@@ -0,0 +1,261 @@
+"""
+WeDealize Supplier Verifier
+LLM 으로 탐색된 공급사 후보 일괄 검증 (실제 F&B 공급사인지, 검색 조건과 맞는지)
+
+- 후보 여러 개를 토큰 예산 안에서 프롬프트 하나로 묶어 호출 (후보당 1회 호출 X)
+- 배치들은 동시 실행 (동시 호출 수 제한)
+- 판정은 검색 조건 + 공급사 도메인(없으면 정규화 이름 + 국가) 단위로 TTL 캐시 → 같은 조건에서 같은 공급사 재검증 안 함
+- 판정 신뢰도를 기존 confidence_score 와 가중 평균해 점수 보정
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..services.discovery_cache import criteria_cache_key
+from ..services.entity_resolution import normalize_domain, normalize_name
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # 선택 의존성 (없으면 글자 수로 추정)
+    _ENCODING = None
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 (tiktoken 이 없으면 4글자 = 1토큰으로 추정)"""
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    return len(text) // 4 + 1
+
+
+VERDICTS = ("verified", "suspicious", "unrelated")
+
+PROMPT_HEADER = """
+다음은 B2B F&B 공급사 탐색 결과 후보 목록입니다. 각 후보가 검색 조건에 맞는 실제 식음료 공급사(제조사/수출업체/도매상)인지 판정해주세요.
+
+검색 조건: {criteria}
+
+후보 (JSON Lines, i = 후보 번호):
+"""
+
+PROMPT_FOOTER = """
+각 후보에 대해 다음 형식의 JSON 배열만 반환해주세요.
+[{"i": 후보 번호, "verdict": "verified" | "suspicious" | "unrelated", "confidence": 0~1, "reason": "짧은 근거"}]
+verdict: verified = 조건에 맞는 실제 공급사, suspicious = 판단 근거 부족/의심, unrelated = 공급사가 아니거나 조건과 무관
+"""
+
+# 판정 1건당 예상 응답 토큰
+RESPONSE_TOKENS_PER_ITEM = 40
+
+
+@dataclass
+class SupplierVerdict:
+    """공급사 1곳 검증 결과"""
+    verdict: str       # "verified", "suspicious", "unrelated"
+    confidence: float  # 조건에 맞는 실제 공급사일 확률 (0~1)
+    reason: str = ""
+    checked_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"verdict": self.verdict, "confidence": self.confidence, "reason": self.reason}
+
+
+def verdict_key(supplier, criteria) -> str:
+    """
+    검증 캐시 키 (검색 조건 해시 + 도메인 우선, 없으면 정규화 이름 + 국가)
+
+    판정은 "이 조건에 맞는가"이므로 같은 공급사라도 조건이 다르면 다시 검증합니다.
+    """
+    scope = criteria_cache_key(criteria)[:16]
+    domain = normalize_domain(supplier.website) if supplier.website else None
+    if domain:
+        return f"{scope}|d:{domain}"
+    return f"{scope}|n:{normalize_name(supplier.name)}|{(supplier.country or '').lower()}"
+
+
+class SupplierVerifier:
+    """
+    공급사 후보 일괄 검증기
+
+    verifier = SupplierVerifier(llm_client, batch_token_budget=3000, max_concurrent_batches=4)
+    suppliers = await verifier.verify(suppliers, criteria)  # confidence_score 보정 + 점수순
+    """
+
+    def __init__(
+        self,
+        llm_client,
+        batch_token_budget: int = 3000,
+        max_batch_size: int = 25,
+        max_concurrent_batches: int = 4,
+        cache_ttl_seconds: float = 7 * 86400,
+        max_cache_entries: int = 20000,
+        weight: float = 0.3
+    ):
+        """
+        Args:
+            batch_token_budget: 배치 1개 프롬프트 + 예상 응답 토큰 상한
+            weight: 보정 점수 = (1 - weight) x 기존 점수 + weight x 판정 신뢰도
+        """
+        self.llm_client = llm_client
+        self.batch_token_budget = batch_token_budget
+        self.max_batch_size = max_batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_cache_entries = max_cache_entries
+        self.weight = weight
+        self._cache: "OrderedDict[str, SupplierVerdict]" = OrderedDict()
+
+    # ==================== 캐시 ====================
+
+    def cached_verdict(self, key: str) -> Optional[SupplierVerdict]:
+        verdict = self._cache.get(key)
+        if verdict is None:
+            return None
+        if time.time() - verdict.checked_at > self.cache_ttl_seconds:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return verdict
+
+    def _remember(self, key: str, verdict: SupplierVerdict):
+        self._cache[key] = verdict
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+
+    # ==================== 검증 ====================
+
+    async def verify(self, suppliers: Sequence, criteria) -> List:
+        """
+        후보 검증 후 confidence_score 보정, 점수순 반환
+
+        같은 조건으로 캐시된 판정이 없는 도메인만 LLM 에 묻고, 실패한 배치의 후보는 점수를 그대로 둡니다.
+        """
+        pending: Dict[str, List[Any]] = {}
+        for supplier in suppliers:
+            key = verdict_key(supplier, criteria)
+            verdict = self.cached_verdict(key)
+            if verdict is not None:
+                self._apply(supplier, verdict)
+            else:
+                pending.setdefault(key, []).append(supplier)
+
+        if pending:
+            criteria_text = self._criteria_text(criteria)
+            batches = self._pack(criteria_text, list(pending.items()))
+            semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+            async def run(batch):
+                async with semaphore:
+                    return await self._verify_batch(criteria_text, batch)
+
+            results = await asyncio.gather(*(run(batch) for batch in batches))
+            for batch, verdicts in zip(batches, results):
+                for n, (key, group) in enumerate(batch):
+                    verdict = verdicts.get(n)
+                    if verdict is None:
+                        continue
+                    self._remember(key, verdict)
+                    for supplier in group:
+                        self._apply(supplier, verdict)
+
+        return sorted(suppliers, key=lambda s: s.confidence_score, reverse=True)
+
+    def _apply(self, supplier, verdict: SupplierVerdict):
+        supplier.confidence_score = min(
+            (1 - self.weight) * supplier.confidence_score + self.weight * verdict.confidence, 1.0
+        )
+        supplier.raw_data = {**(supplier.raw_data or {}), "llm_verification": verdict.to_dict()}
+
+    @staticmethod
+    def _criteria_text(criteria) -> str:
+        return json.dumps({
+            "keywords": criteria.keywords,
+            "categories": criteria.categories,
+            "countries": criteria.countries,
+            "certifications": criteria.certifications,
+        }, ensure_ascii=False)
+
+    @staticmethod
+    def _candidate_line(n: int, supplier) -> str:
+        return json.dumps({
+            "i": n,
+            "name": supplier.name,
+            "country": supplier.country,
+            "website": supplier.website,
+            "categories": supplier.product_categories[:5],
+            "certifications": supplier.certifications[:8],
+            "source": supplier.source,
+        }, ensure_ascii=False)
+
+    def _pack(
+        self,
+        criteria_text: str,
+        items: List[Tuple[str, List[Any]]]
+    ) -> List[List[Tuple[str, List[Any]]]]:
+        """토큰 예산 / 최대 개수 안에서 후보를 배치로 묶음 (도메인당 대표 1개만 프롬프트에 포함)"""
+        overhead = estimate_tokens(PROMPT_HEADER.format(criteria=criteria_text) + PROMPT_FOOTER)
+        batches: List[List[Tuple[str, List[Any]]]] = []
+        current: List[Tuple[str, List[Any]]] = []
+        used = overhead
+
+        for key, group in items:
+            cost = estimate_tokens(self._candidate_line(len(current), group[0])) + RESPONSE_TOKENS_PER_ITEM
+            if current and (used + cost > self.batch_token_budget or len(current) >= self.max_batch_size):
+                batches.append(current)
+                current, used = [], overhead
+            current.append((key, group))
+            used += cost
+
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _verify_batch(
+        self,
+        criteria_text: str,
+        batch: List[Tuple[str, List[Any]]]
+    ) -> Dict[int, SupplierVerdict]:
+        """배치 1개 LLM 호출, 후보 번호 → 판정 (실패 시 빈 dict)"""
+        lines = "\n".join(self._candidate_line(n, group[0]) for n, (_, group) in enumerate(batch))
+        prompt = PROMPT_HEADER.format(criteria=criteria_text) + lines + "\n" + PROMPT_FOOTER
+
+        try:
+            response = await self.llm_client.complete(prompt)
+            return self._parse_response(response, len(batch))
+        except Exception as e:
+            logger.warning(f"공급사 LLM 검증 실패 (후보 {len(batch)}개): {e}")
+            return {}
+
+    @staticmethod
+    def _parse_response(response: str, size: int) -> Dict[int, SupplierVerdict]:
+        """LLM 응답(JSON 배열, 코드 블록 허용) → 후보 번호별 판정"""
+        match = re.search(r"\[.*\]", response, re.DOTALL)
+        items = json.loads(match.group(0) if match else response)
+
+        now = time.time()
+        verdicts: Dict[int, SupplierVerdict] = {}
+        for item in items:
+            try:
+                n = int(item["i"])
+                confidence = min(max(float(item.get("confidence", 0.5)), 0.0), 1.0)
+            except (KeyError, TypeError, ValueError):
+                continue
+            verdict = str(item.get("verdict", "suspicious")).lower()
+            if not 0 <= n < size or verdict not in VERDICTS:
+                continue
+            verdicts[n] = SupplierVerdict(
+                verdict=verdict,
+                confidence=confidence,
+                reason=str(item.get("reason", ""))[:200],
+                checked_at=now
+            )
+        return verdicts
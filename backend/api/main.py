@@ -3,19 +3,23 @@ WeDealize API Server
 FastAPI 기반 REST API
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import asyncio
+import logging
 import os
 
 # 내부 모듈 (실제 구동 시 경로 조정 필요)
 # from ..agents.orchestrator import SupplierDiscoveryOrchestrator, PipelineResult
 # from ..models.database import init_database, get_session, Product, Supplier
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="WeDealize API",
     description="AI 기반 글로벌 F&B Supplier Discovery API",
@@ -48,6 +52,7 @@ class SearchRequest(BaseModel):
     query: str = Field(..., description="자연어 검색 쿼리", example="유기농 인증된 이탈리아산 올리브오일")
     filters: Optional[Dict[str, Any]] = Field(default=None, description="추가 필터")
     auto_crawl: bool = Field(default=False, description="자동 카탈로그 크롤링")
+    mode: str = Field(default="keyword", pattern="^(keyword|semantic)$", description="keyword=전문 검색, semantic=임베딩 의미 검색")
 
 
 class ProductResponse(BaseModel):
@@ -68,6 +73,11 @@ class ProductResponse(BaseModel):
     thumbnail_url: Optional[str]
 
 
+class SimilarProductResponse(ProductResponse):
+    """유사 상품 응답"""
+    similarity: float
+
+
 class SupplierResponse(BaseModel):
     """공급사 응답"""
     id: int
@@ -100,6 +110,8 @@ class PipelineStatusResponse(BaseModel):
     products_extracted: int
     started_at: datetime
     estimated_completion: Optional[datetime]
+    finished_at: Optional[datetime] = None
+    errors: List[str] = []
 
 
 # ==================== 데모 데이터 ====================
@@ -204,6 +216,124 @@ DEMO_PRODUCTS = [
 ]
 
 
+COUNTRY_FLAGS = {
+    "Italy": "🇮🇹", "Japan": "🇯🇵", "USA": "🇺🇸", "France": "🇫🇷",
+    "New Zealand": "🇳🇿", "Sri Lanka": "🇱🇰", "China": "🇨🇳", "Korea": "🇰🇷",
+    "Spain": "🇪🇸", "Germany": "🇩🇪", "India": "🇮🇳", "Vietnam": "🇻🇳",
+    "Thailand": "🇹🇭", "Greece": "🇬🇷", "Australia": "🇦🇺",
+}
+
+
+# ==================== DB 연동 ====================
+
+_orchestrator = None
+
+
+def get_orchestrator():
+    """DB 연동 오케스트레이터 (첫 호출 시 생성)"""
+    global _orchestrator
+    if _orchestrator is None:
+        from ..agents.orchestrator import SupplierDiscoveryOrchestrator
+        _orchestrator = SupplierDiscoveryOrchestrator({
+            "database_url": os.getenv("DATABASE_URL", "sqlite:///wedealize.db"),
+        })
+    return _orchestrator
+
+
+@app.on_event("shutdown")
+async def close_orchestrator():
+    """서버 종료 시 오케스트레이터 공유 자원(브라우저 풀) 정리"""
+    if _orchestrator is not None:
+        await _orchestrator.aclose()
+
+
+_discovery_jobs = None
+
+
+def get_discovery_jobs():
+    """탐색 작업 진행 상황 레지스트리 (첫 호출 시 생성)"""
+    global _discovery_jobs
+    if _discovery_jobs is None:
+        from ..services.discovery_jobs import DiscoveryJobTracker
+        _discovery_jobs = DiscoveryJobTracker()
+    return _discovery_jobs
+
+
+_query_interpreter = None
+
+
+def _interpret_query(query: str) -> Dict[str, Any]:
+    """검색어 규칙 기반 해석 (사전 컴파일은 첫 호출 시 1회)"""
+    global _query_interpreter
+    try:
+        if _query_interpreter is None:
+            from ..agents.query_interpreter import QueryInterpreter
+            _query_interpreter = QueryInterpreter()
+        result = _query_interpreter.interpret(query)
+        return {**result.to_dict(), "confidence": result.confidence, "terms": result.terms}
+    except Exception as e:
+        logger.warning(f"검색어 해석 실패: {e}")
+        return {"keywords": [], "countries": [], "certifications": [], "terms": []}
+
+
+def _merge_interpreted_filters(filters: Optional[Dict[str, Any]], interpreted: Dict[str, Any]) -> Dict[str, Any]:
+    """검색어에서 해석한 국가 / 인증을 필터에 반영 (요청에 직접 지정한 필터가 우선)"""
+    merged = dict(filters or {})
+    if interpreted.get("countries") and not merged.get("country"):
+        merged["country"] = interpreted["countries"]
+    if interpreted.get("certifications") and not merged.get("certifications"):
+        merged["certifications"] = interpreted["certifications"]
+    return merged
+
+
+def _product_to_response(product) -> ProductResponse:
+    """Product 모델 → API 응답"""
+    supplier = product.supplier
+    country = supplier.country if supplier else ""
+    return ProductResponse(
+        id=product.id,
+        name=product.name,
+        name_ko=product.name_ko,
+        supplier_name=supplier.name if supplier else "",
+        supplier_country=country,
+        country_flag=COUNTRY_FLAGS.get(country, "🌐"),
+        specifications=product.specifications or {},
+        certifications=product.certifications or [],
+        price_min=product.unit_price_min,
+        price_max=product.unit_price_max,
+        currency=product.currency or "USD",
+        moq=product.moq,
+        moq_unit=product.moq_unit,
+        thumbnail_url=product.thumbnail_url
+    )
+
+
+async def _search_db_products(
+    query: str,
+    filters: Optional[Dict[str, Any]],
+    limit: int = 100,
+    offset: int = 0,
+    alternatives: List[str] = ()
+) -> Optional[List[ProductResponse]]:
+    """
+    DB 인덱스(전문 검색, 인증 역색인)로 상품 검색 (alternatives: 대신 일치해도 되는 검색어)
+
+    DB에 상품이 아직 없거나 연결할 수 없으면 None (데모 데이터 사용)
+    """
+    try:
+        orchestrator = get_orchestrator()
+        from ..models.database import Product
+        if orchestrator.db_session.query(Product.id).first() is None:
+            return None
+        products = await orchestrator.search_products(
+            query, filters, limit=limit, offset=offset, alternatives=alternatives
+        )
+        return [_product_to_response(p) for p in products]
+    except Exception as e:
+        logger.warning(f"DB 상품 검색 실패, 데모 데이터 사용: {e}")
+        return None
+
+
 # ==================== API Endpoints ====================
 
 @app.get("/")
@@ -216,6 +346,20 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus 지표
+
+    단계별/데이터 소스별 지연 시간, 처리 항목 수, 오류 수, 실행 중 단계 수.
+    다중 프로세스 워커는 PROMETHEUS_MULTIPROC_DIR 을 공유하면 합산됩니다.
+    """
+    from ..services.metrics import render_metrics
+
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.post("/api/v1/search", response_model=SearchResponse)
 async def search_products(request: SearchRequest):
     """
@@ -226,32 +370,50 @@ async def search_products(request: SearchRequest):
     import time
     start_time = time.time()
 
-    # 쿼리 해석 (데모)
-    interpreted = {
-        "keywords": ["olive oil"] if "올리브" in request.query else ["food"],
-        "countries": ["Italy"] if "이탈리아" in request.query else [],
-        "certifications": ["Organic"] if "유기농" in request.query else []
-    }
+    # 쿼리 해석 (규칙 기반) - 해석된 국가 / 인증은 필터로 적용
+    interpreted = _interpret_query(request.query)
+    filters = _merge_interpreted_filters(request.filters, interpreted)
+
+    if request.mode == "semantic":
+        # 임베딩 의미 검색 (ANN 인덱스)
+        try:
+            ranked = await get_orchestrator().semantic_search(request.query, filters)
+        except RuntimeError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        products = [_product_to_response(p) for p, _ in ranked]
+    else:
+        # 전문 검색 인덱스 (관련도 순) - 해석된 영문 키워드 또는 원문의 상품 표현("고추장" → name_ko) 일치,
+        # 상품을 해석하지 못했으면 원문 검색어 사용
+        keywords = interpreted["keywords"]
+        terms = interpreted.get("terms") or []
+        products = await _search_db_products(
+            " ".join(keywords) or request.query,
+            filters,
+            alternatives=[" ".join(terms)] if keywords else []
+        )
+
+    if products is None:
+        # 필터링 (데모)
+        filtered_products = DEMO_PRODUCTS
+        if "올리브" in request.query.lower() or "olive" in request.query.lower():
+            filtered_products = [p for p in DEMO_PRODUCTS if "olive" in p["name"].lower()]
+        elif "말차" in request.query.lower() or "matcha" in request.query.lower():
+            filtered_products = [p for p in DEMO_PRODUCTS if "matcha" in p["name"].lower()]
 
-    # 필터링 (데모)
-    filtered_products = DEMO_PRODUCTS
-    if "올리브" in request.query.lower() or "olive" in request.query.lower():
-        filtered_products = [p for p in DEMO_PRODUCTS if "olive" in p["name"].lower()]
-    elif "말차" in request.query.lower() or "matcha" in request.query.lower():
-        filtered_products = [p for p in DEMO_PRODUCTS if "matcha" in p["name"].lower()]
+        # 없으면 전체 반환
+        if not filtered_products:
+            filtered_products = DEMO_PRODUCTS
 
-    # 없으면 전체 반환
-    if not filtered_products:
-        filtered_products = DEMO_PRODUCTS
+        products = [ProductResponse(**p) for p in filtered_products]
 
     execution_time = int((time.time() - start_time) * 1000)
 
     return SearchResponse(
         query=request.query,
         interpreted=interpreted,
-        total_count=len(filtered_products),
-        products=[ProductResponse(**p) for p in filtered_products],
-        ai_analysis=f'💡 "{request.query}" 검색 결과 {len(filtered_products)}개 상품을 찾았습니다. '
+        total_count=len(products),
+        products=products,
+        ai_analysis=f'💡 "{request.query}" 검색 결과 {len(products)}개 상품을 찾았습니다. '
                     f'유럽 지역 공급사가 가장 많으며, 평균 FOB 가격은 $12.50입니다.',
         execution_time_ms=execution_time
     )
@@ -261,7 +423,8 @@ async def search_products(request: SearchRequest):
 async def list_products(
     category: Optional[str] = None,
     country: Optional[str] = None,
-    certification: Optional[str] = None,
+    certification: Optional[str] = Query(default=None, description="인증 (쉼표로 여러 개: Organic,Halal)"),
+    certification_mode: str = Query(default="all", pattern="^(all|any)$", description="all=모두 보유, any=하나 이상"),
     price_max: Optional[float] = None,
     moq_max: Optional[int] = None,
     limit: int = Query(default=20, le=100),
@@ -271,15 +434,36 @@ async def list_products(
     상품 목록 조회
 
     필터 및 페이지네이션 지원
+    인증 필터는 표준 인증명 기준 ("Organic" → USDA Organic, EU Organic 포함)
     """
+    from ..services.certifications import matches as certification_matches
+
+    certifications = [c.strip() for c in certification.split(",") if c.strip()] if certification else []
+
+    db_products = await _search_db_products(
+        "",
+        {
+            "category": category,
+            "country": country,
+            "certifications": certifications,
+            "certification_mode": certification_mode,
+            "price_max": price_max,
+            "moq_max": moq_max,
+        },
+        limit=limit,
+        offset=offset
+    )
+    if db_products is not None:
+        return db_products
+
     products = DEMO_PRODUCTS
 
     # 필터링
     if country:
         products = [p for p in products if p["supplier_country"].lower() == country.lower()]
 
-    if certification:
-        products = [p for p in products if certification in p["certifications"]]
+    if certifications:
+        products = [p for p in products if certification_matches(p["certifications"], certifications, certification_mode)]
 
     if price_max:
         products = [p for p in products if p["price_max"] and p["price_max"] <= price_max]
@@ -303,6 +487,51 @@ async def get_product(product_id: int):
     raise HTTPException(status_code=404, detail="Product not found")
 
 
+@app.get("/api/v1/products/{product_id}/similar", response_model=List[SimilarProductResponse])
+async def get_similar_products(product_id: int, k: int = Query(default=10, ge=1, le=100)):
+    """
+    유사 상품 조회
+
+    상품 임베딩 ANN 인덱스에서 코사인 유사도 상위 k개를 반환합니다.
+    """
+    try:
+        orchestrator = get_orchestrator()
+    except Exception as e:
+        logger.warning(f"DB 연결 실패: {e}")
+        raise HTTPException(status_code=503, detail="상품 DB를 사용할 수 없습니다")
+
+    from ..models.database import Product
+    product = orchestrator.db_session.get(Product, product_id)
+    if product is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+    if product.embedding is None:
+        raise HTTPException(status_code=409, detail="상품 임베딩이 아직 생성되지 않았습니다")
+
+    ranked = await orchestrator.find_similar_products(product_id, k=k)
+    return [
+        SimilarProductResponse(**_product_to_response(p).model_dump(), similarity=round(score, 4))
+        for p, score in ranked
+    ]
+
+
+async def _run_discovery_job(job_id: str, request: SearchRequest):
+    """백그라운드 탐색 실행 (진행 이벤트는 작업 레지스트리로 발행)"""
+    tracker = get_discovery_jobs()
+    try:
+        orchestrator = get_orchestrator()
+        await orchestrator.run_discovery_pipeline(
+            request.query,
+            auto_crawl=request.auto_crawl,
+            auto_parse=request.auto_crawl,
+            progress_callback=tracker.callback(job_id)
+        )
+    except Exception as e:
+        # 파이프라인 내부 오류는 파이프라인이 직접 발행, 여기는 초기화 실패 등
+        logger.error(f"탐색 작업 실패 ({job_id}): {e}")
+        tracker.publish(job_id, "error", {"message": str(e)})
+        tracker.publish(job_id, "stage", {"stage": "error"})
+
+
 @app.post("/api/v1/discovery/start")
 async def start_discovery(
     request: SearchRequest,
@@ -312,31 +541,80 @@ async def start_discovery(
     공급사 탐색 파이프라인 시작 (백그라운드)
 
     장기 실행 작업이므로 백그라운드에서 실행됩니다.
+    진행 상황은 /api/v1/discovery/events/{job_id} (SSE) 로 실시간 수신할 수 있습니다.
     """
-    job_id = f"job_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    job = get_discovery_jobs().create(request.query)
 
     # 백그라운드 작업 등록
-    # background_tasks.add_task(run_discovery_pipeline, job_id, request.query)
+    background_tasks.add_task(_run_discovery_job, job.job_id, request)
 
     return {
-        "job_id": job_id,
+        "job_id": job.job_id,
         "status": "started",
-        "message": f"'{request.query}' 검색을 시작했습니다. /api/v1/discovery/status/{job_id}에서 진행 상황을 확인하세요."
+        "events_url": f"/api/v1/discovery/events/{job.job_id}",
+        "message": f"'{request.query}' 검색을 시작했습니다. /api/v1/discovery/events/{job.job_id}에서 진행 상황을 확인하세요."
     }
 
 
 @app.get("/api/v1/discovery/status/{job_id}", response_model=PipelineStatusResponse)
 async def get_discovery_status(job_id: str):
     """파이프라인 진행 상태 조회"""
-    # 데모 응답
+    job = get_discovery_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
     return PipelineStatusResponse(
-        job_id=job_id,
-        stage="completed",
-        progress=100,
-        suppliers_found=15,
-        products_extracted=247,
-        started_at=datetime.now(),
-        estimated_completion=None
+        job_id=job.job_id,
+        stage=job.stage,
+        progress=job.progress,
+        suppliers_found=job.suppliers_found,
+        products_extracted=job.products_extracted,
+        started_at=job.started_at,
+        estimated_completion=None,
+        finished_at=job.finished_at,
+        errors=job.errors
+    )
+
+
+@app.get("/api/v1/discovery/events/{job_id}")
+async def stream_discovery_events(
+    job_id: str,
+    last_event_id: Optional[int] = Header(default=0, alias="Last-Event-ID")
+):
+    """
+    탐색 진행 이벤트 스트림 (Server-Sent Events)
+
+    이벤트: stage (단계 전환, progress 포함), criteria, supplier (저장된 공급사),
+    counts, error, done (최종 상태, 스트림 종료).
+    재연결 시 브라우저가 보내는 Last-Event-ID 이후 이벤트부터 이어서 전달합니다.
+    """
+    tracker = get_discovery_jobs()
+    if tracker.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_stream():
+        events = tracker.subscribe(job_id, last_event_id=last_event_id or 0).__aiter__()
+        next_event = asyncio.ensure_future(events.__anext__())
+        try:
+            while True:
+                # 이벤트가 없으면 15초마다 주석 줄로 연결 유지 (프록시 타임아웃 방지)
+                done, _ = await asyncio.wait({next_event}, timeout=15)
+                if not done:
+                    yield ": keep-alive\n\n"
+                    continue
+                try:
+                    item = next_event.result()
+                except StopAsyncIteration:
+                    return
+                yield item.to_sse()
+                next_event = asyncio.ensure_future(events.__anext__())
+        finally:
+            next_event.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
@@ -3,7 +3,7 @@ WeDealize Backend Configuration
 """
 
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
 
@@ -25,6 +25,13 @@ class LLMConfig:
     temperature: float = 0.3
     max_tokens: int = 4000
 
+    # 공급사 후보 일괄 검증 (SupplierVerifier)
+    verification_batch_tokens: int = 3000     # 배치 1개 프롬프트 + 예상 응답 토큰 상한
+    verification_max_batch_size: int = 25
+    verification_max_concurrency: int = 4     # 동시 LLM 호출 수
+    verification_cache_ttl_seconds: float = 7 * 86400  # 도메인별 판정 캐시
+    verification_weight: float = 0.3          # 판정 신뢰도 반영 비율
+
 
 @dataclass
 class CrawlerConfig:
@@ -41,13 +48,72 @@ class CrawlerConfig:
     proxy_url: Optional[str] = None
 
     # 병렬 처리
-    max_concurrent_requests: int = 5
+    max_concurrent_requests: int = 5  # 전체 호스트 합산 동시 요청 수
+
+    # 크롤링 예절 (crawlers/politeness.py, 호스트별 간격 = request_delay_seconds)
+    respect_robots_txt: bool = True
+    robots_cache_ttl_seconds: int = 86400
+    max_crawl_delay_seconds: float = 60.0     # robots.txt crawl-delay 상한
+
+    # httpx 연결 풀 (crawlers/email_extractor.py 공유 클라이언트)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = True  # h2 패키지가 설치된 경우에만 적용
+
+    # 연락처 일괄 추출 (EmailExtractor.extract_many, services/contact_enrichment.py)
+    # 실제 동시 요청 수는 max_concurrent_requests 로 한 번 더 제한됨 → 대량 처리 시 함께 올릴 것
+    email_concurrency: int = 50               # 동시 처리 사이트 수
+    email_per_domain: int = 2                 # 같은 도메인 동시 처리 사이트 수
+    email_site_deadline_seconds: float = 60.0  # 사이트 1곳 제한 시간 (재시도 포함)
+    email_retries: int = 2                    # 일시적 오류 재시도 횟수
+    email_max_contact_pages: int = 3          # 동시에 가져올 Contact 후보 페이지 수
+    email_max_page_bytes: int = 2 * 1024 * 1024  # 페이지 1개 최대 수신 크기 (스트리밍, 초과분은 받지 않음)
+    email_stop_after_footer: bool = False     # 페이지 푸터 이후(</body> 뒤) 본문은 받지 않음
+
+    # Playwright 브라우저 풀 (crawlers/browser_pool.py)
+    browser_pool_size: int = 2                # 브라우저 프로세스 수
+    browser_contexts_per_browser: int = 4     # 브라우저당 컨텍스트 수 (= 동시 페이지 수)
+    browser_max_pages_per_context: int = 50   # 이만큼 처리하면 컨텍스트 교체
+    browser_blocked_resources: List[str] = field(default_factory=lambda: ["image", "font", "media"])
+
+    # 디스크 HTTP 응답 캐시 (crawlers/http_cache.py)
+    http_cache_enabled: bool = True
+    http_cache_path: str = "./data/http_cache"
+    http_cache_max_mb: int = 512
+    http_cache_offline: bool = False  # 캐시만으로 재생 (네트워크 요청 없음)
+
+    # 카탈로그 크롤링 (crawlers/frontier.py, crawlers/catalog_crawler.py)
+    frontier_path: str = "./data/crawl_frontier.sqlite3"
+    frontier_bloom_capacity: int = 1_000_000
+    catalog_max_pages_per_site: int = 30
+    catalog_max_depth: int = 2
+    catalog_max_documents_per_site: int = 10
 
     # 저장 경로
     download_path: str = "./downloads"
     catalog_path: str = "./downloads/catalogs"
 
 
+@dataclass
+class WorkerConfig:
+    """작업 큐 워커 설정 (crawl_jobs 기반)"""
+    # 리스 / 하트비트
+    lease_seconds: int = 300  # 하트비트가 끊기면 이 시간 후 다른 워커가 회수
+    heartbeat_interval_seconds: int = 30
+
+    # 폴링
+    poll_interval_seconds: float = 2.0
+
+    # 재시도 (지수 백오프 + jitter)
+    max_attempts: int = 5
+    retry_backoff_base_seconds: float = 30.0
+    retry_backoff_max_seconds: float = 3600.0
+
+    # 워커 프로세스당 동시 작업 수
+    concurrency: int = 2
+
+
 @dataclass
 class DataSourceConfig:
     """데이터 소스별 설정"""
@@ -66,6 +132,53 @@ class DataSourceConfig:
     google_api_key: Optional[str] = None
     google_cx: Optional[str] = None  # Custom Search Engine ID
 
+    # 소스별 요청 속도 제한 (초당 요청 수, 전체 파이프라인 공유)
+    default_source_rate: float = 0.5
+    source_rate_limits: Dict[str, float] = field(default_factory=lambda: {
+        "alibaba": 0.2,
+        "globalsources": 0.2,
+        "tradekorea": 0.2,
+        "web_search": 1.0,
+    })
+
+    # 소스별 검색 제한 시간 (초, 넘기면 해당 소스 결과 없이 진행)
+    default_source_timeout_seconds: float = 20.0
+    source_timeouts: Dict[str, float] = field(default_factory=lambda: {
+        "alibaba": 30.0,
+        "globalsources": 30.0,
+        "tradekorea": 30.0,
+        "web_search": 10.0,
+    })
+
+    # 소스별 탐색 결과 캐시 (SearchCriteria 해시 + 소스 이름)
+    cache_enabled: bool = True
+    cache_path: str = "./data/discovery_cache.sqlite3"
+    default_cache_ttl_seconds: float = 6 * 3600
+    cache_ttls: Dict[str, float] = field(default_factory=lambda: {
+        "alibaba": 24 * 3600,
+        "globalsources": 24 * 3600,
+        "tradekorea": 24 * 3600,
+        "web_search": 6 * 3600,
+    })
+    cache_stale_seconds: float = 7 * 86400  # TTL 경과 후 캐시 반환 + 백그라운드 갱신 기간
+
+    # 소스별 검색 한도 (페이지 단위 검색)
+    max_results_per_source: int = 200
+    max_pages_per_source: int = 10
+
+    # 조기 종료: 이 점수 이상 공급사가 목표 수만큼 모이면 남은 소스 검색 취소
+    target_confident_suppliers: Optional[int] = 100
+    confident_score_threshold: float = 0.7
+
+
+@dataclass
+class ScoringWeights:
+    """공급사 후보 점수 가중치 (SupplierScorer, 합계 1.0 권장)"""
+    certification: float = 0.3  # 필수 인증 일치율
+    country: float = 0.2        # 대상 국가 일치
+    website: float = 0.1        # 웹사이트 보유
+    base: float = 0.4           # 데이터 소스 원본 신뢰도
+
 
 @dataclass
 class EmailConfig:
@@ -84,6 +197,9 @@ class SchedulerConfig:
     daily_discovery_enabled: bool = True
     daily_discovery_hour: int = 2  # 새벽 2시
 
+    # 동시 실행 파이프라인 수 (소스별 속도 제한은 DataSourceConfig)
+    max_concurrent_pipelines: int = 4
+
     # 가격 업데이트
     price_update_enabled: bool = True
     price_update_day: int = 0  # 월요일 (0=월, 6=일)
@@ -113,8 +229,10 @@ class Settings:
     llm: LLMConfig = field(default_factory=LLMConfig)
     crawler: CrawlerConfig = field(default_factory=CrawlerConfig)
     data_sources: DataSourceConfig = field(default_factory=DataSourceConfig)
+    scoring: ScoringWeights = field(default_factory=ScoringWeights)
     scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
     email: EmailConfig = field(default_factory=EmailConfig)
+    worker: WorkerConfig = field(default_factory=WorkerConfig)
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -149,6 +267,13 @@ class Settings:
         if smtp_port := os.getenv("SMTP_PORT"):
             settings.email.smtp_port = int(smtp_port)
 
+        # 크롤러 HTTP 캐시 오프라인 재생
+        settings.crawler.http_cache_offline = os.getenv("HTTP_CACHE_OFFLINE", "false").lower() == "true"
+
+        # 작업 큐 워커
+        if worker_concurrency := os.getenv("WORKER_CONCURRENCY"):
+            settings.worker.concurrency = int(worker_concurrency)
+
         return settings
 
 
@@ -0,0 +1,292 @@
+"""
+WeDealize Browser Pool
+Playwright 브라우저 / 컨텍스트 / 페이지 공유 풀 (마켓플레이스 크롤러, 이메일 추출기 공용)
+
+- 요청마다 브라우저를 띄우지 않고 소수의 브라우저 프로세스를 계속 사용
+- 브라우저마다 컨텍스트 여러 개를 만들어 두고 페이지를 재사용 (컨텍스트 1개 = 동시 페이지 1개)
+- 이미지 / 폰트 / 미디어 요청은 라우팅 단계에서 차단 (대역폭 / 렌더링 비용 절감)
+- 컨텍스트가 일정 수의 페이지를 처리하면 닫고 새로 만들어 메모리 증가를 막음
+- 브라우저가 죽으면 다음 acquire 때 다시 띄움
+
+pool = BrowserPool(browsers=2, contexts_per_browser=4)
+async with pool.page() as page:
+    await page.goto(url)
+    html = await page.content()
+await pool.close()
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .politeness import PolitenessPolicy
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    PLAYWRIGHT_AVAILABLE = False
+
+
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+
+
+@dataclass
+class _ContextSlot:
+    """브라우저 1개에 속한 컨텍스트 자리 (재사용 페이지 1개 보관)"""
+    browser_index: int
+    context: Any = None
+    page: Any = None
+    pages_served: int = 0
+
+
+class BrowserPool:
+    """
+    Playwright 브라우저 풀
+
+    acquire() 로 페이지를 빌리고 release() 로 반납합니다.
+    동시에 빌릴 수 있는 페이지 수 = browsers x contexts_per_browser.
+    """
+
+    def __init__(
+        self,
+        browsers: int = 2,
+        contexts_per_browser: int = 4,
+        max_pages_per_context: int = 50,
+        headless: bool = True,
+        user_agent: Optional[str] = None,
+        blocked_resource_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+        navigation_timeout_ms: int = 30000
+    ):
+        """
+        Args:
+            max_pages_per_context: 컨텍스트가 이만큼 페이지를 처리하면 새 컨텍스트로 교체
+            blocked_resource_types: 차단할 Playwright resource_type ("image", "font", "media" 등)
+        """
+        self.browsers = browsers
+        self.contexts_per_browser = contexts_per_browser
+        self.max_pages_per_context = max_pages_per_context
+        self.headless = headless
+        self.user_agent = user_agent
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.navigation_timeout_ms = navigation_timeout_ms
+
+        self._playwright = None
+        self._browsers: List[Any] = [None] * browsers
+        self._browser_locks = [asyncio.Lock() for _ in range(browsers)]  # 브라우저별 실행 (동시 첫 요청에 중복 실행 방지)
+        self._idle: Optional[asyncio.Queue] = None
+        self._leases: Dict[int, _ContextSlot] = {}
+        self._start_lock = asyncio.Lock()
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self.browsers * self.contexts_per_browser
+
+    # ==================== 수명 주기 ====================
+
+    async def start(self):
+        """Playwright 시작 + 컨텍스트 자리 준비 (첫 acquire 시 자동 호출)"""
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            if not PLAYWRIGHT_AVAILABLE:
+                raise RuntimeError("playwright 가 설치되어 있지 않습니다 (pip install playwright && playwright install chromium)")
+
+            self._playwright = await async_playwright().start()
+            idle: asyncio.Queue = asyncio.Queue()
+            # 브라우저별로 번갈아 넣어 부하를 나눔
+            for _ in range(self.contexts_per_browser):
+                for browser_index in range(self.browsers):
+                    idle.put_nowait(_ContextSlot(browser_index))
+            self._idle = idle
+            logger.info(f"브라우저 풀 시작: 브라우저 {self.browsers}개 x 컨텍스트 {self.contexts_per_browser}개")
+
+    async def close(self):
+        """모든 컨텍스트 / 브라우저 / Playwright 종료"""
+        self._closed = True
+        if self._idle is not None:
+            while not self._idle.empty():
+                await self._close_context(self._idle.get_nowait())
+        for slot in list(self._leases.values()):
+            await self._close_context(slot)
+        self._leases.clear()
+
+        for n, browser in enumerate(self._browsers):
+            if browser is not None:
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+                self._browsers[n] = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        self._idle = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ==================== 대여 / 반납 ====================
+
+    async def acquire(self):
+        """페이지 대여 (빈 자리가 없으면 반납될 때까지 대기)"""
+        if self._closed:
+            raise RuntimeError("browser pool is closed")
+        if self._idle is None:
+            await self.start()
+
+        slot = await self._idle.get()
+        try:
+            if slot.context is None or slot.pages_served >= self.max_pages_per_context:
+                await self._recycle(slot)
+            if slot.page is None or slot.page.is_closed():
+                slot.page = await slot.context.new_page()
+                slot.page.set_default_navigation_timeout(self.navigation_timeout_ms)
+        except BaseException as e:
+            try:
+                if isinstance(e, Exception):
+                    # 브라우저가 죽었을 수 있음 → 컨텍스트를 닫고 다음 대여 때 다시 생성
+                    await self._close_context(slot)
+                else:
+                    # 대여 취소 → 만들던 페이지만 버림 (컨텍스트는 재사용)
+                    slot.page = None
+            finally:
+                # 자리는 항상 되돌림 (잃어버리면 다음 대여가 끝없이 대기)
+                self._idle.put_nowait(slot)
+            raise
+
+        slot.pages_served += 1
+        self._leases[id(slot.page)] = slot
+        return slot.page
+
+    async def release(self, page, discard: bool = False):
+        """
+        페이지 반납
+
+        Args:
+            discard: 페이지 상태를 믿을 수 없을 때(예외 발생 등) 페이지를 닫고 반납
+        """
+        slot = self._leases.pop(id(page), None)
+        if slot is None:
+            return
+        if self._closed:
+            await self._close_context(slot)
+            return
+
+        try:
+            if discard or page.is_closed():
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+                slot.page = None
+            else:
+                try:
+                    # 다음 사용자가 이전 페이지 상태를 보지 않도록 빈 페이지로 이동
+                    await page.goto("about:blank")
+                except Exception:
+                    slot.page = None
+        except BaseException:
+            # 반납 중 취소 → 페이지 상태를 믿을 수 없으므로 버림
+            slot.page = None
+            raise
+        finally:
+            self._idle.put_nowait(slot)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """async with pool.page() as page: ... (예외 시 페이지 폐기)"""
+        page = await self.acquire()
+        failed = False
+        try:
+            yield page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self.release(page, discard=failed)
+
+    async def fetch_html(
+        self,
+        url: str,
+        wait_until: str = "domcontentloaded",
+        politeness: Optional["PolitenessPolicy"] = None
+    ) -> Optional[str]:
+        """
+        URL 렌더링 후 HTML 반환 (실패 시 None)
+
+        Args:
+            politeness: 크롤링 예절 정책 (있으면 페이지 이동을 호스트 간격 / robots.txt 에 맞춤)
+        """
+        from .politeness import RobotsDisallowed
+
+        try:
+            async with self.page() as page:
+                if politeness is not None:
+                    async with politeness.slot(url):
+                        response = await page.goto(url, wait_until=wait_until)
+                else:
+                    response = await page.goto(url, wait_until=wait_until)
+                if response is not None and response.status >= 400:
+                    return None
+                return await page.content()
+        except RobotsDisallowed:
+            logger.info(f"robots.txt 금지 ({url})")
+            return None
+        except Exception as e:
+            logger.warning(f"브라우저 요청 실패 ({url}): {e}")
+            return None
+
+    # ==================== 내부 ====================
+
+    async def _browser(self, index: int):
+        browser = self._browsers[index]
+        if browser is not None and browser.is_connected():
+            return browser
+        async with self._browser_locks[index]:
+            # 기다리는 동안 다른 요청이 이미 실행했으면 그 브라우저 사용
+            browser = self._browsers[index]
+            if browser is None or not browser.is_connected():
+                browser = await self._playwright.chromium.launch(headless=self.headless)
+                self._browsers[index] = browser
+                logger.info(f"브라우저 실행 (#{index})")
+            return browser
+
+    async def _recycle(self, slot: _ContextSlot):
+        """컨텍스트 교체 (처리 페이지 수 초과 또는 최초 생성)"""
+        await self._close_context(slot)
+        browser = await self._browser(slot.browser_index)
+        options = {"user_agent": self.user_agent} if self.user_agent else {}
+        context = await browser.new_context(**options)
+        if self.blocked_resource_types:
+            await context.route("**/*", self._route)
+        slot.context = context
+        slot.pages_served = 0
+
+    async def _route(self, route):
+        """이미지 / 폰트 / 미디어 요청 차단"""
+        if route.request.resource_type in self.blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @staticmethod
+    async def _close_context(slot: _ContextSlot):
+        if slot.context is not None:
+            try:
+                await slot.context.close()
+            except Exception:
+                pass
+        slot.context = None
+        slot.page = None
+        slot.pages_served = 0
@@ -0,0 +1,171 @@
+"""
+WeDealize Catalog Crawler
+공급사 웹사이트에서 카탈로그 / 가격표 파일 찾기 + 다운로드 (크롤 프런티어 기반)
+
+- 사이트마다 프런티어의 호스트 하위 큐를 우선순위 순으로 소비 (.pdf / /catalog 링크 먼저)
+- 한 번의 크롤링 안에서 이미 방문한 URL 은 다시 가져오지 않음 (Bloom filter), 중단되면 다음 실행에서 이어서 크롤링
+- 끝난 사이트를 다시 요청하면 처음부터 다시 크롤링 (HTTP 캐시로 바뀌지 않은 페이지는 재검증만)
+- 같은 호스트 링크만, 최대 깊이 / 페이지 수 / 파일 수 제한
+- 모든 요청은 크롤링 예절 정책(호스트 간격, robots.txt)을 거침
+"""
+
+import hashlib
+import logging
+import re
+from html import unescape
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from .frontier import CrawlFrontier, document_type, url_host
+from .http_cache import HttpCache
+from .politeness import PolitenessPolicy, RobotsDisallowed, RobotsUnavailable
+
+logger = logging.getLogger(__name__)
+
+
+# Content-Type → 파일 종류 (URL 확장자가 없는 다운로드 링크용)
+CONTENT_TYPES = {
+    "application/pdf": "pdf",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "excel",
+    "application/vnd.ms-excel": "excel",
+    "text/csv": "csv",
+}
+
+FILE_EXTENSIONS = {"pdf": ".pdf", "excel": ".xlsx", "csv": ".csv"}
+
+
+class CatalogCrawler:
+    """
+    카탈로그 파일 크롤러
+
+    crawler = CatalogCrawler(CrawlFrontier("./data/crawl_frontier.sqlite3"), "./downloads/catalogs")
+    catalogs = await crawler.crawl_site("https://supplier.com")
+    # → [{"file_path": ..., "file_url": ..., "file_type": "pdf", ...}]
+    """
+
+    HREF_PATTERN = re.compile(r'<a\s[^>]*?href\s*=\s*["\']([^"\'#]+)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+
+    def __init__(
+        self,
+        frontier: CrawlFrontier,
+        download_path: str = "./downloads/catalogs",
+        http_cache: Optional[HttpCache] = None,
+        politeness: Optional[PolitenessPolicy] = None,
+        timeout_seconds: float = 30,
+        max_pages_per_site: int = 30,
+        max_depth: int = 2,
+        max_documents_per_site: int = 10
+    ):
+        self.frontier = frontier
+        self.download_path = Path(download_path)
+        self.http_cache = http_cache
+        self.politeness = politeness or PolitenessPolicy()
+        self.timeout_seconds = timeout_seconds
+        self.max_pages_per_site = max_pages_per_site
+        self.max_depth = max_depth
+        self.max_documents_per_site = max_documents_per_site
+        self._client = None
+
+    async def _get_client(self):
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+                headers=self.politeness.headers
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def crawl_site(self, website: str, recrawl: bool = False) -> List[Dict]:
+        """
+        사이트 1곳 크롤링 → 다운로드한 카탈로그 파일 목록
+
+        Args:
+            recrawl: 중단된 크롤링이 남아 있어도 처음부터 (가격 갱신 등)
+        """
+        host = url_host(website)
+        # 대기 URL 이 남아 있으면 중단된 이전 크롤링을 이어서 진행
+        # 없으면 이전 크롤링이 끝난 것 → 새 세대로 처음부터 (방문 기록에 막혀 빈 결과가 되지 않도록,
+        # 바뀌지 않은 페이지는 HTTP 캐시 재검증으로 가볍게 처리)
+        if recrawl or not self.frontier.pending(host):
+            self.frontier.reset_host(host)
+            self.frontier.push(website, priority=100.0, force=True)
+
+        documents: List[Dict] = []
+        pages = 0
+        while pages < self.max_pages_per_site and len(documents) < self.max_documents_per_site:
+            item = self.frontier.pop(host=host)
+            if item is None:
+                break
+
+            try:
+                response = await self._fetch(item.url)
+                if response is not None and response.status_code == 200:
+                    content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+                    file_type = document_type(item.url) or CONTENT_TYPES.get(content_type)
+                    if file_type:
+                        documents.append(self._save_document(item.url, file_type, response.content))
+                    elif "html" in content_type:
+                        pages += 1
+                        if item.depth < self.max_depth:
+                            for link, text in self._extract_links(response.text, item.url):
+                                if url_host(link) == host:
+                                    self.frontier.push(link, depth=item.depth + 1, anchor_text=text)
+            except RobotsDisallowed:
+                logger.debug(f"robots.txt 금지 ({item.url})")
+            except RobotsUnavailable as e:
+                # robots.txt 를 받지 못함 → URL 을 대기열에 되돌리고 다음 실행에서 이어서
+                logger.info(f"카탈로그 크롤링 보류 ({host}): {e}")
+                self.frontier.done(item)
+                self.frontier.push(item.url, priority=item.priority, depth=item.depth, force=True, **item.meta)
+                break
+            except Exception as e:
+                logger.warning(f"카탈로그 크롤링 실패 ({item.url}): {e}")
+            # 취소되면 done() 하지 않음 → 재시작 시 다시 대기열로
+            self.frontier.done(item)
+
+        logger.info(f"카탈로그 크롤링 ({host}): 페이지 {pages}개, 파일 {len(documents)}개, 남은 URL {self.frontier.pending(host)}개")
+        return documents
+
+    async def _fetch(self, url: str):
+        client = await self._get_client()
+        return await self.politeness.fetch(client, url, http_cache=self.http_cache)
+
+    def _extract_links(self, html: str, base_url: str) -> List[Tuple[str, str]]:
+        """<a href> 링크 (절대 URL, 앵커 텍스트)"""
+        links = []
+        for href, inner in self.HREF_PATTERN.findall(html):
+            href = unescape(href.strip())
+            if href.startswith(("mailto:", "tel:", "javascript:")):
+                continue
+            url = urljoin(base_url, href)
+            if urlsplit(url).scheme not in ("http", "https"):
+                continue
+            text = " ".join(unescape(re.sub(r"<[^>]+>", " ", inner)).split())[:100]
+            links.append((url, text))
+        return links
+
+    def _save_document(self, url: str, file_type: str, content: bytes) -> Dict:
+        """다운로드한 파일 저장 (파일명 = URL 해시 + 원래 이름)"""
+        self.download_path.mkdir(parents=True, exist_ok=True)
+        original = Path(urlsplit(url).path).name or "catalog"
+        stem, suffix = Path(original).stem[:80], Path(original).suffix.lower()
+        if document_type(f"/{original}") is None:
+            suffix = FILE_EXTENSIONS[file_type]
+        file_name = f"{hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]}_{stem}{suffix}"
+
+        file_path = self.download_path / file_name
+        file_path.write_bytes(content)
+        return {
+            "file_path": str(file_path),
+            "file_url": url,
+            "file_name": original,
+            "file_type": file_type,
+            "file_size": len(content),
+        }
@@ -1,17 +1,113 @@
 """
 WeDealize Email Extractor
 공급사 웹사이트에서 대표 이메일 주소 추출
+
+- extract_from_website(url): 사이트 1곳
+- extract_many(urls): 수만 곳 일괄 처리 (전역 / 도메인별 동시 처리 수 제한, 사이트별 제한 시간,
+  일시적 오류 재시도, 끝나는 사이트부터 결과 스트리밍)
 """
 
 import re
+import sys
+import codecs
+import time
 import asyncio
-from typing import List, Dict, Optional, Set
-from dataclasses import dataclass
-from urllib.parse import urljoin, urlparse
+from collections import deque
+from pathlib import Path
+from typing import AsyncIterator, Deque, Dict, Iterable, List, Optional, Set
+from dataclasses import dataclass, field
+from urllib.parse import unquote, urljoin, urlparse
 import logging
 
+from ..services.metrics import track_stage
+from .browser_pool import BrowserPool
+from .frontier import url_host
+from .http_cache import HttpCache
+from .politeness import PolitenessPolicy, RobotsDisallowed, RobotsUnavailable
+
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원)
+    HTTP2_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    HTTP2_AVAILABLE = False
+
+
+# 재시도할 HTTP 상태 (일시적 오류)
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# 본문을 받을 Content-Type (헤더가 없으면 허용), 그 외(PDF, 이미지, 압축 파일 등)는 본문을 받기 전에 끊음
+HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml", "text/plain"})
+
+# 응답 헤더에 charset 이 없을 때 첫 청크에서 찾음
+_META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([a-zA-Z0-9_.:-]+)', re.IGNORECASE)
+
+# 스트리밍 응답에서 다시 만드는 응답에 넘기지 않을 헤더 (본문을 디코딩된 UTF-8 로 다시 싣기 때문)
+_BODY_HEADERS = frozenset({"content-type", "content-length", "content-encoding", "transfer-encoding"})
+
+
+class TransientFetchError(Exception):
+    """재시도하면 성공할 수 있는 요청 실패 (타임아웃, 연결 오류, 429 / 5xx, robots.txt 확인 불가)"""
+
+
+# ==================== HTML 스캔 (단일 패스) ====================
+
+_EMAIL = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_PHONE = r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}'
+
+# 링크 여는 태그 | 이메일 | 전화번호 를 한 번의 finditer 로 스캔
+# (뒤돌아보기로 단어 / 숫자 중간에서 매칭을 다시 시작하지 않음 → 긴 스크립트 / 스타일 블록에서도 빠름)
+HTML_TOKEN_PATTERN = re.compile(
+    r'<a\s[^>]*?href\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))[^>]*>'
+    r'|(?<![a-zA-Z0-9._%+-])(' + _EMAIL + r')'
+    r'|(?<![0-9])(' + _PHONE + r')',
+    re.IGNORECASE
+)
+# 링크 여는 태그 안 (mailto 표시 이름 / ?to= / 웹메일 작성 링크 / data-email·title 속성, href 의 전화번호)
+TAG_EMAIL_PATTERN = re.compile(r'(?<![a-zA-Z0-9._%+-])' + _EMAIL, re.IGNORECASE)
+TAG_PHONE_PATTERN = re.compile(r'(?<![0-9])' + _PHONE)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Contact 링크 텍스트 키워드
+CONTACT_TEXT_PATTERN = re.compile(r'contact|about|inquiry|enquiry|연락|문의', re.IGNORECASE)
+_FOOTER_PATTERN = re.compile(r'<footer\b', re.IGNORECASE)
+
+# 링크 텍스트는 여는 태그 뒤 이 길이 안에서만 찾음
+MAX_ANCHOR_TEXT = 2000
+
+# Contact 후보 링크 점수 (URL 경로 / 링크 텍스트 키워드 중 가장 높은 것 + 푸터 링크 가산)
+CONTACT_PATH_SCORES = (
+    ("contact", 100), ("inquiry", 90), ("enquiry", 90), ("get-in-touch", 80), ("reach-us", 80), ("about", 40),
+)
+CONTACT_TEXT_SCORES = (
+    ("contact", 60), ("연락", 60), ("문의", 60), ("inquiry", 50), ("enquiry", 50), ("about", 20),
+)
+FOOTER_LINK_BONUS = 10
+
+# 이 주소가 사이트와 같은 도메인에서 나오면 더 찾지 않음
+PRIORITY_EMAIL_PREFIXES = ("sales", "export")
+
+
+def is_priority_email(email: str, site_domain: str) -> bool:
+    """사이트 도메인(하위 도메인 포함)의 sales@ / export@ 주소인지"""
+    local, _, domain = email.lower().partition("@")
+    if not local.startswith(PRIORITY_EMAIL_PREFIXES) or not site_domain:
+        return False
+    return domain == site_domain or domain.endswith("." + site_domain)
+
+
+@dataclass
+class HtmlScan:
+    """HTML 1페이지 스캔 결과"""
+    emails: List[str]
+    phones: List[str]
+    contact_candidates: List[str] = field(default_factory=list)  # 같은 사이트 Contact 후보 (점수순)
+
+    @property
+    def contact_page_url(self) -> Optional[str]:
+        return self.contact_candidates[0] if self.contact_candidates else None
+
 
 @dataclass
 class ExtractedContact:
@@ -44,6 +140,16 @@ class ExtractedContact:
         return self.emails[0]
 
 
+@dataclass
+class SiteExtraction:
+    """extract_many 결과 1건"""
+    url: str
+    contact: ExtractedContact
+    status: str          # "found", "not_found", "failed", "timeout"
+    attempts: int = 1
+    error: Optional[str] = None
+
+
 class EmailExtractor:
     """
     웹사이트에서 이메일 주소 추출
@@ -80,6 +186,9 @@ class EmailExtractor:
         r'/reach-us',
     ]
 
+    # 위 패턴을 하나로 합친 정규식 (링크마다 패턴 10개를 따로 검사하지 않음)
+    CONTACT_URL_PATTERN = re.compile("|".join(CONTACT_URL_PATTERNS))
+
     # 제외할 이메일 도메인 (일반적인 이메일 서비스)
     EXCLUDED_DOMAINS = {
         'example.com', 'test.com', 'email.com',
@@ -88,12 +197,81 @@ class EmailExtractor:
         'wixpress.com', 'squarespace.com',
     }
 
-    def __init__(self, browser_client=None):
+    def __init__(
+        self,
+        browser_client=None,
+        browser_pool: Optional[BrowserPool] = None,
+        http_cache: Optional[HttpCache] = None,
+        politeness: Optional[PolitenessPolicy] = None,
+        timeout_seconds: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: float = 30.0,
+        http2: Optional[bool] = None,
+        max_contact_pages: int = 3,
+        max_page_bytes: int = 2 * 1024 * 1024,
+        stop_after_footer: bool = False
+    ):
         """
         Args:
-            browser_client: Playwright 또는 Selenium 브라우저 클라이언트
+            browser_client: Playwright 또는 Selenium 브라우저 클라이언트 (URL마다 페이지 생성)
+            browser_pool: 공유 브라우저 풀 (있으면 browser_client 대신 사용)
+            http_cache: 디스크 HTTP 캐시 (httpx 요청에 적용)
+            politeness: 크롤링 예절 정책 (호스트 간격, 전역 동시 요청 수, robots.txt, User-Agent)
+            max_connections / max_keepalive_connections / keepalive_expiry_seconds: httpx 연결 풀 설정
+            http2: HTTP/2 사용 여부 (None = h2 패키지가 설치되어 있으면 사용)
+            max_contact_pages: 동시에 가져올 Contact 후보 페이지 수 (점수 상위)
+            max_page_bytes: 페이지 1개 최대 수신 크기 (초과분은 받지 않음)
+            stop_after_footer: 페이지 푸터 이후(</body> 뒤 스크립트 등)는 받지 않음
+                (본문 중간의 <article> 푸터는 페이지 푸터가 아니므로 </body> 에서만 멈춤)
         """
         self.browser_client = browser_client
+        self.browser_pool = browser_pool
+        self.http_cache = http_cache
+        self.politeness = politeness or PolitenessPolicy()
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry_seconds = keepalive_expiry_seconds
+        self.http2 = HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+        self.max_contact_pages = max_contact_pages
+        self.max_page_bytes = max_page_bytes
+        self.stop_after_footer = stop_after_footer
+        self._client = None
+
+    async def _get_client(self):
+        """
+        공유 httpx 클라이언트 (첫 요청 때 생성)
+
+        모든 extract_from_website 호출이 같은 연결 풀을 쓰므로, 같은 사이트의 메인 / Contact 페이지는
+        keep-alive 연결(HTTP/2 면 다중화)을 재사용해 DNS / TCP / TLS 설정을 다시 하지 않습니다.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+                headers=self.politeness.headers,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry_seconds
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "EmailExtractor":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
 
     async def extract_from_website(self, url: str) -> ExtractedContact:
         """
@@ -102,131 +280,463 @@ class EmailExtractor:
         Args:
             url: 공급사 웹사이트 URL
         """
+        with track_stage("email_extract", source=self._source) as t:
+            try:
+                contact = await self._extract(url)
+                t.add_items(len(contact.emails))
+                return contact
+            except Exception as e:
+                t.fail()
+                logger.error(f"이메일 추출 실패 ({url}): {e}")
+                return ExtractedContact(emails=[], phones=[], confidence_score=0.0)
+
+    @property
+    def _source(self) -> str:
+        return "browser" if self.browser_pool or self.browser_client else "httpx"
+
+    async def _extract(self, url: str, raise_transient: bool = False) -> ExtractedContact:
+        """
+        메인 페이지 + Contact 후보 페이지 스캔
+
+        Args:
+            raise_transient: 메인 페이지가 일시적 오류로 실패하면 TransientFetchError (재시도용)
+        """
         all_emails: Set[str] = set()
         all_phones: Set[str] = set()
         contact_page_url = None
 
+        site_domain = url_host(url)
+
+        # 1. 메인 페이지 스캔 (이메일 / 전화번호 / Contact 후보 링크를 한 번에)
+        candidates: List[str] = []
+        main_page_html = await self._fetch_page(url, raise_transient=raise_transient)
+        if main_page_html:
+            scan = self._scan_html(main_page_html, url)
+            all_emails.update(scan.emails)
+            all_phones.update(scan.phones)
+            candidates = scan.contact_candidates[:self.max_contact_pages]
+            contact_page_url = scan.contact_page_url
+
+        # 2. Contact 후보 페이지 동시 스캔 (메인 페이지에 같은 도메인 sales@ / export@ 가 있으면 생략)
+        if candidates and not any(is_priority_email(e, site_domain) for e in all_emails):
+            found_on = await self._scan_contact_pages(candidates, site_domain, all_emails, all_phones)
+            contact_page_url = found_on or contact_page_url
+
+        # 3. 이메일 필터링 및 정리
+        filtered_emails = self._filter_emails(list(all_emails), url)
+
+        # 4. 신뢰도 점수 계산
+        confidence = self._calculate_confidence(filtered_emails, contact_page_url)
+
+        return ExtractedContact(
+            emails=filtered_emails,
+            phones=list(all_phones)[:5],  # 상위 5개만
+            contact_page_url=contact_page_url,
+            confidence_score=confidence
+        )
+
+    async def _scan_contact_pages(
+        self,
+        candidates: List[str],
+        site_domain: str,
+        emails: Set[str],
+        phones: Set[str]
+    ) -> Optional[str]:
+        """
+        Contact 후보 페이지를 동시에 가져와 스캔 (emails / phones 에 누적)
+
+        같은 도메인 sales@ / export@ 주소가 나오면 남은 요청은 취소합니다.
+
+        Returns:
+            이메일이 나온 후보 중 점수가 가장 높은 페이지 URL
+        """
+        tasks = {asyncio.ensure_future(self._fetch_page(candidate)): candidate for candidate in candidates}
+        pending = set(tasks)
+        found_on: Optional[str] = None
         try:
-            # 1. 메인 페이지 스캔
-            main_page_html = await self._fetch_page(url)
-            if main_page_html:
-                emails, phones = self._extract_from_html(main_page_html)
-                all_emails.update(emails)
-                all_phones.update(phones)
-
-                # Contact 페이지 링크 찾기
-                contact_page_url = self._find_contact_page_url(main_page_html, url)
-
-            # 2. Contact 페이지 스캔
-            if contact_page_url:
-                contact_html = await self._fetch_page(contact_page_url)
-                if contact_html:
-                    emails, phones = self._extract_from_html(contact_html)
-                    all_emails.update(emails)
-                    all_phones.update(phones)
-
-            # 3. 이메일 필터링 및 정리
-            filtered_emails = self._filter_emails(list(all_emails), url)
-
-            # 4. 신뢰도 점수 계산
-            confidence = self._calculate_confidence(filtered_emails, contact_page_url)
-
-            return ExtractedContact(
-                emails=filtered_emails,
-                phones=list(all_phones)[:5],  # 상위 5개만
-                contact_page_url=contact_page_url,
-                confidence_score=confidence
-            )
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    html = task.result()
+                    if not html:
+                        continue
+                    page_url = tasks[task]
+                    scan = self._scan_html(html, page_url, find_contact=False)
+                    emails.update(scan.emails)
+                    phones.update(scan.phones)
+                    if scan.emails and (found_on is None or candidates.index(page_url) < candidates.index(found_on)):
+                        found_on = page_url
+                if any(is_priority_email(e, site_domain) for e in emails):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return found_on
 
-        except Exception as e:
-            logger.error(f"이메일 추출 실패 ({url}): {e}")
-            return ExtractedContact(emails=[], phones=[], confidence_score=0.0)
+    # ==================== 일괄 추출 ====================
+
+    async def extract_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 50,
+        per_domain: int = 2,
+        deadline_seconds: float = 60.0,
+        retries: int = 2,
+        retry_backoff_seconds: float = 2.0
+    ) -> AsyncIterator[SiteExtraction]:
+        """
+        여러 사이트 일괄 추출, 끝나는 사이트부터 결과를 yield
 
-    async def _fetch_page(self, url: str) -> Optional[str]:
-        """페이지 HTML 가져오기"""
-        if self.browser_client:
+        async for result in extractor.extract_many(websites, concurrency=100):
+            save(result.url, result.contact.primary_email)
+
+        urls 는 필요한 만큼만 꺼내 쓰므로 DB 조회 제너레이터를 그대로 넘겨도 됩니다 (중복 제거는 호출 측에서).
+        실제 요청 수는 크롤링 예절 정책(politeness)의 호스트 간격 / 전역 동시 요청 수로 한 번 더 제한됩니다.
+
+        Args:
+            concurrency: 동시에 처리하는 사이트 수
+            per_domain: 같은 도메인(www 제외 호스트) 동시 처리 사이트 수
+            deadline_seconds: 사이트 1곳 제한 시간 (재시도 포함), 초과 시 status="timeout"
+            retries: 일시적 오류(타임아웃, 연결 오류, 429 / 5xx) 재시도 횟수 (지수 백오프)
+        """
+        source = iter(urls)
+        exhausted = False
+        deferred: Deque[str] = deque()  # 도메인 한도에 걸려 미뤄둔 URL
+        active: Dict[str, int] = {}
+        running: Dict[asyncio.Task, str] = {}
+
+        def next_url() -> Optional[str]:
+            """도메인 한도에 여유가 있는 다음 URL (미뤄둔 것 먼저)"""
+            nonlocal exhausted
+            for _ in range(len(deferred)):
+                url = deferred.popleft()
+                if active.get(url_host(url), 0) < per_domain:
+                    return url
+                deferred.append(url)
+            # 한 도메인에 몰린 입력이 전부 메모리로 올라오지 않도록 미뤄둔 URL 수 제한
+            while not exhausted and len(deferred) < concurrency * 4:
+                url = next(source, None)
+                if url is None:
+                    exhausted = True
+                    break
+                if not url:
+                    continue
+                if active.get(url_host(url), 0) < per_domain:
+                    return url
+                deferred.append(url)
+            return None
+
+        try:
+            while True:
+                while len(running) < concurrency:
+                    url = next_url()
+                    if url is None:
+                        break
+                    host = url_host(url)
+                    active[host] = active.get(host, 0) + 1
+                    running[asyncio.ensure_future(self._extract_site(url, deadline_seconds, retries, retry_backoff_seconds))] = host
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    host = running.pop(task)
+                    active[host] -= 1
+                    if not active[host]:
+                        del active[host]
+                    yield task.result()
+        finally:
+            # 소비자가 중간에 멈추면 남은 작업 취소
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _extract_site(
+        self,
+        url: str,
+        deadline_seconds: float,
+        retries: int,
+        retry_backoff_seconds: float
+    ) -> SiteExtraction:
+        """사이트 1곳 (제한 시간 + 일시적 오류 재시도), 예외 없이 결과 반환"""
+        attempts = 0
+
+        async def attempt_loop() -> ExtractedContact:
+            nonlocal attempts
+            while True:
+                attempts += 1
+                try:
+                    return await self._extract(url, raise_transient=True)
+                except TransientFetchError:
+                    if attempts > retries:
+                        raise
+                    await asyncio.sleep(retry_backoff_seconds * 2 ** (attempts - 1))
+
+        with track_stage("email_extract", source=self._source) as t:
+            try:
+                contact = await asyncio.wait_for(attempt_loop(), deadline_seconds)
+            except asyncio.TimeoutError:
+                t.fail()
+                return SiteExtraction(url, self._empty(), "timeout", attempts, f"deadline {deadline_seconds:.0f}s exceeded")
+            except Exception as e:
+                t.fail()
+                logger.warning(f"이메일 추출 실패 ({url}, {attempts}회 시도): {e}")
+                return SiteExtraction(url, self._empty(), "failed", attempts, str(e)[:500])
+
+            t.add_items(len(contact.emails))
+            return SiteExtraction(url, contact, "found" if contact.emails else "not_found", attempts)
+
+    @staticmethod
+    def _empty() -> ExtractedContact:
+        return ExtractedContact(emails=[], phones=[], confidence_score=0.0)
+
+    async def _fetch_page(self, url: str, raise_transient: bool = False) -> Optional[str]:
+        """
+        페이지 HTML 가져오기 (실패 시 None)
+
+        Args:
+            raise_transient: httpx 요청이 일시적 오류로 실패하면 None 대신 TransientFetchError
+                (브라우저 사용 시에는 robots.txt 확인 불가만)
+        """
+        if raise_transient and (self.browser_pool or self.browser_client):
+            try:
+                await self.politeness.allowed(url)
+            except RobotsUnavailable as e:
+                raise TransientFetchError(str(e)) from e
+
+        if self.browser_pool:
+            # 공유 브라우저 풀 (컨텍스트/페이지 재사용, 이미지·폰트 차단)
+            return await self.browser_pool.fetch_html(url, wait_until="networkidle", politeness=self.politeness)
+        elif self.browser_client:
             # Playwright 사용
             return await self._fetch_with_browser(url)
         else:
             # 간단한 HTTP 요청
-            return await self._fetch_with_httpx(url)
+            return await self._fetch_with_httpx(url, raise_transient=raise_transient)
 
-    async def _fetch_with_httpx(self, url: str) -> Optional[str]:
-        """httpx로 페이지 가져오기"""
-        try:
-            import httpx
+    async def _fetch_with_httpx(self, url: str, raise_transient: bool = False) -> Optional[str]:
+        """httpx로 페이지 가져오기 (크기 제한 스트리밍)"""
+        import httpx
 
-            async with httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                }
-            ) as client:
-                response = await client.get(url)
-                if response.status_code == 200:
-                    return response.text
+        try:
+            client = await self._get_client()
+            response = await self.politeness.fetch(
+                client,
+                url,
+                http_cache=self.http_cache,
+                send=lambda headers: self._stream_get(client, url, headers)
+            )
+        except RobotsDisallowed:
+            logger.info(f"robots.txt 금지 ({url})")
+            return None
+        except RobotsUnavailable as e:
+            # robots.txt 를 받지 못함 → "이메일 없음"이 아니라 일시적 실패
+            if raise_transient:
+                raise TransientFetchError(str(e)) from e
+            logger.info(f"robots.txt 확인 불가, 요청 보류 ({url}): {e}")
+            return None
+        except httpx.TransportError as e:
+            # 타임아웃 / 연결 오류
+            if raise_transient:
+                raise TransientFetchError(f"{type(e).__name__}: {e}") from e
+            logger.warning(f"HTTP 요청 실패 ({url}): {e}")
+            return None
         except Exception as e:
             logger.warning(f"HTTP 요청 실패 ({url}): {e}")
+            return None
+
+        if response.extensions.get("rejected"):
+            logger.debug(f"HTML 아님, 본문 생략 ({url}): {response.extensions['rejected']}")
+            return None
+        if response.status_code == 200:
+            return response.text
+        if raise_transient and response.status_code in TRANSIENT_STATUS_CODES:
+            raise TransientFetchError(f"HTTP {response.status_code}")
         return None
 
+    async def _stream_get(self, client, url: str, headers: Dict[str, str]):
+        """
+        크기 제한 스트리밍 GET → httpx.Response
+
+        - 200 이 아니거나 HTML / 텍스트가 아니면 본문을 읽지 않음 (Content-Type 거부 시 extensions["rejected"])
+        - max_page_bytes 까지만 받으며 청크마다 점진적으로 디코딩 (연결당 메모리 상한)
+        - stop_after_footer 면 </body> 이후는 받지 않음
+        - 본문은 UTF-8 로 다시 실어 반환, 잘린 응답은 extensions["partial"] (HTTP 캐시에 저장 안 함)
+        """
+        import httpx
+
+        async with client.stream("GET", url, headers=headers) as response:
+            kept_headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _BODY_HEADERS]
+            mime = response.headers.get("content-type", "").split(";")[0].strip().lower()
+
+            if response.status_code != 200:
+                return httpx.Response(response.status_code, headers=kept_headers, request=response.request)
+            if mime and mime not in HTML_CONTENT_TYPES:
+                return httpx.Response(
+                    response.status_code,
+                    headers=kept_headers,
+                    request=response.request,
+                    extensions={"partial": True, "rejected": mime}
+                )
+
+            length = response.headers.get("content-length")
+            if length and length.isdigit() and int(length) > self.max_page_bytes:
+                logger.debug(f"페이지 크기 {int(length) / 1e6:.1f}MB, 앞 {self.max_page_bytes / 1e6:.1f}MB 만 받음 ({url})")
+
+            decoder = None
+            parts: List[str] = []
+            received = 0
+            partial = False
+            tail = ""  # 청크 경계에 걸친 </body 확인용
+
+            async for chunk in response.aiter_bytes():
+                if received + len(chunk) > self.max_page_bytes:
+                    chunk = chunk[:self.max_page_bytes - received]
+                    partial = True
+                received += len(chunk)
+
+                if decoder is None:
+                    decoder = self._incremental_decoder(response.charset_encoding, chunk)
+                text = decoder.decode(chunk)
+                parts.append(text)
+
+                if self.stop_after_footer and not partial:
+                    window = (tail + text).lower()
+                    if "</body" in window:
+                        partial = True
+                    tail = window[-6:]
+
+                if partial:
+                    break
+
+            if decoder is not None:
+                parts.append(decoder.decode(b"", final=True))
+
+        return httpx.Response(
+            200,
+            headers=kept_headers + [("content-type", f"{mime or 'text/html'}; charset=utf-8")],
+            content="".join(parts).encode("utf-8"),
+            request=response.request,
+            extensions={"partial": partial}
+        )
+
+    @staticmethod
+    def _incremental_decoder(charset: Optional[str], first_chunk: bytes):
+        """응답 charset → 없으면 <meta charset> → 없으면 UTF-8 (잘못된 바이트는 대체 문자)"""
+        if not charset:
+            match = _META_CHARSET_PATTERN.search(first_chunk[:4096])
+            charset = match.group(1).decode("ascii", "ignore") if match else "utf-8"
+        try:
+            return codecs.getincrementaldecoder(charset)(errors="replace")
+        except LookupError:
+            return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
     async def _fetch_with_browser(self, url: str) -> Optional[str]:
         """Playwright로 페이지 가져오기 (JS 렌더링 지원)"""
         try:
             page = await self.browser_client.new_page()
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            html = await page.content()
-            await page.close()
-            return html
+            try:
+                async with self.politeness.slot(url):
+                    await page.goto(url, wait_until="networkidle", timeout=30000)
+                return await page.content()
+            finally:
+                await page.close()
+        except RobotsDisallowed:
+            logger.info(f"robots.txt 금지 ({url})")
         except Exception as e:
             logger.warning(f"브라우저 요청 실패 ({url}): {e}")
         return None
 
-    def _extract_from_html(self, html: str) -> tuple[List[str], List[str]]:
-        """HTML에서 이메일과 전화번호 추출"""
-        # 이메일 추출
-        emails = self.EMAIL_PATTERN.findall(html)
-
-        # mailto: 링크에서 추가 추출
-        mailto_pattern = re.compile(r'mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
-        mailto_emails = mailto_pattern.findall(html)
-        emails.extend(mailto_emails)
-
-        # 중복 제거
-        emails = list(set(emails))
+    def _scan_html(self, html: str, base_url: str, find_contact: bool = True) -> HtmlScan:
+        """
+        HTML 단일 패스 스캔: 이메일, 전화번호, Contact 후보 링크
 
-        # 전화번호 추출
-        phones = self.PHONE_PATTERN.findall(html)
-        # 너무 짧은 것 제외
-        phones = [p for p in phones if len(re.sub(r'\D', '', p)) >= 8]
+        DOM 을 만들지 않고 HTML_TOKEN_PATTERN 하나로 문서를 한 번만 훑습니다.
+        Contact 후보는 같은 사이트 링크 중 URL 경로 / 링크 텍스트 키워드 점수순(푸터 링크 가산, 동점이면 문서 순서)입니다.
+        """
+        emails: Dict[str, None] = {}
+        phones: List[str] = []
+        candidates: Dict[str, tuple] = {}  # URL → (점수, 문서 순서)
+
+        site_domain = url_host(base_url) if find_contact else ""
+        footer_start = len(html)
+        if find_contact:
+            for footer in _FOOTER_PATTERN.finditer(html):
+                footer_start = footer.start()
+
+        for match in HTML_TOKEN_PATTERN.finditer(html):
+            href, single_quoted, bare, email, phone = match.groups()
+            if email:
+                emails[email] = None
+            elif phone:
+                # 너무 짧은 것 제외
+                if sum(c.isdigit() for c in phone) >= 8:
+                    phones.append(phone)
+            else:
+                href = (href if href is not None else single_quoted if single_quoted is not None else bare).strip()
+                # 여는 태그는 통째로 소비되므로 태그 안 이메일 / href 전화번호는 여기서 처리
+                tag = match.group(0)
+                if "@" in tag:
+                    for address in TAG_EMAIL_PATTERN.findall(tag):
+                        emails[address] = None
+                decoded_href = unquote(href) if "%" in href else href
+                if decoded_href is not href and "@" in decoded_href:
+                    for address in TAG_EMAIL_PATTERN.findall(decoded_href):
+                        emails[address] = None
+                if decoded_href[:4].lower() == "tel:":
+                    phone = decoded_href[4:].strip()
+                    if sum(c.isdigit() for c in phone) >= 8:
+                        phones.append(phone)
+                else:
+                    for phone in TAG_PHONE_PATTERN.findall(decoded_href):
+                        if sum(c.isdigit() for c in phone) >= 8:
+                            phones.append(phone)
+
+                if find_contact and href:
+                    score = self._contact_link_score(href, html, match.end())
+                    if score:
+                        link = urljoin(base_url, href).split("#", 1)[0]
+                        if link.rstrip("/") == base_url.rstrip("/") or url_host(link) != site_domain:
+                            continue
+                        if match.start() >= footer_start:
+                            score += FOOTER_LINK_BONUS
+                        previous = candidates.get(link)
+                        if previous is None or score > previous[0]:
+                            candidates[link] = (score, previous[1] if previous else len(candidates))
+
+        ranked = sorted(candidates, key=lambda link: (-candidates[link][0], candidates[link][1]))
+        return HtmlScan(emails=list(emails), phones=phones, contact_candidates=ranked)
+
+    def _contact_link_score(self, href: str, html: str, start: int) -> int:
+        """Contact 후보 링크 점수 (0 = 후보 아님)"""
+        score = 0
+        href_lower = href.lower()
+        if href_lower.startswith(("mailto:", "tel:", "javascript:", "#")):
+            return 0
+        if self.CONTACT_URL_PATTERN.search(href_lower):
+            score = max((points for keyword, points in CONTACT_PATH_SCORES if keyword in href_lower), default=0)
+
+        # 링크 텍스트 (원문에 키워드가 있을 때만 태그를 걷어내고 확인)
+        end = html.find("</a>", start, start + MAX_ANCHOR_TEXT)
+        if end > start and CONTACT_TEXT_PATTERN.search(html, start, end):
+            text = _TAG_PATTERN.sub(" ", html[start:end]).lower()
+            for keyword, points in CONTACT_TEXT_SCORES:
+                if keyword in text:
+                    score = max(score, points)
+        return score
 
-        return emails, phones
+    def _extract_from_html(self, html: str) -> tuple[List[str], List[str]]:
+        """HTML에서 이메일과 전화번호 추출"""
+        scan = self._scan_html(html, "", find_contact=False)
+        return scan.emails, scan.phones
 
     def _find_contact_page_url(self, html: str, base_url: str) -> Optional[str]:
         """Contact 페이지 URL 찾기"""
-        from bs4 import BeautifulSoup
-
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # 모든 링크 검사
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '').lower()
-                text = link.get_text().lower()
-
-                # URL 패턴 매칭
-                for pattern in self.CONTACT_URL_PATTERNS:
-                    if re.search(pattern, href):
-                        return urljoin(base_url, link['href'])
-
-                # 링크 텍스트 매칭
-                if any(word in text for word in ['contact', 'about', 'inquiry', '연락', '문의']):
-                    return urljoin(base_url, link['href'])
-
-        except Exception as e:
-            logger.warning(f"Contact 페이지 찾기 실패: {e}")
-
-        return None
+        return self._scan_html(html, base_url).contact_page_url
 
     def _filter_emails(self, emails: List[str], source_url: str) -> List[str]:
         """이메일 필터링 및 우선순위 정렬"""
@@ -297,14 +807,71 @@ class EmailExtractor:
         return min(score, 1.0)
 
 
+def _legacy_scan(extractor: EmailExtractor, html: str, base_url: str) -> HtmlScan:
+    """이전 구현 (패턴별 정규식 + BeautifulSoup html.parser 링크 순회), 벤치마크 비교용"""
+    from bs4 import BeautifulSoup
+
+    emails = extractor.EMAIL_PATTERN.findall(html)
+    emails.extend(re.compile(r'mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})').findall(html))
+    phones = [p for p in extractor.PHONE_PATTERN.findall(html) if len(re.sub(r'\D', '', p)) >= 8]
+
+    contact_page_url = None
+    soup = BeautifulSoup(html, 'html.parser')
+    for link in soup.find_all('a', href=True):
+        href = link.get('href', '').lower()
+        text = link.get_text().lower()
+        if any(re.search(pattern, href) for pattern in extractor.CONTACT_URL_PATTERNS) or \
+                any(word in text for word in ['contact', 'about', 'inquiry', '연락', '문의']):
+            contact_page_url = urljoin(base_url, link['href'])
+            break
+    return HtmlScan(emails=list(set(emails)), phones=phones, contact_candidates=[contact_page_url] if contact_page_url else [])
+
+
+def benchmark(pages: Dict[str, str], repeat: int = 5):
+    """이전 구현 vs 단일 패스 스캔 (페이지별 평균 시간, 결과 일치 여부)"""
+    extractor = EmailExtractor()
+    for name, html in pages.items():
+        base_url = name if name.startswith(("http://", "https://")) else "https://example.com/"
+        timings = {}
+        for label, scan in (("legacy", lambda: _legacy_scan(extractor, html, base_url)),
+                            ("single_pass", lambda: extractor._scan_html(html, base_url))):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = scan()
+            timings[label] = ((time.perf_counter() - start) / repeat, result)
+
+        (legacy_time, legacy), (fast_time, fast) = timings["legacy"], timings["single_pass"]
+        print(
+            f"{name} ({len(html) / 1024:.0f}KB): 이전 {legacy_time * 1000:.1f}ms, "
+            f"단일 패스 {fast_time * 1000:.1f}ms (x{legacy_time / fast_time:.1f}), "
+            f"이메일 일치: {set(legacy.emails) == set(fast.emails)}, "
+            f"Contact 링크: {legacy.contact_page_url} → {fast.contact_candidates[:3]}"
+        )
+
+
 # 테스트
+# python -m backend.crawlers.email_extractor                                   → 사이트 1곳 추출
+# python -m backend.crawlers.email_extractor --benchmark page.html https://...   → HTML 스캔 벤치마크
 async def main():
-    extractor = EmailExtractor()
+    args = sys.argv[1:]
+    if args and args[0] == "--benchmark":
+        pages: Dict[str, str] = {}
+        async with EmailExtractor() as extractor:
+            for target in args[1:]:
+                if target.startswith(("http://", "https://")):
+                    html = await extractor._fetch_page(target)
+                else:
+                    html = Path(target).read_text(encoding="utf-8", errors="replace")
+                if html:
+                    pages[target] = html
+        benchmark(pages)
+        return
 
     # 테스트 URL (실제 공급사 사이트로 교체)
     test_url = "https://example.com"
 
-    result = await extractor.extract_from_website(test_url)
+    async with EmailExtractor() as extractor:
+        result = await extractor.extract_from_website(test_url)
     print(f"추출된 이메일: {result.emails}")
     print(f"대표 이메일: {result.primary_email}")
     print(f"신뢰도: {result.confidence_score:.2f}")
@@ -0,0 +1,314 @@
+"""
+WeDealize HTTP Cache
+크롤러 공용 디스크 HTTP 응답 캐시
+
+- Cache-Control(max-age / no-cache / no-store), Expires 준수
+- 만료된 항목은 ETag / Last-Modified 로 조건부 재검증 (304 → 본문 재사용)
+- 본문은 gzip 압축 후 sha256 으로 저장 (같은 본문은 URL 이 달라도 1개 파일)
+- 전체 본문 크기 상한 초과 시 오래 안 쓴 항목부터 삭제 (LRU)
+- 오프라인 재생 모드: 네트워크 없이 캐시만으로 응답 (없으면 504), 재실행 / 테스트용
+
+cache = HttpCache("./data/http_cache", max_bytes=512 * 1024 * 1024)
+async with httpx.AsyncClient() as client:
+    response = await cache.fetch(client, "https://supplier.com/contact")
+    response.extensions["from_cache"]  # True / False
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# 저장할 응답 헤더 (재생 시 Content-Type 으로 인코딩 판별)
+STORED_HEADERS = ("content-type", "cache-control", "expires", "etag", "last-modified", "date", "content-language")
+
+# 검증자만 있고 만료 정보가 없을 때의 최대 휴리스틱 유효 기간 (Last-Modified 경과 시간의 10%)
+MAX_HEURISTIC_TTL = 86400
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*(s-maxage|max-age)\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def freshness(headers: Dict[str, str], now: float) -> Tuple[bool, float]:
+    """
+    응답 캐시 가능 여부와 만료 시각
+
+    Returns:
+        (저장 여부, 만료 시각 epoch) - 만료 시각이 now 이하면 매번 재검증
+    """
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control or headers.get("vary", "").strip() == "*":
+        return False, now
+    if "no-cache" in cache_control:
+        return True, now
+
+    ages = dict((name.lower(), int(value)) for name, value in _MAX_AGE.findall(cache_control))
+    if ages:
+        return True, now + ages.get("s-maxage", ages.get("max-age", 0))
+
+    expires = _http_date(headers.get("expires"))
+    if expires is not None:
+        date = _http_date(headers.get("date")) or now
+        return True, now + max(0.0, expires - date)
+
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        return True, now + min(MAX_HEURISTIC_TTL, max(0.0, (now - last_modified) * 0.1))
+
+    # 만료 정보 없음: 저장은 하되 매번 재검증 (검증자가 없으면 다시 받음)
+    return True, now
+
+
+class HttpCache:
+    """
+    디스크 HTTP 캐시 (인덱스 = sqlite3, 본문 = blobs/ab/abcdef....gz)
+    """
+
+    def __init__(
+        self,
+        path: str = "./data/http_cache",
+        max_bytes: int = 512 * 1024 * 1024,
+        offline: bool = False
+    ):
+        """
+        Args:
+            max_bytes: 압축된 본문 전체 크기 상한 (초과 시 LRU 삭제)
+            offline: True 면 네트워크 요청 없이 캐시만 사용 (만료 무시, 없으면 504)
+        """
+        self.path = Path(path)
+        self.blob_dir = self.path / "blobs"
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path / "index.sqlite3"), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body_hash TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_entries_last_access ON entries (last_access);
+            CREATE INDEX IF NOT EXISTS ix_entries_body_hash ON entries (body_hash);
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+        # 통계 (프로세스 단위)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    # ==================== 요청 ====================
+
+    async def fetch(
+        self,
+        client: "httpx.AsyncClient",
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        send: Optional[Callable[[Dict[str, str]], Awaitable["httpx.Response"]]] = None
+    ) -> "httpx.Response":
+        """
+        캐시를 거친 GET
+
+        신선한 항목은 그대로, 만료된 항목은 조건부 요청으로 재검증, 없으면 새로 받아 저장합니다.
+        반환 응답의 extensions["from_cache"] 로 캐시 사용 여부를 알 수 있습니다.
+
+        Args:
+            send: 실제 네트워크 요청 함수 (요청 헤더 → 응답), 기본은 client.get
+                  - 크롤링 예절 정책(politeness.py)이 캐시 적중 시에는 토큰을 쓰지 않도록 주입
+        """
+        import httpx
+
+        now = time.time()
+        entry = self._lookup(url)
+
+        if self.offline:
+            if entry is None:
+                self.misses += 1
+                return httpx.Response(504, request=httpx.Request("GET", url), extensions={"from_cache": False})
+            self.hits += 1
+            return self._replay(url, entry, now)
+
+        if entry is not None and entry["expires_at"] > now:
+            self.hits += 1
+            return self._replay(url, entry, now)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry["headers"].get("etag"):
+                request_headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                request_headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        if send is not None:
+            response = await send(request_headers)
+        else:
+            response = await client.get(url, headers=request_headers)
+
+        if response.status_code == 304 and entry is not None:
+            self.revalidated += 1
+            merged = {**entry["headers"], **self._stored_headers(response.headers)}
+            _, expires_at = freshness(merged, now)
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE entries SET headers = ?, expires_at = ?, last_access = ? WHERE url = ?",
+                    (json.dumps(merged), expires_at, now, url)
+                )
+                self._conn.commit()
+            entry["headers"] = merged
+            return self._replay(url, entry, now, touch=False)
+
+        self.misses += 1
+        if response.status_code == 200 and not response.extensions.get("partial"):
+            # 크기 제한 / 조기 종료로 잘린 본문(extensions["partial"])은 저장하지 않음
+            self.store(url, response)
+        response.extensions = {**response.extensions, "from_cache": False}
+        return response
+
+    # ==================== 저장 / 조회 ====================
+
+    def store(self, url: str, response: "httpx.Response"):
+        """200 응답 저장 (Cache-Control: no-store 는 저장 안 함)"""
+        now = time.time()
+        stored_headers = self._stored_headers(response.headers)
+        cacheable, expires_at = freshness({**stored_headers, "vary": response.headers.get("vary", "")}, now)
+        if not cacheable:
+            return
+
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(body_hash)
+
+        with self._lock:
+            known = self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (body_hash,)).fetchone()
+            if not known:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                compressed = gzip.compress(body, compresslevel=6)
+                tmp_path = blob_path.with_suffix(".tmp")
+                tmp_path.write_bytes(compressed)
+                os.replace(tmp_path, blob_path)
+                self._conn.execute("INSERT INTO blobs (hash, size) VALUES (?, ?)", (body_hash, len(compressed)))
+                self._total_bytes += len(compressed)
+
+            previous = self._conn.execute("SELECT body_hash FROM entries WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (url, status, headers, body_hash, stored_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, json.dumps(stored_headers), body_hash, now, expires_at, now)
+            )
+            if previous and previous[0] != body_hash:
+                self._drop_orphan_blobs([previous[0]])
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _lookup(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body_hash, expires_at FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"status": row[0], "headers": json.loads(row[1]), "body_hash": row[2], "expires_at": row[3]}
+
+    def _replay(self, url: str, entry: Dict, now: float, touch: bool = True) -> "httpx.Response":
+        """캐시 항목 → httpx.Response (본문 파일이 없으면 504)"""
+        import httpx
+
+        try:
+            body = gzip.decompress(self._blob_path(entry["body_hash"]).read_bytes())
+        except (OSError, EOFError) as e:
+            logger.warning(f"HTTP 캐시 본문 손상 ({url}): {e}")
+            return httpx.Response(504, request=httpx.Request("GET", url), extensions={"from_cache": False})
+
+        if touch:
+            with self._lock:
+                self._conn.execute("UPDATE entries SET last_access = ? WHERE url = ?", (now, url))
+                self._conn.commit()
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=body,
+            request=httpx.Request("GET", url),
+            extensions={"from_cache": True}
+        )
+
+    # ==================== 정리 ====================
+
+    def _evict(self):
+        """전체 크기가 상한의 90% 이하가 될 때까지 오래 안 쓴 항목 삭제 (잠금 안에서 호출)"""
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute("SELECT url, body_hash FROM entries ORDER BY last_access").fetchall()
+        removed = 0
+        for url, body_hash in rows:
+            if self._total_bytes <= target:
+                break
+            self._conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            self._drop_orphan_blobs([body_hash])
+            removed += 1
+        if removed:
+            logger.info(f"HTTP 캐시 정리: {removed}개 삭제 (현재 {self._total_bytes / 1e6:.1f}MB)")
+
+    def _drop_orphan_blobs(self, hashes):
+        for body_hash in hashes:
+            if self._conn.execute("SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone():
+                continue
+            row = self._conn.execute("SELECT size FROM blobs WHERE hash = ?", (body_hash,)).fetchone()
+            if row is None:
+                continue
+            self._conn.execute("DELETE FROM blobs WHERE hash = ?", (body_hash,))
+            self._total_bytes -= row[0]
+            try:
+                self._blob_path(body_hash).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _blob_path(self, body_hash: str) -> Path:
+        return self.blob_dir / body_hash[:2] / f"{body_hash}.gz"
+
+    @staticmethod
+    def _stored_headers(headers) -> Dict[str, str]:
+        return {name: headers[name] for name in STORED_HEADERS if name in headers}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,248 @@
+"""
+WeDealize Crawl Politeness
+모든 크롤러 요청이 거쳐 가는 예절 정책 (이메일 추출, 카탈로그 크롤링, 가격 갱신, 브라우저)
+
+- 호스트별 토큰 버킷: 같은 사이트에는 request_delay_seconds 간격 (robots.txt crawl-delay 가 더 길면 그 값)
+- 전역 동시 요청 상한: 호스트 토큰을 받은 뒤에만 자리를 차지 → 한 호스트가 느려도 다른 호스트 요청은 계속 진행
+- robots.txt 호스트별 캐시 (TTL), Disallow 된 URL 은 요청하지 않음
+- User-Agent 는 CrawlerConfig.user_agent 하나로 통일
+
+policy = PolitenessPolicy.from_config(CrawlerConfig())
+response = await policy.fetch(client, "https://supplier.com/contact", http_cache=cache)
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+from .rate_limit import RateLimiterRegistry
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ..config.settings import CrawlerConfig
+    from .http_cache import HttpCache
+
+logger = logging.getLogger(__name__)
+
+
+class RobotsDisallowed(Exception):
+    """robots.txt 가 금지한 URL"""
+
+
+class RobotsUnavailable(Exception):
+    """robots.txt 를 받지 못함 (네트워크 오류 / 5xx) → 요청 보류, 나중에 다시 시도할 대상"""
+
+
+@dataclass
+class _RobotsEntry:
+    parser: Optional[RobotFileParser]  # None = 제한 없음
+    expires_at: float
+    error: Optional[str] = None  # robots.txt 를 받지 못한 이유 (있으면 요청 보류)
+
+
+def url_origin(url: str) -> str:
+    """scheme://host[:port] (호스트 버킷 / robots.txt 캐시 키)"""
+    parts = urlsplit(url)
+    return f"{parts.scheme or 'https'}://{parts.netloc.lower()}"
+
+
+class PolitenessPolicy:
+    """
+    크롤링 예절 정책 (프로세스 내 크롤러가 하나를 공유)
+
+    요청 순서: robots.txt 확인 → 호스트 토큰 대기 → 전역 슬롯 획득 → 요청
+    """
+
+    def __init__(
+        self,
+        user_agent: str = "WeDealize-Bot/1.0 (Supplier Discovery)",
+        request_delay_seconds: float = 2.0,
+        max_concurrent_requests: int = 5,
+        respect_robots: bool = True,
+        robots_ttl_seconds: float = 86400,
+        robots_error_ttl_seconds: float = 600,
+        max_crawl_delay_seconds: float = 60,
+        timeout_seconds: float = 10
+    ):
+        """
+        Args:
+            request_delay_seconds: 같은 호스트 요청 간 최소 간격
+            max_concurrent_requests: 전체 호스트 합산 동시 요청 수
+            robots_error_ttl_seconds: robots.txt 를 받지 못했을 때(5xx / 네트워크 오류) 재시도까지의 시간
+            max_crawl_delay_seconds: robots.txt crawl-delay 상한 (비정상적으로 큰 값 무시)
+        """
+        self.user_agent = user_agent
+        self.request_delay_seconds = max(request_delay_seconds, 0.001)
+        self.respect_robots = respect_robots
+        self.robots_ttl_seconds = robots_ttl_seconds
+        self.robots_error_ttl_seconds = robots_error_ttl_seconds
+        self.max_crawl_delay_seconds = max_crawl_delay_seconds
+        self.timeout_seconds = timeout_seconds
+
+        self.hosts = RateLimiterRegistry(default_rate=1.0 / self.request_delay_seconds)
+        self._slots = asyncio.Semaphore(max_concurrent_requests)
+        self._robots: Dict[str, _RobotsEntry] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+        self._client = None
+
+        # 통계 (프로세스 단위)
+        self.requests = 0
+        self.disallowed = 0
+
+    @classmethod
+    def from_config(cls, config: "CrawlerConfig") -> "PolitenessPolicy":
+        return cls(
+            user_agent=config.user_agent,
+            request_delay_seconds=config.request_delay_seconds,
+            max_concurrent_requests=config.max_concurrent_requests,
+            respect_robots=config.respect_robots_txt,
+            robots_ttl_seconds=config.robots_cache_ttl_seconds,
+            max_crawl_delay_seconds=config.max_crawl_delay_seconds
+        )
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"User-Agent": self.user_agent}
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ==================== 요청 ====================
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        요청 1건 허가 (robots.txt 금지 시 RobotsDisallowed, robots.txt 를 받지 못했으면 RobotsUnavailable)
+
+        async with policy.slot(url):
+            response = await client.get(url)
+        """
+        if not await self.allowed(url):
+            self.disallowed += 1
+            raise RobotsDisallowed(url)
+
+        # 호스트 토큰은 슬롯 밖에서 기다림 (대기 중인 호스트가 전역 자리를 막지 않도록)
+        await self.hosts.acquire(url_origin(url))
+        async with self._slots:
+            self.requests += 1
+            yield
+
+    async def fetch(
+        self,
+        client: "httpx.AsyncClient",
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        http_cache: Optional["HttpCache"] = None,
+        send: Optional[Callable[[Dict[str, str]], Awaitable["httpx.Response"]]] = None
+    ) -> "httpx.Response":
+        """
+        정책을 거친 GET (캐시가 있으면 신선한 캐시 항목은 네트워크 / 토큰 없이 바로 반환)
+
+        Args:
+            send: 실제 요청 함수 (요청 헤더 → 응답), 기본은 client.get (예: 크기 제한 스트리밍 요청)
+
+        Raises:
+            RobotsDisallowed: robots.txt 가 금지한 URL
+            RobotsUnavailable: robots.txt 를 받지 못한 호스트 (일시적, 재시도 대상)
+        """
+        request_headers = {**self.headers, **(headers or {})}
+
+        async def polite_send(send_headers: Dict[str, str]) -> "httpx.Response":
+            async with self.slot(url):
+                if send is not None:
+                    return await send(send_headers)
+                return await client.get(url, headers=send_headers)
+
+        if http_cache is not None:
+            return await http_cache.fetch(client, url, request_headers, send=polite_send)
+        return await polite_send(request_headers)
+
+    # ==================== robots.txt ====================
+
+    async def allowed(self, url: str) -> bool:
+        """
+        robots.txt 상 요청 가능 여부 (처음 보는 호스트는 robots.txt 를 받아 캐시)
+
+        Raises:
+            RobotsUnavailable: robots.txt 를 받지 못함 (robots_error_ttl_seconds 동안 같은 결과)
+        """
+        if not self.respect_robots:
+            return True
+        origin = url_origin(url)
+        entry = await self._robots_entry(origin)
+        if entry.error is not None:
+            raise RobotsUnavailable(f"{origin}/robots.txt: {entry.error}")
+        if entry.parser is None:
+            return True
+        return entry.parser.can_fetch(self.user_agent, url)
+
+    async def _robots_entry(self, origin: str) -> _RobotsEntry:
+        entry = self._robots.get(origin)
+        if entry is not None and entry.expires_at > time.time():
+            return entry
+
+        # 같은 호스트 robots.txt 는 한 번만 요청
+        lock = self._robots_locks.setdefault(origin, asyncio.Lock())
+        async with lock:
+            entry = self._robots.get(origin)
+            if entry is None or entry.expires_at <= time.time():
+                entry = await self._fetch_robots(origin)
+                self._robots[origin] = entry
+                self._apply_crawl_delay(origin, entry)
+            return entry
+
+    async def _fetch_robots(self, origin: str) -> _RobotsEntry:
+        """
+        robots.txt 요청 / 파싱 (RFC 9309)
+
+        - 200: 규칙 적용
+        - 4xx: 제한 없음
+        - 5xx / 네트워크 오류: 요청 보류 (RobotsUnavailable), robots_error_ttl_seconds 뒤 robots.txt 재요청
+        """
+        now = time.time()
+        try:
+            client = await self._get_client()
+            async with self._slots:
+                response = await client.get(f"{origin}/robots.txt")
+        except Exception as e:
+            logger.info(f"robots.txt 요청 실패 ({origin}): {e}")
+            return _RobotsEntry(None, now + self.robots_error_ttl_seconds, error=f"{type(e).__name__}: {e}")
+
+        if response.status_code >= 500:
+            return _RobotsEntry(None, now + self.robots_error_ttl_seconds, error=f"HTTP {response.status_code}")
+        if response.status_code != 200:
+            return _RobotsEntry(None, now + self.robots_ttl_seconds)
+
+        parser = RobotFileParser()
+        parser.parse(response.text.splitlines())
+        return _RobotsEntry(parser, now + self.robots_ttl_seconds)
+
+    def _apply_crawl_delay(self, origin: str, entry: _RobotsEntry):
+        """crawl-delay / request-rate 가 기본 간격보다 길면 호스트 버킷 속도를 낮춤"""
+        delay = self.request_delay_seconds
+        if entry.parser is not None:
+            crawl_delay = entry.parser.crawl_delay(self.user_agent)
+            if crawl_delay:
+                delay = max(delay, min(float(crawl_delay), self.max_crawl_delay_seconds))
+            request_rate = entry.parser.request_rate(self.user_agent)
+            if request_rate and request_rate.requests:
+                delay = max(delay, min(request_rate.seconds / request_rate.requests, self.max_crawl_delay_seconds))
+        self.hosts.get(origin).set_rate(1.0 / delay)
+
+    async def _get_client(self):
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+                headers=self.headers
+            )
+        return self._client
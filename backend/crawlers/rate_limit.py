@@ -0,0 +1,82 @@
+"""
+WeDealize Rate Limiter
+토큰 버킷 기반 요청 속도 제한 (데이터 소스 / 호스트 단위)
+
+고정 sleep 대신 소스별 허용 속도만큼만 요청을 흘려보내므로,
+여러 파이프라인이 동시에 실행되어도 소스별 요청 간격이 지켜집니다.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    토큰 버킷
+
+    rate: 초당 토큰 충전 속도 (= 초당 허용 요청 수)
+    capacity: 최대 버스트 크기
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (부족하면 대기), 대기한 시간(초) 반환
+
+        토큰을 먼저 예약(음수 허용)하고 잠금 밖에서 대기하므로
+        대기 순서대로 공정하게 처리됩니다. 대기 중 취소되면 예약한 토큰을 돌려놓습니다
+        (제한 시간을 넘긴 요청이 뒤의 요청을 늦추지 않도록).
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                async with self._lock:
+                    self._refill(time.monotonic())
+                    self._tokens = min(self.capacity, self._tokens + tokens)
+                raise
+        return wait
+
+    def set_rate(self, rate: float):
+        """속도 변경 (예: robots.txt crawl-delay 반영)"""
+        self._refill(time.monotonic())
+        self.rate = rate
+
+
+class RateLimiterRegistry:
+    """키(데이터 소스 이름, 호스트 등)별 토큰 버킷 모음"""
+
+    def __init__(self, default_rate: float, rates: Optional[Dict[str, float]] = None, burst: float = 1.0):
+        self.default_rate = default_rate
+        self.rates = dict(rates or {})
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def get(self, key: str) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.rates.get(key, self.default_rate), self.burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, key: str, tokens: float = 1.0) -> float:
+        return await self.get(key).acquire(tokens)
@@ -0,0 +1,47 @@
+-- Migration: crawl_jobs 작업 큐 컬럼 (우선순위 / 재시도 / 리스·하트비트 / 체크포인트)
+-- create_all 은 기존 테이블에 컬럼을 추가하지 않으므로 기존 DB 에 한 번 적용 (PostgreSQL)
+--
+-- 1. 컬럼 추가 (이미 있으면 건너뜀)
+-- 2. 기존 행 기본값 채우기 (next_run_at 은 created_at → 대기 작업은 바로 점유 가능)
+-- 3. 워커 claim / 리스 회수 쿼리용 인덱스
+--
+-- SQLite 개발 DB: ADD COLUMN IF NOT EXISTS 가 없으므로 아래를 한 번만 실행
+--   ALTER TABLE crawl_jobs ADD COLUMN priority INTEGER DEFAULT 0;
+--   ALTER TABLE crawl_jobs ADD COLUMN attempts INTEGER DEFAULT 0;
+--   ALTER TABLE crawl_jobs ADD COLUMN max_attempts INTEGER DEFAULT 5;
+--   ALTER TABLE crawl_jobs ADD COLUMN next_run_at DATETIME;
+--   ALTER TABLE crawl_jobs ADD COLUMN parent_job_id INTEGER REFERENCES crawl_jobs(id);
+--   ALTER TABLE crawl_jobs ADD COLUMN lease_owner VARCHAR(255);
+--   ALTER TABLE crawl_jobs ADD COLUMN lease_expires_at DATETIME;
+--   ALTER TABLE crawl_jobs ADD COLUMN heartbeat_at DATETIME;
+--   ALTER TABLE crawl_jobs ADD COLUMN checkpoint JSON;
+--   ALTER TABLE crawl_jobs ADD COLUMN updated_at DATETIME;
+--   UPDATE crawl_jobs SET next_run_at = COALESCE(created_at, CURRENT_TIMESTAMP), checkpoint = '{}',
+--       updated_at = COALESCE(created_at, CURRENT_TIMESTAMP);
+--   CREATE INDEX ix_crawl_jobs_claim ON crawl_jobs (status, next_run_at, priority);
+--   CREATE INDEX ix_crawl_jobs_lease ON crawl_jobs (status, lease_expires_at);
+
+BEGIN;
+
+ALTER TABLE crawl_jobs
+    ADD COLUMN IF NOT EXISTS priority INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS attempts INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS max_attempts INTEGER DEFAULT 5,
+    ADD COLUMN IF NOT EXISTS next_run_at TIMESTAMP WITHOUT TIME ZONE,
+    ADD COLUMN IF NOT EXISTS parent_job_id INTEGER REFERENCES crawl_jobs (id),
+    ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITHOUT TIME ZONE,
+    ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITHOUT TIME ZONE,
+    ADD COLUMN IF NOT EXISTS checkpoint JSON,
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITHOUT TIME ZONE;
+
+-- NULL next_run_at 은 claim 조건(next_run_at <= now)에 걸리지 않으므로 반드시 채움
+UPDATE crawl_jobs
+SET next_run_at = COALESCE(next_run_at, created_at, now() AT TIME ZONE 'utc'),
+    checkpoint = COALESCE(checkpoint, '{}'::json),
+    updated_at = COALESCE(updated_at, created_at, now() AT TIME ZONE 'utc');
+
+CREATE INDEX IF NOT EXISTS ix_crawl_jobs_claim ON crawl_jobs (status, next_run_at, priority);
+CREATE INDEX IF NOT EXISTS ix_crawl_jobs_lease ON crawl_jobs (status, lease_expires_at);
+
+COMMIT;
@@ -0,0 +1,35 @@
+-- Migration: products.embedding JSON → packed float32 (Float32Vector)
+-- create_all 은 기존 테이블 컬럼 타입을 바꾸지 않으므로 기존 DB 에 한 번 적용 (PostgreSQL)
+--
+-- 1. 기존 JSON 벡터를 embedding_json 으로 옮기고 BYTEA 컬럼 추가
+-- 2. JSON 배열 → float32 little-endian 바이트 (array('f') 형식, x86 / ARM 서버 기준)
+-- 3. 확인 후 embedding_json 삭제, ./data/vector_index 를 비우고 워커가 다시 동기화
+--
+-- SQLite 개발 DB: 변환 대신 embedding 을 비우고 EmbeddingPipeline.backfill() 로 재생성
+--   UPDATE products SET embedding = NULL;
+--   (embedding_cache 에 있는 텍스트는 프로바이더를 다시 호출하지 않음)
+
+BEGIN;
+
+ALTER TABLE products RENAME COLUMN embedding TO embedding_json;
+ALTER TABLE products ADD COLUMN embedding BYTEA;
+
+-- float4send 는 big-endian → 4바이트씩 뒤집어 little-endian 으로
+UPDATE products p
+SET embedding = (
+    SELECT string_agg(
+        substring(b FROM 4 FOR 1) || substring(b FROM 3 FOR 1) || substring(b FROM 2 FOR 1) || substring(b FROM 1 FOR 1),
+        ''::bytea ORDER BY e.ord
+    )
+    FROM json_array_elements_text(p.embedding_json::json) WITH ORDINALITY AS e(v, ord),
+         LATERAL (SELECT float4send(e.v::float4) AS b) s
+)
+WHERE p.embedding_json IS NOT NULL
+  AND json_typeof(p.embedding_json::json) = 'array';
+
+COMMIT;
+
+-- 변환 결과 확인 후 (벡터 차원 × 4 바이트)
+-- SELECT id, json_array_length(embedding_json::json) * 4 AS expected, length(embedding) AS actual
+-- FROM products WHERE embedding_json IS NOT NULL AND json_array_length(embedding_json::json) * 4 <> length(embedding);
+-- ALTER TABLE products DROP COLUMN embedding_json;
@@ -3,16 +3,45 @@ WeDealize Database Models
 공급사, 상품, 가격 정보를 위한 데이터베이스 스키마
 """
 
+from array import array
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import create_engine, Column, Integer, String, Float, Text, DateTime, Boolean, ForeignKey, JSON, Enum
+from sqlalchemy import create_engine, Column, Integer, String, Float, Text, DateTime, Boolean, ForeignKey, JSON, Enum, Index, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.types import TypeDecorator
 import enum
 
 Base = declarative_base()
 
 
+class Float32Vector(TypeDecorator):
+    """
+    float32 벡터를 packed bytes 로 저장 (JSON 대비 약 1/4 크기, 디코딩 비용 없음)
+
+    바인딩: list / tuple / array / numpy 배열
+    조회: array('f') (시퀀스처럼 사용, numpy.frombuffer 로 복사 없이 변환 가능)
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value)
+        if hasattr(value, "astype"):  # numpy
+            return value.astype("float32").tobytes()
+        return array("f", value).tobytes()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        vector = array("f")
+        vector.frombytes(value)
+        return vector
+
+
 class SupplierStatus(enum.Enum):
     DISCOVERED = "discovered"      # AI가 발견
     CONTACTED = "contacted"        # 연락 시도
@@ -80,6 +109,27 @@ class Supplier(Base):
     crawl_jobs = relationship("CrawlJob", back_populates="supplier")
 
 
+class SupplierMatchKey(Base):
+    """
+    공급사 중복 판별용 블로킹 키 (services/entity_resolution.py)
+
+    - "d:<domain>": 웹사이트 도메인
+    - "n:<normalized name>": 법인 접미사 제거한 정규화 상호
+    - "b:<band>:<hash>": 상호 MinHash LSH 밴드 키
+    신규 공급사는 키가 겹치는 후보만 비교하므로 테이블이 커져도 전체 비교가 없습니다.
+    """
+    __tablename__ = "supplier_match_keys"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
+    key = Column(String(300), nullable=False)
+
+    __table_args__ = (
+        Index("ix_supplier_match_keys_key", "key"),
+        Index("ix_supplier_match_keys_supplier", "supplier_id"),
+    )
+
+
 class Category(Base):
     """상품 카테고리 테이블"""
     __tablename__ = "categories"
@@ -132,7 +182,7 @@ class Product(Base):
     moq_unit = Column(String(50))  # "pieces", "cases", "kg"
 
     # AI 분석
-    embedding = Column(JSON)  # 벡터 임베딩 (유사 상품 검색용)
+    embedding = Column(Float32Vector)  # 벡터 임베딩 (유사 상품 검색용, packed float32)
     ai_tags = Column(JSON, default=list)  # AI가 추출한 태그
     quality_score = Column(Float)  # AI 품질 점수
 
@@ -151,6 +201,32 @@ class Product(Base):
     price_history = relationship("PriceHistory", back_populates="product")
 
 
+class ProductCertification(Base):
+    """
+    인증 역색인 테이블 (Product.certifications / Supplier.certifications 정규화)
+
+    - scope="product": 상품 인증 (product_id 지정)
+    - scope="supplier": 공급사 인증 (product_id NULL, 해당 공급사 전 상품에 적용)
+    - certification 은 표준 인증명이며 상위 인증도 함께 저장 ("USDA Organic" → "Organic" 행 추가)
+    """
+    __tablename__ = "product_certifications"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    product_id = Column(Integer, ForeignKey("products.id"))
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
+
+    certification = Column(String(100), nullable=False)  # 표준 인증명
+    raw_name = Column(String(255))  # 원본 표기
+    scope = Column(String(20), nullable=False, default="product")  # "product", "supplier"
+
+    __table_args__ = (
+        Index("ix_product_certifications_cert_product", "certification", "scope", "product_id"),
+        Index("ix_product_certifications_cert_supplier", "certification", "scope", "supplier_id"),
+        Index("ix_product_certifications_product", "product_id"),
+        Index("ix_product_certifications_supplier", "supplier_id", "scope"),
+    )
+
+
 class PriceHistory(Base):
     """가격 변동 이력 테이블"""
     __tablename__ = "price_history"
@@ -201,6 +277,33 @@ class Catalog(Base):
     supplier = relationship("Supplier", back_populates="catalogs")
 
 
+class CrawlFingerprint(Base):
+    """크롤링 URL 변경 감지 (조건부 요청 검증자 + 콘텐츠 지문)"""
+    __tablename__ = "crawl_fingerprints"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url = Column(String(1000), nullable=False, unique=True)
+    kind = Column(String(20))  # "website", "catalog"
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"))
+    catalog_id = Column(Integer, ForeignKey("catalogs.id"))
+
+    # HTTP 검증자 (If-None-Match / If-Modified-Since)
+    etag = Column(String(255))
+    last_modified = Column(String(100))  # HTTP-date 원문
+
+    # 콘텐츠 지문
+    content_hash = Column(String(64))  # sha256 (정규화 콘텐츠)
+    content_simhash = Column(String(16))  # 64-bit simhash (hex, 텍스트 콘텐츠)
+    content_length = Column(Integer)
+
+    # 이력
+    check_count = Column(Integer, default=0)
+    change_count = Column(Integer, default=0)
+    last_checked_at = Column(DateTime)
+    last_changed_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class CrawlJob(Base):
     """크롤링 작업 테이블"""
     __tablename__ = "crawl_jobs"
@@ -224,14 +327,48 @@ class CrawlJob(Base):
     error_message = Column(Text)
 
     # 설정
-    config = Column(JSON, default=dict)  # 크롤링 설정
+    config = Column(JSON, default=dict)  # 크롤링 설정 (작업 payload)
+
+    # 작업 큐 (다중 워커)
+    priority = Column(Integer, default=0)  # 높을수록 먼저 처리
+    attempts = Column(Integer, default=0)  # 점유(claim) 횟수
+    max_attempts = Column(Integer, default=5)
+    next_run_at = Column(DateTime, default=datetime.utcnow)  # 재시도 백오프 후 실행 가능 시각
+    parent_job_id = Column(Integer, ForeignKey("crawl_jobs.id"))  # 이 작업을 만든 상위 단계 작업
+
+    # 리스 / 하트비트
+    lease_owner = Column(String(255))  # 작업을 점유한 워커 ID
+    lease_expires_at = Column(DateTime)  # 만료되면 다른 워커가 회수
+    heartbeat_at = Column(DateTime)
+
+    # 단계별 체크포인트 {"discovering": {...}, "crawling": {...}}
+    checkpoint = Column(JSON, default=dict)
 
     # 메타
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계
     supplier = relationship("Supplier", back_populates="crawl_jobs")
 
+    __table_args__ = (
+        # 워커 claim 쿼리용 (status, 실행 가능 시각, 우선순위)
+        Index("ix_crawl_jobs_claim", "status", "next_run_at", "priority"),
+        Index("ix_crawl_jobs_lease", "status", "lease_expires_at"),
+    )
+
+
+class EmbeddingCache(Base):
+    """텍스트 임베딩 캐시 (정규화 텍스트 해시 → 벡터)"""
+    __tablename__ = "embedding_cache"
+
+    text_hash = Column(String(64), primary_key=True)  # sha256(정규화 텍스트)
+    model = Column(String(100), primary_key=True)  # 임베딩 모델명 (모델이 바뀌면 재계산)
+    vector = Column(Float32Vector, nullable=False)
+    dim = Column(Integer)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 
 class AISearchQuery(Base):
     """AI 검색 쿼리 로그 테이블"""
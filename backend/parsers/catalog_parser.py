@@ -11,6 +11,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from enum import Enum
 
+from ..services.metrics import track_stage
+
 
 class FileType(Enum):
     PDF = "pdf"
@@ -89,11 +91,13 @@ class CatalogParser:
         if not parser:
             raise ValueError(f"Unsupported file type: {file_type}")
 
-        # 원본 데이터 추출
-        raw_data = await parser.extract_raw_data(file_path)
+        with track_stage("catalog_parse", source=file_type.value) as t:
+            # 원본 데이터 추출
+            raw_data = await parser.extract_raw_data(file_path)
 
-        # AI로 상품 정보 구조화
-        products = await self._ai_extract_products(raw_data, file_type)
+            # AI로 상품 정보 구조화
+            products = await self._ai_extract_products(raw_data, file_type)
+            t.add_items(len(products))
 
         return products
 
@@ -0,0 +1,276 @@
+"""
+WeDealize Certification Index
+상품/공급사 인증 정규화 및 역색인 (product_certifications)
+
+- 인증명 정규화: "usda organic", "USDA-Organic" → "USDA Organic"
+- 상위 인증 롤업: "USDA Organic", "EU Organic" → "Organic" 으로도 색인
+- Product / Supplier 저장 시 자동 동기화 (SQLAlchemy 이벤트)
+- 다중 인증 AND/OR 필터를 인덱스로 처리
+"""
+
+import re
+import logging
+from typing import Iterable, List, Optional
+
+from sqlalchemy import String, and_, cast, delete, event, inspect, or_, select
+
+from ..models.database import Product, ProductCertification, Supplier
+
+logger = logging.getLogger(__name__)
+
+
+# 정규화 키(소문자, 공백/하이픈 제거) → 표준 인증명
+CERTIFICATION_ALIASES = {
+    "organic": "Organic",
+    "유기농": "Organic",
+    "usdaorganic": "USDA Organic",
+    "euorganic": "EU Organic",
+    "eorganic": "EU Organic",
+    "jasorganic": "JAS Organic",
+    "jas": "JAS Organic",
+    "canadaorganic": "Canada Organic",
+    "haccp": "HACCP",
+    "iso22000": "ISO 22000",
+    "fssc22000": "FSSC 22000",
+    "brc": "BRCGS",
+    "brcgs": "BRCGS",
+    "ifs": "IFS Food",
+    "ifsfood": "IFS Food",
+    "gmp": "GMP",
+    "fda": "FDA Registered",
+    "fdaregistered": "FDA Registered",
+    "halal": "Halal",
+    "할랄": "Halal",
+    "kosher": "Kosher",
+    "코셔": "Kosher",
+    "nongmo": "Non-GMO",
+    "nongmoproject": "Non-GMO",
+    "vegan": "Vegan",
+    "비건": "Vegan",
+    "glutenfree": "Gluten-Free",
+    "fairtrade": "Fair Trade",
+    "rainforestalliance": "Rainforest Alliance",
+    "aoc": "AOC",
+    "dop": "DOP",
+    "pdo": "PDO",
+    "umf": "UMF Certified",
+    "umfcertified": "UMF Certified",
+}
+
+# 표준 인증명 → 상위 인증 (필터 시 상위 이름으로도 검색됨)
+CERTIFICATION_PARENTS = {
+    "USDA Organic": "Organic",
+    "EU Organic": "Organic",
+    "JAS Organic": "Organic",
+    "Canada Organic": "Organic",
+    "FSSC 22000": "ISO 22000",
+    "DOP": "PDO",
+}
+
+SCOPE_PRODUCT = "product"
+SCOPE_SUPPLIER = "supplier"
+
+_NORMALIZE_PATTERN = re.compile(r"[\s\-_./®™]+")
+
+
+def _key(name: str) -> str:
+    return _NORMALIZE_PATTERN.sub("", name.strip().lower())
+
+
+def canonicalize(name: str) -> Optional[str]:
+    """인증명 → 표준 인증명 (빈 값이면 None)"""
+    if not name or not name.strip():
+        return None
+    key = _key(name)
+    if key in CERTIFICATION_ALIASES:
+        return CERTIFICATION_ALIASES[key]
+    return " ".join(name.split())
+
+
+def expand(name: str) -> List[str]:
+    """표준 인증명 + 상위 인증 목록 ("USDA Organic" → ["USDA Organic", "Organic"])"""
+    canonical = canonicalize(name)
+    if not canonical:
+        return []
+
+    names = [canonical]
+    parent = CERTIFICATION_PARENTS.get(canonical)
+    if parent is None and canonical.lower().endswith(" organic"):
+        parent = "Organic"  # 등록되지 않은 지역 유기농 인증
+    while parent and parent not in names:
+        names.append(parent)
+        parent = CERTIFICATION_PARENTS.get(parent)
+    return names
+
+
+def matches(certifications: Iterable[str], wanted: Iterable[str], mode: str = "all") -> bool:
+    """메모리상의 인증 목록 필터 (DB 없는 경로용, 인덱스와 동일한 규칙)"""
+    have = {c for raw in certifications or [] for c in expand(raw)}
+    targets = [c for c in (canonicalize(w) for w in wanted) if c]
+    if not targets:
+        return True
+    if mode == "any":
+        return any(t in have for t in targets)
+    return all(t in have for t in targets)
+
+
+def _index_rows(raw_names: Iterable[str], supplier_id: int, product_id: Optional[int], scope: str) -> List[dict]:
+    rows = {}
+    for raw in raw_names or []:
+        if not isinstance(raw, str):
+            continue
+        for name in expand(raw):
+            rows.setdefault(name, {
+                "supplier_id": supplier_id,
+                "product_id": product_id,
+                "certification": name,
+                "raw_name": raw,
+                "scope": scope,
+            })
+    return list(rows.values())
+
+
+def _sync_product(connection, product: Product):
+    connection.execute(
+        delete(ProductCertification).where(
+            ProductCertification.product_id == product.id,
+            ProductCertification.scope == SCOPE_PRODUCT,
+        )
+    )
+    if product.supplier_id is None:
+        # 색인 행은 supplier_id 가 필수 → 공급사가 연결될 때(_on_product_update) 색인
+        return
+    rows = _index_rows(product.certifications, product.supplier_id, product.id, SCOPE_PRODUCT)
+    if rows:
+        connection.execute(ProductCertification.__table__.insert(), rows)
+
+
+def _sync_supplier(connection, supplier: Supplier):
+    connection.execute(
+        delete(ProductCertification).where(
+            ProductCertification.supplier_id == supplier.id,
+            ProductCertification.scope == SCOPE_SUPPLIER,
+        )
+    )
+    rows = _index_rows(supplier.certifications, supplier.id, None, SCOPE_SUPPLIER)
+    if rows:
+        connection.execute(ProductCertification.__table__.insert(), rows)
+
+
+def _certifications_changed(target) -> bool:
+    return inspect(target).attrs.certifications.history.has_changes()
+
+
+def _on_product_insert(mapper, connection, target):
+    _sync_product(connection, target)
+
+
+def _on_product_update(mapper, connection, target):
+    if _certifications_changed(target) or inspect(target).attrs.supplier_id.history.has_changes():
+        _sync_product(connection, target)
+
+
+def _on_supplier_insert(mapper, connection, target):
+    _sync_supplier(connection, target)
+
+
+def _on_supplier_update(mapper, connection, target):
+    if _certifications_changed(target):
+        _sync_supplier(connection, target)
+
+
+def _on_product_delete(mapper, connection, target):
+    connection.execute(delete(ProductCertification).where(ProductCertification.product_id == target.id))
+
+
+_listeners_registered = False
+
+
+def register_listeners():
+    """Product / Supplier 저장 시 인증 색인 자동 동기화 (중복 등록 방지)"""
+    global _listeners_registered
+    if _listeners_registered:
+        return
+    event.listen(Product, "after_insert", _on_product_insert)
+    event.listen(Product, "after_update", _on_product_update)
+    event.listen(Product, "after_delete", _on_product_delete)
+    event.listen(Supplier, "after_insert", _on_supplier_insert)
+    event.listen(Supplier, "after_update", _on_supplier_update)
+    _listeners_registered = True
+
+
+class CertificationIndex:
+    """인증 역색인 조회/재구성"""
+
+    def __init__(self, session):
+        self.session = session
+
+    def ensure(self):
+        """색인이 비어 있는데 인증이 있는 상품/공급사가 있으면 (도입 직후) 전체 색인"""
+        if self.session.query(ProductCertification.id).first() is not None:
+            return
+        has_certifications = [
+            self.session.query(model.id).filter(
+                model.certifications.isnot(None),
+                cast(model.certifications, String).notin_(["[]", "null"])
+            ).first() is not None
+            for model in (Supplier, Product)
+        ]
+        if any(has_certifications):
+            self.rebuild()
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """기존 데이터 전체 재색인, 색인된 행 수 반환"""
+        connection = self.session.connection()
+        connection.execute(delete(ProductCertification))
+        count = 0
+
+        for supplier in self.session.query(Supplier).yield_per(batch_size):
+            rows = _index_rows(supplier.certifications, supplier.id, None, SCOPE_SUPPLIER)
+            if rows:
+                connection.execute(ProductCertification.__table__.insert(), rows)
+                count += len(rows)
+
+        for product in self.session.query(Product).filter(Product.supplier_id.isnot(None)).yield_per(batch_size):
+            rows = _index_rows(product.certifications, product.supplier_id, product.id, SCOPE_PRODUCT)
+            if rows:
+                connection.execute(ProductCertification.__table__.insert(), rows)
+                count += len(rows)
+
+        self.session.commit()
+        logger.info(f"인증 색인 재구성 완료: {count}행")
+        return count
+
+    @staticmethod
+    def _has_certification(name: str, include_supplier: bool):
+        """상품 자체 인증 또는 (선택) 공급사 인증 보유 조건"""
+        product_ids = select(ProductCertification.product_id).where(
+            ProductCertification.certification == name,
+            ProductCertification.scope == SCOPE_PRODUCT,
+        )
+        condition = Product.id.in_(product_ids)
+        if include_supplier:
+            supplier_ids = select(ProductCertification.supplier_id).where(
+                ProductCertification.certification == name,
+                ProductCertification.scope == SCOPE_SUPPLIER,
+            )
+            condition = or_(condition, Product.supplier_id.in_(supplier_ids))
+        return condition
+
+    def filter_products(self, query, certifications: List[str], mode: str = "all", include_supplier: bool = True):
+        """
+        Product 쿼리에 인증 필터 적용
+
+        Args:
+            certifications: 인증명 목록 (별칭/상위 인증 가능: "Organic" → USDA/EU/JAS Organic 포함)
+            mode: "all" (모두 보유, AND) 또는 "any" (하나 이상, OR)
+            include_supplier: 공급사 단위 인증(HACCP 등)도 상품 인증으로 간주
+        """
+        names = list(dict.fromkeys(c for c in (canonicalize(n) for n in certifications) if c))
+        if not names:
+            return query
+
+        conditions = [self._has_certification(name, include_supplier) for name in names]
+        if mode == "any":
+            return query.filter(or_(*conditions))
+        return query.filter(and_(*conditions))
@@ -0,0 +1,210 @@
+"""
+WeDealize Contact Enrichment
+공급사 웹사이트 일괄 스캔 → Supplier.email 채우기 + ContactAttempt 기록
+
+- EmailExtractor.extract_many 로 수만 곳을 동시에 처리 (끝나는 사이트부터 결과 수신)
+- 결과는 모아서 일괄 저장 (bulk_update_mappings / bulk_insert_mappings, 배치마다 커밋)
+- 같은 웹사이트를 쓰는 공급사가 스캔 중에 또 나오면 다시 요청하지 않고 결과를 함께 기록
+- 최근에 스캔한 공급사는 건너뜀 → 중단 후 다시 실행하면 남은 곳부터
+  (오류 / 제한 시간 초과로 끝난 사이트는 다음 실행에서 다시 스캔)
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional
+
+from ..crawlers.email_extractor import EmailExtractor, SiteExtraction
+from ..models.database import Supplier
+from ..models.email_tracking import ContactAttempt
+
+logger = logging.getLogger(__name__)
+
+
+# ContactAttempt.contact_method (웹사이트에서 이메일 주소 추출)
+CONTACT_METHOD = "email_extraction"
+
+# ContactAttempt.status: 이메일 찾음 / 스캔했지만 없음 / 오류·제한 시간 초과 (건너뛰지 않고 다시 스캔)
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_ERROR = "error"
+
+
+def site_url(website: str) -> str:
+    """DB 웹사이트 값 → 요청 URL (scheme 이 없으면 https)"""
+    website = website.strip()
+    if "://" not in website:
+        website = f"https://{website}"
+    return website
+
+
+@dataclass
+class EnrichmentProgress:
+    """연락처 보강 진행 상황"""
+    total: int = 0         # 대상 공급사 수 (시작 시점 기준)
+    sites: int = 0         # 스캔 완료 사이트 수
+    suppliers: int = 0     # 결과를 기록한 공급사 수
+    found: int = 0         # 이메일을 찾은 공급사 수
+    not_found: int = 0
+    failed: int = 0        # 오류 / 제한 시간 초과
+    retried: int = 0       # 재시도가 있었던 사이트 수
+
+    @property
+    def percent(self) -> float:
+        return round(self.suppliers * 100 / self.total, 1) if self.total else 100.0
+
+
+class ContactEnricher:
+    """
+    공급사 이메일 일괄 보강
+
+    enricher = ContactEnricher(db_session, extractor)
+    progress = await enricher.enrich(concurrency=100, progress_callback=print)
+    """
+
+    def __init__(
+        self,
+        db_session,
+        extractor: EmailExtractor,
+        page_size: int = 1000,
+        write_batch_size: int = 200
+    ):
+        """
+        Args:
+            page_size: 대상 공급사 조회 페이지 크기 (supplier_id 순)
+            write_batch_size: 이만큼 결과가 모이면 일괄 저장 + 커밋
+        """
+        self.db = db_session
+        self.extractor = extractor
+        self.page_size = page_size
+        self.write_batch_size = write_batch_size
+
+    def _base_query(self, only_missing: bool, skip_attempted_days: Optional[float]):
+        query = self.db.query(Supplier.id, Supplier.website).filter(
+            Supplier.website.isnot(None),
+            Supplier.website != ""
+        )
+        if only_missing:
+            query = query.filter(Supplier.email.is_(None))
+        if skip_attempted_days:
+            cutoff = datetime.utcnow() - timedelta(days=skip_attempted_days)
+            recent = self.db.query(ContactAttempt.id).filter(
+                ContactAttempt.supplier_id == Supplier.id,
+                ContactAttempt.contact_method == CONTACT_METHOD,
+                ContactAttempt.status != STATUS_ERROR,
+                ContactAttempt.attempted_at >= cutoff
+            )
+            query = query.filter(~recent.exists())
+        return query
+
+    async def enrich(
+        self,
+        only_missing: bool = True,
+        skip_attempted_days: Optional[float] = 7,
+        progress_callback: Optional[Callable[[EnrichmentProgress], None]] = None,
+        **extract_options
+    ) -> EnrichmentProgress:
+        """
+        대상 공급사 웹사이트 스캔 후 결과 저장
+
+        Args:
+            only_missing: 이메일이 없는 공급사만
+            skip_attempted_days: 이 기간 안에 스캔을 마친 공급사 제외 (None = 모두, 오류로 끝난 시도는 제외하지 않음)
+            extract_options: extract_many 옵션 (concurrency, per_domain, deadline_seconds, retries)
+        """
+        base = self._base_query(only_missing, skip_attempted_days)
+        progress = EnrichmentProgress(total=base.count())
+        logger.info(f"연락처 보강 시작: 공급사 {progress.total}곳")
+
+        # 스캔 중인 사이트 URL → 공급사 ID 목록
+        waiting: Dict[str, List[int]] = {}
+
+        def targets() -> Iterator[str]:
+            """supplier_id 순 페이지 조회 (같은 사이트가 스캔 중이면 결과를 함께 기록)"""
+            last_id = 0
+            while True:
+                page = base.filter(Supplier.id > last_id).order_by(Supplier.id).limit(self.page_size).all()
+                if not page:
+                    return
+                for supplier_id, website in page:
+                    url = site_url(website)
+                    ids = waiting.get(url)
+                    if ids is not None:
+                        ids.append(supplier_id)
+                        continue
+                    waiting[url] = [supplier_id]
+                    yield url
+                last_id = page[-1][0]
+
+        buffer: List[SiteExtraction] = []
+        async for result in self.extractor.extract_many(targets(), **extract_options):
+            buffer.append(result)
+            if len(buffer) >= self.write_batch_size:
+                self._write(buffer, waiting, progress)
+                buffer = []
+                logger.info(
+                    f"연락처 보강 {progress.percent}% ({progress.suppliers}/{progress.total}, "
+                    f"이메일 {progress.found}, 실패 {progress.failed})"
+                )
+                if progress_callback:
+                    progress_callback(progress)
+
+        if buffer:
+            self._write(buffer, waiting, progress)
+            if progress_callback:
+                progress_callback(progress)
+
+        logger.info(f"연락처 보강 완료: 공급사 {progress.suppliers}곳, 이메일 {progress.found}곳, 실패 {progress.failed}곳")
+        return progress
+
+    def _write(self, results: List[SiteExtraction], waiting: Dict[str, List[int]], progress: EnrichmentProgress):
+        """결과 배치 일괄 저장 (이메일 업데이트 + 시도 기록 삽입, 커밋 1회)"""
+        now = datetime.utcnow()
+        updates = []
+        attempts = []
+
+        for result in results:
+            supplier_ids = waiting.pop(result.url, [])
+            email = result.contact.primary_email
+            progress.sites += 1
+            if result.attempts > 1:
+                progress.retried += 1
+
+            for supplier_id in supplier_ids:
+                progress.suppliers += 1
+                if email:
+                    progress.found += 1
+                    updates.append({"id": supplier_id, "email": email})
+                    status = STATUS_SUCCESS
+                elif result.status == "not_found":
+                    progress.not_found += 1
+                    status = STATUS_FAILED
+                else:
+                    progress.failed += 1
+                    status = STATUS_ERROR
+
+                attempts.append({
+                    "supplier_id": supplier_id,
+                    "contact_method": CONTACT_METHOD,
+                    "contact_target": email or result.url,
+                    "status": status,
+                    "attempted_at": now,
+                    "notes": self._notes(result),
+                })
+
+        if updates:
+            self.db.bulk_update_mappings(Supplier, updates)
+        if attempts:
+            self.db.bulk_insert_mappings(ContactAttempt, attempts)
+        self.db.commit()
+
+    @staticmethod
+    def _notes(result: SiteExtraction) -> str:
+        parts = [f"status={result.status}", f"attempts={result.attempts}"]
+        if result.contact.emails:
+            parts.append("emails=" + ",".join(result.contact.emails[:5]))
+        if result.contact.contact_page_url:
+            parts.append(f"contact_page={result.contact.contact_page_url}")
+        if result.error:
+            parts.append(f"error={result.error}")
+        return "; ".join(parts)
@@ -0,0 +1,152 @@
+"""
+WeDealize Discovery Cache
+데이터 소스별 공급사 탐색 결과 캐시 (SearchCriteria 정규화 해시 + 소스 이름)
+
+- 같은 조건으로 해석되는 검색(예약 검색, 사용자 검색)은 외부 사이트를 다시 크롤링하지 않음
+- 소스별 TTL: 신선한 동안은 캐시만 사용
+- stale-while-revalidate: TTL 이 지났어도 허용 기간 안이면 캐시를 즉시 반환하고 백그라운드에서 갱신
+- 로컬 sqlite3 파일에 저장 (프로세스 재시작 / 여러 워커 간 공유)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_list(values) -> List[str]:
+    return sorted({str(v).strip().lower() for v in values or [] if str(v).strip()})
+
+
+def criteria_cache_key(criteria) -> str:
+    """
+    SearchCriteria 정규화 해시
+
+    목록 필드는 순서/대소문자/중복을 무시하므로 표현만 다른 같은 조건은 같은 키가 됩니다.
+    """
+    price_range = list(criteria.price_range) if criteria.price_range else None
+    canonical = {
+        "keywords": _normalize_list(criteria.keywords),
+        "categories": _normalize_list(criteria.categories),
+        "countries": _normalize_list(criteria.countries),
+        "certifications": _normalize_list(criteria.certifications),
+        "min_moq": criteria.min_moq,
+        "max_moq": criteria.max_moq,
+        "price_range": price_range,
+    }
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """캐시 조회 결과"""
+    suppliers: List[Dict[str, Any]]
+    age_seconds: float
+    is_stale: bool  # TTL 경과 (재검증 필요)
+
+
+class DiscoveryCache:
+    """
+    소스별 탐색 결과 캐시
+
+    cache = DiscoveryCache("./data/discovery_cache.sqlite3", ttls={"alibaba": 86400})
+    entry = cache.get(key, "alibaba")
+    cache.put(key, "alibaba", [asdict(s) for s in suppliers])
+    """
+
+    def __init__(
+        self,
+        path: str = "./data/discovery_cache.sqlite3",
+        default_ttl_seconds: float = 6 * 3600,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_seconds: float = 7 * 86400
+    ):
+        """
+        Args:
+            ttls: 소스별 TTL (초), 없으면 default_ttl_seconds
+            stale_seconds: TTL 경과 후에도 캐시를 반환(백그라운드 갱신)하는 기간, 이후는 미스
+        """
+        self.path = Path(path)
+        self.default_ttl_seconds = default_ttl_seconds
+        self.ttls = dict(ttls or {})
+        self.stale_seconds = stale_seconds
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS discovery_cache (
+                criteria_hash TEXT NOT NULL,
+                source TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                PRIMARY KEY (criteria_hash, source)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def ttl_for(self, source: str) -> float:
+        return self.ttls.get(source, self.default_ttl_seconds)
+
+    def get(self, criteria_hash: str, source: str) -> Optional[CacheEntry]:
+        """캐시 조회 (없거나 허용 기간까지 지났으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, stored_at FROM discovery_cache WHERE criteria_hash = ? AND source = ?",
+                (criteria_hash, source)
+            ).fetchone()
+        if row is None:
+            return None
+
+        age = time.time() - row[1]
+        ttl = self.ttl_for(source)
+        if age > ttl + self.stale_seconds:
+            return None
+        return CacheEntry(suppliers=json.loads(row[0]), age_seconds=age, is_stale=age > ttl)
+
+    def put(self, criteria_hash: str, source: str, suppliers: List[Dict[str, Any]]):
+        payload = json.dumps(suppliers, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO discovery_cache (criteria_hash, source, payload, stored_at) VALUES (?, ?, ?, ?)",
+                (criteria_hash, source, payload, time.time())
+            )
+            self._conn.commit()
+
+    def invalidate(self, source: Optional[str] = None):
+        """소스(또는 전체) 캐시 삭제"""
+        with self._lock:
+            if source:
+                self._conn.execute("DELETE FROM discovery_cache WHERE source = ?", (source,))
+            else:
+                self._conn.execute("DELETE FROM discovery_cache")
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """허용 기간까지 지난 항목 삭제, 삭제 수 반환"""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            sources = [r[0] for r in self._conn.execute("SELECT DISTINCT source FROM discovery_cache")]
+            for source in sources:
+                cutoff = now - self.ttl_for(source) - self.stale_seconds
+                removed += self._conn.execute(
+                    "DELETE FROM discovery_cache WHERE source = ? AND stored_at < ?", (source, cutoff)
+                ).rowcount
+            self._conn.commit()
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
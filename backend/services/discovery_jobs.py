@@ -0,0 +1,194 @@
+"""
+WeDealize Discovery Job Tracker
+API 에서 시작한 탐색 파이프라인의 job_id 별 진행 상황 추적 / 이벤트 전파
+
+- 파이프라인이 단계 전환, 건수, 신규 공급사를 이벤트로 발행
+- 구독자(SSE 연결)마다 asyncio.Queue 로 즉시 전달 → 폴링 불필요
+- 이벤트 이력을 보관해 늦게 연결하거나 재연결(Last-Event-ID)해도 처음부터 재생
+- 프로세스 메모리 기반 (API 프로세스 1개 기준, 완료된 작업은 최근 N개만 보관)
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+# 단계별 진행률 (%) - 파이프라인 단계 순서 (discovering → crawling → parsing → storing)
+STAGE_PROGRESS = {
+    "queued": 0,
+    "interpreting": 5,
+    "discovering": 15,
+    "crawling": 40,
+    "parsing": 60,
+    "storing": 80,
+    "completed": 100,
+    "error": 100,
+}
+
+TERMINAL_STAGES = ("completed", "error")
+
+
+@dataclass
+class JobEvent:
+    """진행 이벤트 1건"""
+    id: int
+    event: str  # "stage", "supplier", "counts", "done"
+    data: Dict[str, Any]
+
+    def to_sse(self) -> str:
+        payload = json.dumps(self.data, ensure_ascii=False, default=str)
+        return f"id: {self.id}\nevent: {self.event}\ndata: {payload}\n\n"
+
+
+@dataclass
+class DiscoveryJob:
+    """탐색 작업 상태"""
+    job_id: str
+    query: str
+    stage: str = "queued"
+    suppliers_found: int = 0
+    products_extracted: int = 0
+    catalogs_found: int = 0
+    errors: List[str] = field(default_factory=list)
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    last_event_id: int = 0
+    events: List[JobEvent] = field(default_factory=list)
+    subscribers: Set[asyncio.Queue] = field(default_factory=set)
+
+    @property
+    def progress(self) -> int:
+        return STAGE_PROGRESS.get(self.stage, 0)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.stage in TERMINAL_STAGES
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "query": self.query,
+            "stage": self.stage,
+            "progress": self.progress,
+            "suppliers_found": self.suppliers_found,
+            "products_extracted": self.products_extracted,
+            "catalogs_found": self.catalogs_found,
+            "errors": self.errors,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class DiscoveryJobTracker:
+    """
+    job_id 별 탐색 작업 레지스트리
+
+    job = tracker.create("organic olive oil Italy")
+    await orchestrator.run_discovery_pipeline(query, progress_callback=tracker.callback(job.job_id))
+    async for event in tracker.subscribe(job.job_id):
+        ...
+    """
+
+    def __init__(self, max_finished_jobs: int = 200, max_events_per_job: int = 2000):
+        self.max_finished_jobs = max_finished_jobs
+        self.max_events_per_job = max_events_per_job
+        self._jobs: "OrderedDict[str, DiscoveryJob]" = OrderedDict()
+
+    def create(self, query: str) -> DiscoveryJob:
+        job = DiscoveryJob(job_id=f"job_{uuid.uuid4().hex[:12]}", query=query)
+        self._jobs[job.job_id] = job
+        self._evict()
+        return job
+
+    def get(self, job_id: str) -> Optional[DiscoveryJob]:
+        return self._jobs.get(job_id)
+
+    def _evict(self):
+        finished = [jid for jid, job in self._jobs.items() if job.is_finished]
+        for jid in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[jid]
+
+    # ==================== 발행 ====================
+
+    def publish(self, job_id: str, event: str, data: Dict[str, Any]):
+        """이벤트 발행 (상태 반영 + 이력 저장 + 구독자 전달)"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+
+        if event == "stage":
+            job.stage = data["stage"]
+            if job.is_finished:
+                job.finished_at = datetime.utcnow()
+            data = {**data, "progress": job.progress}
+        elif event == "counts":
+            job.suppliers_found = data.get("suppliers_found", job.suppliers_found)
+            job.products_extracted = data.get("products_extracted", job.products_extracted)
+            job.catalogs_found = data.get("catalogs_found", job.catalogs_found)
+        elif event == "error":
+            job.errors.append(data.get("message", ""))
+
+        job.last_event_id += 1
+        item = JobEvent(id=job.last_event_id, event=event, data=data)
+        job.events.append(item)
+        if len(job.events) > self.max_events_per_job:
+            # 오래된 공급사 이벤트부터 버림 (단계/완료 이벤트는 유지)
+            for n, old in enumerate(job.events):
+                if old.event == "supplier":
+                    del job.events[n]
+                    break
+
+        for queue in job.subscribers:
+            queue.put_nowait(item)
+
+        if job.is_finished and event == "stage":
+            self.publish(job_id, "done", job.snapshot())
+
+    def callback(self, job_id: str):
+        """run_discovery_pipeline(progress_callback=...) 용 콜백"""
+        def emit(event: str, data: Dict[str, Any]):
+            self.publish(job_id, event, data)
+        return emit
+
+    # ==================== 구독 ====================
+
+    async def subscribe(self, job_id: str, last_event_id: int = 0) -> AsyncIterator[JobEvent]:
+        """
+        이벤트 스트림 (이력 재생 후 실시간, "done" 이벤트에서 종료)
+
+        Args:
+            last_event_id: 재연결 시 마지막으로 받은 이벤트 ID (그 이후부터 전달)
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        job.subscribers.add(queue)
+        try:
+            # 구독 등록 후 이력을 복사하므로 그 사이 이벤트가 빠지지 않음 (중복은 ID 로 제거)
+            sent = last_event_id
+            for item in list(job.events):
+                if item.id > sent:
+                    sent = item.id
+                    yield item
+                    if item.event == "done":
+                        return
+
+            while True:
+                item = await queue.get()
+                if item.id <= sent:
+                    continue
+                sent = item.id
+                yield item
+                if item.event == "done":
+                    return
+        finally:
+            job.subscribers.discard(queue)
@@ -19,6 +19,8 @@ import logging
 import hashlib
 import re
 
+from .metrics import track_stage
+
 logger = logging.getLogger(__name__)
 
 
@@ -251,7 +253,9 @@ WeDealize 소싱팀
             msg.attach(MIMEText(template.body_html, "html", "utf-8"))
 
             # SMTP 발송
-            message_id = await self._send_email(msg)
+            with track_stage("email_send", source="smtp") as t:
+                message_id = await self._send_email(msg)
+                t.add_items(1)
 
             request.sent_at = datetime.now()
             request.status = "sent"
@@ -294,38 +298,41 @@ WeDealize 소싱팀
         """
         received_emails = []
 
-        try:
-            # IMAP 연결
-            mail = imaplib.IMAP4_SSL(
-                self.config["imap_host"],
-                self.config.get("imap_port", 993)
-            )
-            mail.login(self.config["email"], self.config["password"])
-            mail.select("INBOX")
-
-            # 최근 7일 이메일 검색
-            since_date = (datetime.now() - timedelta(days=7)).strftime("%d-%b-%Y")
-            _, message_numbers = mail.search(None, f'(SINCE "{since_date}")')
-
-            for num in message_numbers[0].split():
-                _, msg_data = mail.fetch(num, "(RFC822)")
-                email_body = msg_data[0][1]
-                msg = email.message_from_bytes(email_body)
-
-                # 이메일 파싱
-                received = await self._parse_email(msg)
-                if received:
-                    # 첨부파일 저장
-                    received.attachments = await self._save_attachments(msg, received.message_id)
-                    received_emails.append(received)
-
-                    # 우리가 보낸 요청에 대한 회신인지 확인
-                    await self._match_reply_to_request(received)
-
-            mail.logout()
-
-        except Exception as e:
-            logger.error(f"메일함 확인 실패: {e}")
+        with track_stage("email_inbox", source="imap") as t:
+            try:
+                # IMAP 연결
+                mail = imaplib.IMAP4_SSL(
+                    self.config["imap_host"],
+                    self.config.get("imap_port", 993)
+                )
+                mail.login(self.config["email"], self.config["password"])
+                mail.select("INBOX")
+
+                # 최근 7일 이메일 검색
+                since_date = (datetime.now() - timedelta(days=7)).strftime("%d-%b-%Y")
+                _, message_numbers = mail.search(None, f'(SINCE "{since_date}")')
+
+                for num in message_numbers[0].split():
+                    _, msg_data = mail.fetch(num, "(RFC822)")
+                    email_body = msg_data[0][1]
+                    msg = email.message_from_bytes(email_body)
+
+                    # 이메일 파싱
+                    received = await self._parse_email(msg)
+                    if received:
+                        # 첨부파일 저장
+                        received.attachments = await self._save_attachments(msg, received.message_id)
+                        received_emails.append(received)
+                        t.add_items(1)
+
+                        # 우리가 보낸 요청에 대한 회신인지 확인
+                        await self._match_reply_to_request(received)
+
+                mail.logout()
+
+            except Exception as e:
+                t.fail()
+                logger.error(f"메일함 확인 실패: {e}")
 
         return received_emails
 
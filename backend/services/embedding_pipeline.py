@@ -0,0 +1,225 @@
+"""
+WeDealize Embedding Pipeline
+상품 임베딩 일괄 생성 (Product.embedding)
+
+- 정규화 텍스트 해시로 중복 제거: 공급사가 달라도 같은 상품명은 한 번만 임베딩
+- 영구 캐시 (embedding_cache 테이블): 해시 → 벡터
+- 프로바이더 호출당 수백 개 텍스트를 배치로 전송, 배치 간 병렬 처리
+- 기존 상품 백필: product_id 순서로 페이지 처리, 마지막 ID 로 재개 가능
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy.exc import IntegrityError
+
+from ..models.database import EmbeddingCache, Product
+from .metrics import track_stage
+
+logger = logging.getLogger(__name__)
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """임베딩 캐시 키용 텍스트 정규화 (NFKC, 소문자, 공백 정리)"""
+    text = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def text_hash(normalized: str) -> str:
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def product_text(product: Product, description_chars: int = 300) -> str:
+    """상품 임베딩 입력 텍스트 (상품명 중심, 설명은 앞부분만)"""
+    parts = [product.name, product.name_ko]
+    if product.description:
+        parts.append(product.description[:description_chars])
+    return " | ".join(p for p in parts if p)
+
+
+@dataclass
+class EmbeddingProgress:
+    """임베딩 진행 상황"""
+    total: int = 0               # 대상 상품 수 (백필 시작 시점 기준)
+    processed: int = 0           # 처리한 상품 수
+    unique_texts: int = 0        # 중복 제거 후 텍스트 수
+    cache_hits: int = 0          # 캐시에서 찾은 텍스트 수
+    embedded: int = 0            # 프로바이더로 새로 임베딩한 텍스트 수
+    last_product_id: int = 0     # 재개 지점
+
+    @property
+    def percent(self) -> float:
+        return round(self.processed * 100 / self.total, 1) if self.total else 100.0
+
+
+class EmbeddingPipeline:
+    """
+    상품 임베딩 파이프라인
+
+    pipeline = EmbeddingPipeline(db_session, embedding_client)
+    await pipeline.embed_products([1, 2, 3])            # 신규 상품
+    await pipeline.backfill(progress_callback=print)    # 기존 상품 전체
+    """
+
+    def __init__(
+        self,
+        db_session,
+        embedding_client,
+        model_name: str = "text-embedding-3-small",
+        batch_size: int = 256,
+        max_concurrent_batches: int = 4,
+        vector_index=None
+    ):
+        """
+        Args:
+            embedding_client: async embed(texts: List[str]) -> List[List[float]]
+            vector_index: 임베딩 후 증분 반영할 VectorIndex (선택)
+        """
+        self.db = db_session
+        self.embedding_client = embedding_client
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self.vector_index = vector_index
+
+    # ==================== 텍스트 임베딩 (중복 제거 + 캐시 + 배치) ====================
+
+    async def embed_texts(self, texts: Sequence[str], progress: EmbeddingProgress = None) -> List[Any]:
+        """텍스트 목록 임베딩 (입력 순서대로 벡터 반환)"""
+        progress = progress or EmbeddingProgress()
+
+        hashes = []
+        unique: Dict[str, str] = {}  # hash → 정규화 텍스트
+        for t in texts:
+            normalized = normalize_text(t)
+            h = text_hash(normalized)
+            hashes.append(h)
+            unique.setdefault(h, normalized)
+        progress.unique_texts += len(unique)
+
+        vectors = self._load_cached(list(unique.keys()))
+        progress.cache_hits += len(vectors)
+
+        missing = [h for h in unique if h not in vectors]
+        if missing:
+            fresh = await self._embed_batches([unique[h] for h in missing])
+            new_vectors = dict(zip(missing, fresh))
+            self._store_cached(new_vectors)
+            vectors.update(new_vectors)
+            progress.embedded += len(missing)
+
+        return [vectors[h] for h in hashes]
+
+    def _load_cached(self, hashes: List[str]) -> Dict[str, Any]:
+        found = {}
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            rows = self.db.query(EmbeddingCache.text_hash, EmbeddingCache.vector).filter(
+                EmbeddingCache.model == self.model_name,
+                EmbeddingCache.text_hash.in_(chunk)
+            ).all()
+            found.update({row.text_hash: row.vector for row in rows})
+        return found
+
+    def _store_cached(self, vectors: Dict[str, Any]):
+        rows = [
+            {"text_hash": h, "model": self.model_name, "vector": v, "dim": len(v)}
+            for h, v in vectors.items()
+        ]
+        try:
+            self.db.bulk_insert_mappings(EmbeddingCache, rows)
+            self.db.commit()
+        except IntegrityError:
+            # 다른 워커가 같은 텍스트를 먼저 저장함
+            self.db.rollback()
+            for row in rows:
+                self.db.merge(EmbeddingCache(**row))
+            self.db.commit()
+
+    async def _embed_batches(self, texts: List[str]) -> List[Any]:
+        """프로바이더 배치 호출 (배치 간 병렬)"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+
+        async def run(batch: List[str]) -> List[Any]:
+            async with semaphore:
+                with track_stage("embed", source=self.model_name) as t:
+                    result = await self.embedding_client.embed(batch)
+                    if len(result) != len(batch):
+                        raise ValueError(f"임베딩 응답 수 불일치: {len(result)} != {len(batch)}")
+                    t.add_items(len(batch))
+                    return result
+
+        results = await asyncio.gather(*(run(b) for b in batches))
+        return [vec for batch in results for vec in batch]
+
+    # ==================== 상품 임베딩 ====================
+
+    async def embed_products(self, product_ids: Sequence[int], progress: EmbeddingProgress = None) -> EmbeddingProgress:
+        """상품 임베딩 생성 후 저장"""
+        progress = progress or EmbeddingProgress(total=len(product_ids))
+        products = self.db.query(Product).filter(Product.id.in_(list(product_ids))).order_by(Product.id).all()
+        await self._embed_and_save(products, progress)
+        self._sync_index()
+        return progress
+
+    async def _embed_and_save(self, products: List[Product], progress: EmbeddingProgress):
+        if not products:
+            return
+        vectors = await self.embed_texts([product_text(p) for p in products], progress)
+        for product, vector in zip(products, vectors):
+            product.embedding = vector
+        self.db.commit()
+
+        progress.processed += len(products)
+        progress.last_product_id = products[-1].id
+
+    async def backfill(
+        self,
+        start_after_id: int = 0,
+        page_size: int = 2000,
+        only_missing: bool = True,
+        progress_callback: Optional[Callable[[EmbeddingProgress], None]] = None
+    ) -> EmbeddingProgress:
+        """
+        기존 상품 임베딩 백필 (product_id 순서, 페이지 단위 커밋)
+
+        중단되면 progress.last_product_id 를 start_after_id 로 넘겨 재개합니다.
+        """
+        base = self.db.query(Product).filter(Product.is_active.isnot(False))
+        if only_missing:
+            base = base.filter(Product.embedding.is_(None))
+
+        progress = EmbeddingProgress(
+            total=base.filter(Product.id > start_after_id).count(),
+            last_product_id=start_after_id
+        )
+        logger.info(f"임베딩 백필 시작: {progress.total}개 (ID > {start_after_id})")
+
+        while True:
+            page = base.filter(Product.id > progress.last_product_id).order_by(Product.id).limit(page_size).all()
+            if not page:
+                break
+
+            await self._embed_and_save(page, progress)
+            logger.info(
+                f"임베딩 백필 {progress.percent}% ({progress.processed}/{progress.total}, "
+                f"캐시 {progress.cache_hits}, 신규 {progress.embedded})"
+            )
+            if progress_callback:
+                progress_callback(progress)
+
+        self._sync_index()
+        return progress
+
+    def _sync_index(self):
+        if self.vector_index is not None:
+            self.vector_index.sync_from_db(self.db)
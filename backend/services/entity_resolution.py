@@ -0,0 +1,377 @@
+"""
+WeDealize Supplier Entity Resolution
+여러 데이터 소스에서 발견된 공급사 중복 판별 / 병합
+
+- 상호 정규화: NFKC, 소문자, 구두점 제거, 법인 접미사 제거
+  ("Shandong Jining Green Food Co., Ltd." == "Shandong Jining Green Food Co")
+- 웹사이트 도메인 정규화 (www 제거, 마켓플레이스 상점은 서브도메인 유지)
+- 블로킹 키(도메인, 정규화 상호) + 상호 문자 3-gram MinHash LSH 로 후보 생성
+- 후보 쌍만 Jaccard 유사도로 검증 → 비교 횟수가 공급사 수의 제곱이 아니라 후보 수에 비례
+- DB 기존 공급사는 supplier_match_keys 색인으로 같은 방식으로 조회
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+from sqlalchemy import delete
+
+from ..models.database import Supplier, SupplierMatchKey
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== 정규화 ====================
+
+# 정규화 후 토큰 단위로 제거되는 법인 형태 / 일반 접미사
+LEGAL_SUFFIXES = {
+    "co", "company", "companies", "corp", "corporation", "inc", "incorporated", "ltd", "limited",
+    "llc", "llp", "lp", "plc", "gmbh", "ag", "kg", "mbh", "srl", "spa", "sa", "sas", "sarl", "sl",
+    "bv", "nv", "oy", "ab", "as", "aps", "pty", "pte", "kk", "kabushiki", "kaisha", "jsc", "ooo",
+    "sdn", "bhd", "tbk", "pvt", "cv", "the", "and",
+    "주식회사", "유한회사", "㈜",
+}
+
+# 상호에서 빠지는 한글 법인 표기 (토큰에 붙어 있는 경우)
+_KOREAN_LEGAL = re.compile(r"\(주\)|\(유\)|주식회사|유한회사|㈜")
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+# 공급사 자체 도메인이 아닌 호스트 (도메인 키로 쓰지 않거나 서브도메인까지 유지)
+MARKETPLACE_DOMAINS = ("alibaba.com", "globalsources.com", "tradekorea.com", "made-in-china.com", "indiamart.com")
+GENERIC_DOMAINS = {
+    "facebook.com", "linkedin.com", "instagram.com", "twitter.com", "x.com", "youtube.com",
+    "google.com", "sites.google.com", "wixsite.com", "blogspot.com", "example.com",
+}
+
+# 2단계 공개 접미사 (example.co.kr → example.co.kr 유지)
+_SECOND_LEVEL = {"co", "com", "net", "org", "ac", "or", "ne", "go", "gov", "edu"}
+
+
+def normalize_name(name: str) -> str:
+    """상호 정규화 (법인 접미사 제거)"""
+    text = unicodedata.normalize("NFKC", name or "").lower()
+    text = _KOREAN_LEGAL.sub(" ", text)
+    tokens = [t for t in _NON_WORD.sub(" ", text).split() if t not in LEGAL_SUFFIXES]
+    return " ".join(tokens)
+
+
+def normalize_domain(url: Optional[str]) -> Optional[str]:
+    """
+    웹사이트 URL → 비교용 도메인
+
+    마켓플레이스는 상점 서브도메인(xyz.en.alibaba.com → xyz.alibaba.com)을,
+    SNS 등 공용 호스트는 None 을 반환합니다.
+    """
+    if not url:
+        return None
+    if "://" not in url:
+        url = "http://" + url
+    host = (urlparse(url.strip()).hostname or "").lower().rstrip(".")
+    if not host or "." not in host:
+        return None
+    if host.startswith("www."):
+        host = host[4:]
+
+    labels = host.split(".")
+    for marketplace in MARKETPLACE_DOMAINS:
+        if host == marketplace:
+            return None  # 상점 식별 불가
+        if host.endswith("." + marketplace):
+            store = labels[0]
+            return f"{store}.{marketplace}"
+
+    keep = 3 if len(labels) >= 3 and labels[-2] in _SECOND_LEVEL and len(labels[-1]) == 2 else 2
+    domain = ".".join(labels[-keep:])
+    if domain in GENERIC_DOMAINS or host in GENERIC_DOMAINS:
+        return None
+    return domain
+
+
+def normalize_country(country: Optional[str]) -> str:
+    return (country or "").strip().lower()
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    """문자 k-gram 집합 (짧은 상호는 상호 전체)"""
+    text = f" {text} "
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+# ==================== MinHash LSH ====================
+
+_PRIME = np.uint64(4294967291)  # 2^32 미만 최대 소수 (a * x 가 uint64 안에서 정확)
+
+
+class MinHasher:
+    """
+    MinHash 서명 + LSH 밴드 키
+
+    num_perm = bands * rows. 기본값(16 x 4)은 Jaccard 약 0.5 이상인 쌍을 높은 확률로 후보로 만듭니다.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4, seed: int = 7):
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.RandomState(seed)
+        num_perm = bands * rows
+        self._a = rng.randint(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, grams: Iterable[str]) -> np.ndarray:
+        values = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=4).digest(), "big") for g in grams),
+            dtype=np.uint64
+        )
+        if values.size == 0:
+            return np.full(self.bands * self.rows, _PRIME, dtype=np.uint64)
+        hashed = (np.outer(values, self._a) % _PRIME + self._b) % _PRIME
+        return hashed.min(axis=0)
+
+    def band_keys(self, signature: np.ndarray) -> List[str]:
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            keys.append(f"b:{band}:{hashlib.blake2b(chunk, digest_size=8).hexdigest()}")
+        return keys
+
+
+@dataclass
+class _Record:
+    """판별용 정규화 레코드"""
+    index: int
+    name_key: str
+    domain: Optional[str]
+    country: str
+    grams: Set[str]
+    keys: List[str]
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+# ==================== 판별기 ====================
+
+class SupplierResolver:
+    """
+    공급사 엔티티 판별
+
+    resolver = SupplierResolver(db_session)
+    merged = resolver.merge_discovered(discovered)     # 배치 내 중복 병합
+    existing = resolver.find_existing(merged[0])       # DB 기존 공급사 매칭
+    resolver.index_supplier(supplier)                  # 저장 후 키 색인
+    """
+
+    def __init__(
+        self,
+        db_session=None,
+        name_threshold: float = 0.8,
+        max_bucket_size: int = 500,
+        minhasher: MinHasher = None
+    ):
+        """
+        Args:
+            name_threshold: 같은 공급사로 볼 상호 3-gram Jaccard 최소값
+            max_bucket_size: 이보다 큰 LSH 버킷은 비교 생략 (흔한 상호로 인한 비교 폭증 방지)
+        """
+        self.db = db_session
+        self.name_threshold = name_threshold
+        self.max_bucket_size = max_bucket_size
+        self.minhasher = minhasher or MinHasher()
+
+    def _record(self, index: int, name: str, website: Optional[str], country: Optional[str]) -> _Record:
+        name_key = normalize_name(name)
+        domain = normalize_domain(website)
+        grams = shingles(name_key) if name_key else set()
+
+        keys = []
+        if domain:
+            keys.append(f"d:{domain}")
+        if name_key:
+            keys.append(f"n:{name_key}"[:300])
+            keys.extend(self.minhasher.band_keys(self.minhasher.signature(grams)))
+        return _Record(index, name_key, domain, normalize_country(country), grams, keys)
+
+    def is_match(self, a: _Record, b: _Record) -> bool:
+        """도메인이 같거나, 국가가 충돌하지 않고 상호가 충분히 비슷하면 동일 공급사"""
+        if a.domain and a.domain == b.domain:
+            return True
+        if a.country and b.country and a.country != b.country:
+            return False
+        if a.domain and b.domain and a.domain != b.domain and a.name_key != b.name_key:
+            return False  # 서로 다른 자체 도메인은 상호가 정확히 같을 때만
+        if a.name_key and a.name_key == b.name_key:
+            return True
+        return jaccard(a.grams, b.grams) >= self.name_threshold
+
+    # ---------- 배치 내 병합 ----------
+
+    def cluster(self, records: Sequence[_Record]) -> List[List[int]]:
+        """블로킹 키 버킷 안에서만 비교해 클러스터 생성"""
+        buckets: Dict[str, List[int]] = {}
+        for r in records:
+            for key in r.keys:
+                buckets.setdefault(key, []).append(r.index)
+
+        uf = _UnionFind(len(records))
+        compared: Set[Tuple[int, int]] = set()
+        for key, members in buckets.items():
+            if len(members) < 2:
+                continue
+            if key.startswith("d:"):
+                # 같은 도메인은 비교 없이 병합 (버킷 크기에 선형)
+                for other in members[1:]:
+                    uf.union(members[0], other)
+                continue
+            if len(members) > self.max_bucket_size and not key.startswith("n:"):
+                continue
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    pair = (a, b) if a < b else (b, a)
+                    if pair in compared or uf.find(a) == uf.find(b):
+                        continue
+                    compared.add(pair)
+                    if self.is_match(records[a], records[b]):
+                        uf.union(a, b)
+
+        groups: Dict[int, List[int]] = {}
+        for r in records:
+            groups.setdefault(uf.find(r.index), []).append(r.index)
+        return list(groups.values())
+
+    def merge_discovered(self, suppliers: Sequence[Any]) -> List[Any]:
+        """
+        DiscoveredSupplier 목록 중복 병합
+
+        신뢰도가 가장 높은 레코드를 대표로 하고 인증/카테고리/연락처를 합칩니다.
+        입력 순서(첫 등장 위치)를 유지합니다.
+        """
+        records = [self._record(i, s.name, s.website, s.country) for i, s in enumerate(suppliers)]
+        clusters = sorted(self.cluster(records), key=min)
+
+        merged = []
+        for members in clusters:
+            group = [suppliers[i] for i in members]
+            merged.append(group[0] if len(group) == 1 else merge_suppliers(group))
+
+        if len(merged) < len(suppliers):
+            logger.info(f"공급사 중복 병합: {len(suppliers)}개 → {len(merged)}개")
+        return merged
+
+    # ---------- DB 매칭 ----------
+
+    def find_existing(self, supplier: Any) -> Optional[Supplier]:
+        """supplier_match_keys 색인으로 후보를 찾고 검증해 기존 공급사 반환"""
+        record = self._record(0, supplier.name, supplier.website, supplier.country)
+        if not record.keys:
+            return None
+
+        rows = self.db.query(SupplierMatchKey.supplier_id, SupplierMatchKey.key).filter(
+            SupplierMatchKey.key.in_(record.keys)
+        ).all()
+
+        # 겹치는 키가 많은 후보부터 (도메인/상호 키는 가중)
+        scores: Dict[int, int] = {}
+        for row in rows:
+            weight = 1 if row.key.startswith("b:") else self.minhasher.bands
+            scores[row.supplier_id] = scores.get(row.supplier_id, 0) + weight
+        candidate_ids = sorted(scores, key=lambda sid: -scores[sid])[:self.max_bucket_size]
+        if not candidate_ids:
+            return None
+
+        candidates = {s.id: s for s in self.db.query(Supplier).filter(Supplier.id.in_(candidate_ids)).all()}
+        for sid in candidate_ids:
+            existing = candidates.get(sid)
+            if existing is None:
+                continue
+            other = self._record(1, existing.name, existing.website, existing.country)
+            if self.is_match(record, other):
+                return existing
+        return None
+
+    def index_supplier(self, supplier: Supplier):
+        """공급사 블로킹 키 (재)색인 (commit 은 호출자가)"""
+        self.db.execute(delete(SupplierMatchKey).where(SupplierMatchKey.supplier_id == supplier.id))
+        record = self._record(0, supplier.name, supplier.website, supplier.country)
+        self.db.bulk_insert_mappings(SupplierMatchKey, [
+            {"supplier_id": supplier.id, "key": key} for key in dict.fromkeys(record.keys)
+        ])
+
+    def ensure_index(self):
+        """키 색인이 비어 있는데 공급사가 있으면 (도입 직후) 전체 색인"""
+        if self.db.query(SupplierMatchKey.id).first() is None and self.db.query(Supplier.id).first() is not None:
+            self.rebuild_index()
+
+    def rebuild_index(self, batch_size: int = 1000) -> int:
+        """기존 공급사 전체 키 재색인, 색인된 공급사 수 반환"""
+        self.db.execute(delete(SupplierMatchKey))
+        count = 0
+        rows = []
+        for supplier in self.db.query(Supplier.id, Supplier.name, Supplier.website, Supplier.country).yield_per(batch_size):
+            record = self._record(0, supplier.name, supplier.website, supplier.country)
+            rows.extend({"supplier_id": supplier.id, "key": key} for key in dict.fromkeys(record.keys))
+            count += 1
+            if len(rows) >= batch_size * 10:
+                self.db.bulk_insert_mappings(SupplierMatchKey, rows)
+                rows = []
+        if rows:
+            self.db.bulk_insert_mappings(SupplierMatchKey, rows)
+        self.db.commit()
+        logger.info(f"공급사 매칭 키 재색인 완료: {count}개")
+        return count
+
+
+def merge_suppliers(group: Sequence[Any]) -> Any:
+    """같은 공급사로 판별된 DiscoveredSupplier 들을 하나로 병합"""
+    best = max(group, key=lambda s: s.confidence_score or 0.0)
+
+    def union(attr: str) -> List[str]:
+        return list(dict.fromkeys(v for s in group for v in (getattr(s, attr) or [])))
+
+    contact_info = {}
+    for s in sorted(group, key=lambda s: -(s.confidence_score or 0.0)):
+        for key, value in (s.contact_info or {}).items():
+            if value and not contact_info.get(key):
+                contact_info[key] = value
+
+    website = best.website or next((s.website for s in group if s.website), None)
+    country = best.country or next((s.country for s in group if s.country), "")
+
+    return replace(
+        best,
+        website=website,
+        country=country,
+        certifications=union("certifications"),
+        product_categories=union("product_categories"),
+        contact_info=contact_info,
+        raw_data={
+            **(best.raw_data or {}),
+            "merged_sources": list(dict.fromkeys(s.source for s in group)),
+            "merged_names": list(dict.fromkeys(s.name for s in group)),
+        }
+    )
@@ -0,0 +1,403 @@
+"""
+WeDealize Job Queue
+crawl_jobs 테이블 기반 내구성 작업 큐 (다중 워커 / 다중 노드)
+
+- Postgres: SELECT ... FOR UPDATE SKIP LOCKED 로 작업 점유
+- SQLite: 조건부 UPDATE (compare-and-swap) 로 작업 점유
+- 리스 + 하트비트: 워커가 죽으면 리스 만료 후 다른 워커가 회수
+- 지수 백오프 재시도, 단계별 체크포인트
+"""
+
+import asyncio
+import os
+import random
+import socket
+import uuid
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import sessionmaker
+
+from ..config.settings import WorkerConfig
+from ..models.database import CrawlJob, CrawlStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClaimedJob:
+    """워커가 점유한 작업 (세션과 분리된 스냅샷)"""
+    id: int
+    job_type: str
+    supplier_id: Optional[int]
+    target_url: Optional[str]
+    search_query: Optional[str]
+    payload: Dict[str, Any]
+    checkpoint: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+    lease_owner: str
+
+
+@dataclass
+class JobOutcome:
+    """핸들러 실행 결과"""
+    items_found: int = 0
+    items_saved: int = 0
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+class JobQueue:
+    """
+    crawl_jobs 기반 작업 큐
+
+    모든 상태 변경은 lease_owner 로 보호됩니다 (리스를 잃은 워커의 쓰기는 무시).
+    """
+
+    def __init__(self, engine, config: WorkerConfig = None):
+        self.engine = engine
+        self.config = config or WorkerConfig()
+        self._Session = sessionmaker(bind=engine)
+        self._use_skip_locked = engine.dialect.name == "postgresql"
+
+    # ==================== 등록 ====================
+
+    def enqueue(
+        self,
+        job_type: str,
+        payload: Dict[str, Any] = None,
+        supplier_id: Optional[int] = None,
+        target_url: Optional[str] = None,
+        search_query: Optional[str] = None,
+        priority: int = 0,
+        max_attempts: Optional[int] = None,
+        parent_job_id: Optional[int] = None,
+        run_at: Optional[datetime] = None
+    ) -> int:
+        """작업 등록 후 job ID 반환"""
+        with self._Session() as session, session.begin():
+            job = CrawlJob(
+                job_type=job_type,
+                supplier_id=supplier_id,
+                target_url=target_url,
+                search_query=search_query,
+                config=payload or {},
+                status=CrawlStatus.PENDING,
+                priority=priority,
+                attempts=0,
+                max_attempts=max_attempts or self.config.max_attempts,
+                next_run_at=run_at or datetime.utcnow(),
+                parent_job_id=parent_job_id,
+                checkpoint={}
+            )
+            session.add(job)
+            session.flush()
+            return job.id
+
+    # ==================== 점유 ====================
+
+    def _claimable(self, now: datetime, job_types: Optional[List[str]]):
+        """점유 가능 조건: 실행 시각이 된 대기 작업 또는 리스가 만료된 진행 작업"""
+        condition = or_(
+            and_(CrawlJob.status == CrawlStatus.PENDING, CrawlJob.next_run_at <= now),
+            and_(CrawlJob.status == CrawlStatus.IN_PROGRESS, CrawlJob.lease_expires_at < now),
+        )
+        if job_types:
+            condition = and_(condition, CrawlJob.job_type.in_(job_types))
+        return condition
+
+    def claim(self, worker_id: str, job_types: Optional[List[str]] = None) -> Optional[ClaimedJob]:
+        """다음 작업 하나를 점유 (없으면 None)"""
+        if self._use_skip_locked:
+            return self._claim_skip_locked(worker_id, job_types)
+        return self._claim_compare_and_swap(worker_id, job_types)
+
+    def _lease_values(self, worker_id: str, now: datetime) -> Dict[str, Any]:
+        return {
+            "status": CrawlStatus.IN_PROGRESS,
+            "lease_owner": worker_id,
+            "lease_expires_at": now + timedelta(seconds=self.config.lease_seconds),
+            "heartbeat_at": now,
+            "attempts": CrawlJob.attempts + 1,
+            "started_at": now,
+        }
+
+    def _claim_skip_locked(self, worker_id: str, job_types: Optional[List[str]]) -> Optional[ClaimedJob]:
+        """Postgres: 다른 워커가 잠근 행은 건너뛰고 점유"""
+        now = datetime.utcnow()
+        with self._Session() as session, session.begin():
+            job_id = session.execute(
+                select(CrawlJob.id)
+                .where(self._claimable(now, job_types))
+                .order_by(CrawlJob.priority.desc(), CrawlJob.next_run_at, CrawlJob.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).scalar_one_or_none()
+
+            if job_id is None:
+                return None
+
+            session.execute(
+                update(CrawlJob)
+                .where(CrawlJob.id == job_id)
+                .values(**self._lease_values(worker_id, now))
+            )
+            return self._snapshot(session.get(CrawlJob, job_id, populate_existing=True))
+
+    def _claim_compare_and_swap(self, worker_id: str, job_types: Optional[List[str]]) -> Optional[ClaimedJob]:
+        """SQLite 등: 후보를 읽은 뒤 조건부 UPDATE 로 경쟁 (rowcount == 1 이면 승리)"""
+        now = datetime.utcnow()
+        with self._Session() as session:
+            candidates = session.execute(
+                select(CrawlJob.id)
+                .where(self._claimable(now, job_types))
+                .order_by(CrawlJob.priority.desc(), CrawlJob.next_run_at, CrawlJob.id)
+                .limit(10)
+            ).scalars().all()
+
+        for job_id in candidates:
+            with self._Session() as session, session.begin():
+                result = session.execute(
+                    update(CrawlJob)
+                    .where(CrawlJob.id == job_id, self._claimable(now, job_types))
+                    .values(**self._lease_values(worker_id, now))
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 1:
+                    return self._snapshot(session.get(CrawlJob, job_id))
+
+        return None
+
+    def _snapshot(self, job: CrawlJob) -> ClaimedJob:
+        return ClaimedJob(
+            id=job.id,
+            job_type=job.job_type,
+            supplier_id=job.supplier_id,
+            target_url=job.target_url,
+            search_query=job.search_query,
+            payload=dict(job.config or {}),
+            checkpoint=dict(job.checkpoint or {}),
+            attempts=job.attempts,
+            max_attempts=job.max_attempts,
+            lease_owner=job.lease_owner,
+        )
+
+    # ==================== 리스 보호 쓰기 ====================
+
+    def _update_owned(self, job_id: int, worker_id: str, **values) -> bool:
+        """리스를 가진 워커만 갱신 가능 (리스를 잃었으면 False)"""
+        with self._Session() as session, session.begin():
+            result = session.execute(
+                update(CrawlJob)
+                .where(
+                    CrawlJob.id == job_id,
+                    CrawlJob.lease_owner == worker_id,
+                    CrawlJob.status == CrawlStatus.IN_PROGRESS,
+                )
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount == 1
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """리스 연장"""
+        now = datetime.utcnow()
+        return self._update_owned(
+            job_id, worker_id,
+            heartbeat_at=now,
+            lease_expires_at=now + timedelta(seconds=self.config.lease_seconds)
+        )
+
+    def save_checkpoint(self, job_id: int, worker_id: str, checkpoint: Dict[str, Any]) -> bool:
+        """단계별 체크포인트 저장 (재시작 시 이 지점부터 재개)"""
+        return self._update_owned(job_id, worker_id, checkpoint=checkpoint)
+
+    def complete(self, job_id: int, worker_id: str, outcome: JobOutcome = None) -> bool:
+        """작업 완료"""
+        outcome = outcome or JobOutcome()
+        return self._update_owned(
+            job_id, worker_id,
+            status=CrawlStatus.COMPLETED,
+            completed_at=datetime.utcnow(),
+            items_found=outcome.items_found,
+            items_saved=outcome.items_saved,
+            lease_owner=None,
+            lease_expires_at=None,
+            error_message=None
+        )
+
+    def fail(self, job_id: int, worker_id: str, error: str, attempts: int, max_attempts: int) -> bool:
+        """작업 실패: 재시도 횟수가 남았으면 백오프 후 재등록, 아니면 FAILED"""
+        if attempts >= max_attempts:
+            logger.error(f"작업 최종 실패 (job={job_id}, 시도 {attempts}회): {error}")
+            return self._update_owned(
+                job_id, worker_id,
+                status=CrawlStatus.FAILED,
+                completed_at=datetime.utcnow(),
+                error_message=error,
+                lease_owner=None,
+                lease_expires_at=None
+            )
+
+        delay = self.retry_delay(attempts)
+        logger.warning(f"작업 실패, {delay:.0f}초 후 재시도 (job={job_id}, 시도 {attempts}회): {error}")
+        return self._update_owned(
+            job_id, worker_id,
+            status=CrawlStatus.PENDING,
+            next_run_at=datetime.utcnow() + timedelta(seconds=delay),
+            error_message=error,
+            lease_owner=None,
+            lease_expires_at=None
+        )
+
+    def retry_delay(self, attempts: int) -> float:
+        """지수 백오프 + jitter (동시 재시도 몰림 방지)"""
+        base = self.config.retry_backoff_base_seconds * (2 ** max(attempts - 1, 0))
+        capped = min(base, self.config.retry_backoff_max_seconds)
+        return capped * (0.5 + random.random() / 2)
+
+    # ==================== 조회 ====================
+
+    def get_job(self, job_id: int) -> Optional[CrawlJob]:
+        """작업 조회 (세션에서 분리된 객체)"""
+        with self._Session(expire_on_commit=False) as session:
+            job = session.get(CrawlJob, job_id)
+            if job:
+                session.expunge(job)
+            return job
+
+    def count_by_status(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        with self._Session() as session:
+            rows = session.execute(
+                select(CrawlJob.status, func.count(CrawlJob.id)).group_by(CrawlJob.status)
+            ).all()
+            return {status.value: count for status, count in rows}
+
+
+# 핸들러 시그니처: async def handler(ctx: JobContext) -> Optional[JobOutcome]
+JobHandler = Callable[["JobContext"], Awaitable[Optional[JobOutcome]]]
+
+
+class LeaseLostError(Exception):
+    """다른 워커가 작업을 회수함"""
+
+
+class JobContext:
+    """핸들러에 전달되는 실행 컨텍스트"""
+
+    def __init__(self, queue: JobQueue, job: ClaimedJob, worker_id: str):
+        self.queue = queue
+        self.job = job
+        self.worker_id = worker_id
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return self.job.payload
+
+    def get_checkpoint(self, stage: str) -> Optional[Dict[str, Any]]:
+        """이전 실행에서 저장한 단계 체크포인트"""
+        return self.job.checkpoint.get(stage)
+
+    def checkpoint(self, stage: str, data: Dict[str, Any]):
+        """단계 체크포인트 저장"""
+        self.job.checkpoint[stage] = data
+        if not self.queue.save_checkpoint(self.job.id, self.worker_id, dict(self.job.checkpoint)):
+            raise LeaseLostError(f"리스 상실 (job={self.job.id})")
+
+    def enqueue(self, job_type: str, **kwargs) -> int:
+        """후속 단계 작업 등록 (parent_job_id 자동 설정)"""
+        kwargs.setdefault("parent_job_id", self.job.id)
+        return self.queue.enqueue(job_type, **kwargs)
+
+
+class JobWorker:
+    """
+    작업 큐 워커
+
+    N개의 워커 프로세스(단일/다중 노드)가 같은 DB를 바라보며 작업을 병렬 처리합니다.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Dict[str, JobHandler],
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.queue = queue
+        self.handlers = handlers
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.concurrency = concurrency or queue.config.concurrency
+        self._stop = asyncio.Event()
+
+    def stop(self):
+        """현재 작업을 마친 뒤 종료"""
+        self._stop.set()
+
+    async def run(self):
+        """워커 루프 실행 (stop() 호출 시 종료)"""
+        logger.info(f"워커 시작: {self.worker_id} (동시 작업 {self.concurrency}개)")
+        slots = [asyncio.create_task(self._slot_loop()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*slots)
+        finally:
+            logger.info(f"워커 종료: {self.worker_id}")
+
+    async def _slot_loop(self):
+        job_types = list(self.handlers.keys())
+        while not self._stop.is_set():
+            job = self.queue.claim(self.worker_id, job_types)
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.queue.config.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self.run_job(job)
+
+    async def run_job(self, job: ClaimedJob):
+        """점유한 작업 실행 (하트비트 유지, 완료/실패 기록)"""
+        handler = self.handlers.get(job.job_type)
+        if handler is None:
+            self.queue.fail(job.id, self.worker_id, f"핸들러 없음: {job.job_type}", job.max_attempts, job.max_attempts)
+            return
+
+        # 워커가 반복해서 죽는 작업(poison job) 방지
+        if job.attempts > job.max_attempts:
+            self.queue.fail(job.id, self.worker_id, "최대 시도 횟수 초과", job.attempts, job.max_attempts)
+            return
+
+        ctx = JobContext(self.queue, job, self.worker_id)
+        task = asyncio.create_task(handler(ctx))
+        heartbeat = asyncio.create_task(self._heartbeat_loop(job, task))
+
+        try:
+            outcome = await task
+            self.queue.complete(job.id, self.worker_id, outcome)
+            logger.info(f"작업 완료: {job.job_type} (job={job.id})")
+        except asyncio.CancelledError:
+            if not (heartbeat.done() and heartbeat.result()):
+                raise
+            # 리스 상실로 취소됨 - 다른 워커가 이어서 처리
+            logger.warning(f"리스 상실로 작업 중단: {job.job_type} (job={job.id})")
+        except LeaseLostError as e:
+            logger.warning(str(e))
+        except Exception as e:
+            self.queue.fail(job.id, self.worker_id, str(e), job.attempts, job.max_attempts)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat_loop(self, job: ClaimedJob, task: asyncio.Task) -> bool:
+        """주기적으로 리스 연장, 리스를 잃으면 작업을 취소하고 True 반환"""
+        interval = self.queue.config.heartbeat_interval_seconds
+        while not task.done():
+            await asyncio.sleep(interval)
+            if not self.queue.heartbeat(job.id, self.worker_id):
+                task.cancel()
+                return True
+        return False
@@ -0,0 +1,143 @@
+"""
+WeDealize Pipeline Metrics
+단계별 / 데이터 소스별 파이프라인 지표 (Prometheus 형식)
+
+- wedealize_stage_duration_seconds: 단계 실행 시간 히스토그램
+- wedealize_stage_items_total: 처리 항목 수
+- wedealize_stage_errors_total: 오류 수
+- wedealize_stage_in_flight: 실행 중인 단계 수
+
+다중 프로세스 워커는 PROMETHEUS_MULTIPROC_DIR 환경 변수를 설정하면
+프로세스별 값 파일이 /metrics 에서 합산됩니다.
+prometheus_client 가 없으면 시간 측정만 하고 지표는 기록하지 않습니다.
+"""
+
+import os
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    PROMETHEUS_AVAILABLE = False
+
+
+LABELS = ["stage", "source"]
+
+# 크롤링/LLM 호출은 수십 초까지 걸리므로 기본 버킷보다 넓게
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+if PROMETHEUS_AVAILABLE:
+    STAGE_DURATION = Histogram(
+        "wedealize_stage_duration_seconds",
+        "Pipeline stage latency",
+        LABELS,
+        buckets=DURATION_BUCKETS,
+    )
+    STAGE_ITEMS = Counter(
+        "wedealize_stage_items_total",
+        "Items produced by a pipeline stage",
+        LABELS,
+    )
+    STAGE_ERRORS = Counter(
+        "wedealize_stage_errors_total",
+        "Errors raised or recorded by a pipeline stage",
+        LABELS,
+    )
+    STAGE_IN_FLIGHT = Gauge(
+        "wedealize_stage_in_flight",
+        "Pipeline stages currently running",
+        LABELS,
+        multiprocess_mode="livesum",
+    )
+
+
+class StageTracker:
+    """단계 실행 1회에 대한 측정값"""
+
+    def __init__(self, stage: str, source: str):
+        self.stage = stage
+        self.source = source
+        self.items = 0
+        self.failed = False
+        self.elapsed = 0.0
+
+    def add_items(self, count: int = 1):
+        """처리 항목 수 추가"""
+        self.items += count
+
+    def fail(self):
+        """예외를 삼키는 코드 경로에서 오류로 기록"""
+        self.failed = True
+
+
+@contextmanager
+def track_stage(stage: str, source: str = "all") -> Iterator[StageTracker]:
+    """
+    단계 실행 측정
+
+    with track_stage("catalog_parse", source="pdf") as t:
+        products = ...
+        t.add_items(len(products))
+    """
+    tracker = StageTracker(stage, source)
+    labels = (stage, source)
+
+    if PROMETHEUS_AVAILABLE:
+        STAGE_IN_FLIGHT.labels(*labels).inc()
+
+    start = time.perf_counter()
+    try:
+        yield tracker
+    except BaseException:
+        tracker.failed = True
+        raise
+    finally:
+        tracker.elapsed = time.perf_counter() - start
+        if PROMETHEUS_AVAILABLE:
+            STAGE_IN_FLIGHT.labels(*labels).dec()
+            STAGE_DURATION.labels(*labels).observe(tracker.elapsed)
+            if tracker.items:
+                STAGE_ITEMS.labels(*labels).inc(tracker.items)
+            if tracker.failed:
+                STAGE_ERRORS.labels(*labels).inc()
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """/metrics 응답 본문과 Content-Type 반환"""
+    if not PROMETHEUS_AVAILABLE:
+        return b"# prometheus_client not installed\n", "text/plain; version=0.0.4; charset=utf-8"
+
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # 다중 프로세스: 모든 워커의 값 파일을 합산
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: Optional[int] = None):
+    """워커 종료 시 livesum 게이지에서 해당 프로세스 값 제거"""
+    if PROMETHEUS_AVAILABLE and os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def summarize_timings(trackers: Dict[str, StageTracker]) -> Dict[str, float]:
+    """PipelineResult.stage_timings 용 {단계: 초}"""
+    return {name: round(t.elapsed, 3) for name, t in trackers.items()}
@@ -0,0 +1,243 @@
+"""
+WeDealize Price Refresh
+공급사 웹사이트 / 카탈로그 증분 재크롤링
+
+- URL별 ETag, Last-Modified 저장 → 조건부 GET (304 면 다운로드 없음)
+- 정규화 콘텐츠의 sha256 / simhash 저장 → 내용이 그대로면 파싱 생략
+- 대역폭과 파싱 작업이 공급사 수가 아니라 변경량에 비례
+"""
+
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from ..crawlers.politeness import PolitenessPolicy, RobotsDisallowed
+from ..models.database import CrawlFingerprint
+from .metrics import track_stage
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== 콘텐츠 지문 ====================
+
+_SCRIPT_STYLE = re.compile(r"<(script|style|noscript)\b.*?</\1>", re.IGNORECASE | re.DOTALL)
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+TEXT_CONTENT_TYPES = ("text/", "application/xhtml", "application/json", "application/xml")
+
+
+def normalize_html(html: str) -> str:
+    """
+    변경 감지용 HTML 정규화
+
+    스크립트/스타일/주석(세션 토큰, 빌드 해시 등 매번 바뀌는 부분)과 태그를 제거하고
+    보이는 텍스트만 남깁니다. 가격 숫자는 유지합니다.
+    """
+    text = _SCRIPT_STYLE.sub(" ", html)
+    text = _COMMENT.sub(" ", text)
+    text = _TAG.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def simhash(text: str, bits: int = 64) -> int:
+    """단어 3-gram simhash (비슷한 문서는 해밍 거리가 작음)"""
+    words = _WORD.findall(text)
+    shingles = [" ".join(words[i:i + 3]) for i in range(max(len(words) - 2, 1))] if words else []
+
+    weights = [0] * bits
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=bits // 8).digest(), "big")
+        for i in range(bits):
+            weights[i] += 1 if (h >> i) & 1 else -1
+
+    return sum(1 << i for i in range(bits) if weights[i] > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class RefreshResult:
+    """URL 1건의 갱신 확인 결과"""
+    url: str
+    status: str  # "new", "changed", "unchanged", "not_modified", "error"
+    content: Optional[bytes] = None  # 변경된 경우에만
+    content_type: Optional[str] = None
+    bytes_downloaded: int = 0
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        return self.status in ("new", "changed")
+
+
+class RefreshEngine:
+    """
+    증분 갱신 엔진
+
+    engine = RefreshEngine(db_session)
+    result = await engine.check("https://supplier.com/pricelist.pdf", kind="catalog")
+    if result.changed:
+        ...  # 파싱
+    """
+
+    def __init__(
+        self,
+        db_session,
+        user_agent: str = "WeDealize-Bot/1.0 (Supplier Discovery)",
+        timeout_seconds: float = 30.0,
+        simhash_threshold: int = 0,
+        max_concurrent_requests: int = 5,
+        politeness: Optional[PolitenessPolicy] = None
+    ):
+        """
+        Args:
+            simhash_threshold: 정규화 텍스트가 바뀌었어도 simhash 해밍 거리가 이 값 이하면 변경 없음으로 간주
+                               (0 = simhash 무시, 정규화 텍스트 해시가 다르면 항상 변경 → 가격 1개 수정도 감지)
+            politeness: 크롤링 예절 정책 (없으면 user_agent / max_concurrent_requests 로 생성)
+        """
+        self.db = db_session
+        self.timeout_seconds = timeout_seconds
+        self.simhash_threshold = simhash_threshold
+        self.politeness = politeness or PolitenessPolicy(
+            user_agent=user_agent,
+            max_concurrent_requests=max_concurrent_requests
+        )
+        self._client = None
+
+    async def _get_client(self):
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+                headers=self.politeness.headers
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_fingerprint(self, url: str) -> Optional[CrawlFingerprint]:
+        return self.db.query(CrawlFingerprint).filter(CrawlFingerprint.url == url).first()
+
+    async def check(
+        self,
+        url: str,
+        kind: str,
+        supplier_id: Optional[int] = None,
+        catalog_id: Optional[int] = None
+    ) -> RefreshResult:
+        """
+        조건부 GET 후 콘텐츠 지문 비교
+
+        세션을 여러 체크가 공유해도 되도록 요청을 기다리는 동안에는 세션에 아무것도 추가하지 않고,
+        응답을 받은 뒤 지문 조회 → 갱신 → 커밋을 await 없이 한 번에 처리합니다 (오류 시 롤백).
+        """
+        fingerprint = self._get_fingerprint(url)
+        headers = {}
+        if fingerprint is not None and fingerprint.etag:
+            headers["If-None-Match"] = fingerprint.etag
+        if fingerprint is not None and fingerprint.last_modified:
+            headers["If-Modified-Since"] = fingerprint.last_modified
+
+        with track_stage("refresh_fetch", source=kind) as t:
+            try:
+                client = await self._get_client()
+                response = await self.politeness.fetch(client, url, headers=headers)
+            except RobotsDisallowed:
+                t.fail()
+                logger.info(f"갱신 확인 생략 - robots.txt 금지 ({url})")
+                return RefreshResult(url=url, status="error", error="robots.txt disallowed")
+            except Exception as e:
+                t.fail()
+                logger.warning(f"갱신 확인 실패 ({url}): {e}")
+                return RefreshResult(url=url, status="error", error=str(e))
+
+        try:
+            return self._record(url, kind, supplier_id, catalog_id, response)
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def _record(
+        self,
+        url: str,
+        kind: str,
+        supplier_id: Optional[int],
+        catalog_id: Optional[int],
+        response
+    ) -> RefreshResult:
+        """응답 → 지문 갱신 + 커밋 (await 없음)"""
+        fingerprint = self._get_fingerprint(url)
+        if fingerprint is None:
+            fingerprint = CrawlFingerprint(url=url, kind=kind, supplier_id=supplier_id, catalog_id=catalog_id,
+                                           check_count=0, change_count=0)
+            self.db.add(fingerprint)
+
+        now = datetime.utcnow()
+        fingerprint.check_count = (fingerprint.check_count or 0) + 1
+        fingerprint.last_checked_at = now
+
+        if response.status_code == 304:
+            self.db.commit()
+            return RefreshResult(url=url, status="not_modified")
+
+        if response.status_code != 200:
+            self.db.commit()
+            return RefreshResult(url=url, status="error", error=f"HTTP {response.status_code}")
+
+        body = response.content
+        content_type = response.headers.get("content-type", "")
+        fingerprint.etag = response.headers.get("etag")
+        fingerprint.last_modified = response.headers.get("last-modified")
+
+        # 콘텐츠 지문 (텍스트는 정규화 후 simhash, 바이너리는 원본 해시)
+        if content_type.startswith(TEXT_CONTENT_TYPES):
+            normalized = normalize_html(response.text)
+            content_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+            content_simhash = simhash(normalized)
+        else:
+            content_hash = hashlib.sha256(body).hexdigest()
+            content_simhash = None
+
+        is_new = fingerprint.content_hash is None
+        if is_new:
+            changed = True
+        elif content_hash == fingerprint.content_hash:
+            changed = False
+        elif self.simhash_threshold > 0 and content_simhash is not None and fingerprint.content_simhash:
+            # 근사 비교는 임계값을 준 경우에만 (simhash 는 작은 수정에서 거리 0 이 흔함)
+            distance = hamming_distance(content_simhash, int(fingerprint.content_simhash, 16))
+            changed = distance > self.simhash_threshold
+        else:
+            changed = True
+
+        if changed:
+            fingerprint.content_hash = content_hash
+            fingerprint.content_simhash = f"{content_simhash:016x}" if content_simhash is not None else None
+            fingerprint.content_length = len(body)
+            fingerprint.last_changed_at = now
+            fingerprint.change_count = (fingerprint.change_count or 0) + 1
+        self.db.commit()
+
+        if not changed:
+            return RefreshResult(url=url, status="unchanged", bytes_downloaded=len(body))
+
+        return RefreshResult(
+            url=url,
+            status="new" if is_new else "changed",
+            content=body,
+            content_type=content_type,
+            bytes_downloaded=len(body)
+        )
@@ -0,0 +1,160 @@
+"""
+WeDealize Product Search Index
+상품 전문 검색 인덱스 (name, name_ko, description, ingredients, ai_tags)
+
+- SQLite: FTS5 가상 테이블 (external content) + 트리거로 products 와 동기화
+- Postgres: tsvector 생성 컬럼 (STORED) + GIN 인덱스
+- 그 외 DB: ILIKE 스캔으로 폴백
+
+ILIKE '%q%' 와 달리 인덱스로 검색하고 관련도 순으로 정렬하므로
+상품 수가 늘어나도 검색 지연이 일정하게 유지됩니다.
+"""
+
+import re
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, Integer, text
+
+logger = logging.getLogger(__name__)
+
+
+# 검색 대상 컬럼과 가중치 (상품명 > 태그 > 설명 > 원재료)
+INDEXED_COLUMNS = ["name", "name_ko", "description", "ingredients", "ai_tags"]
+SQLITE_BM25_WEIGHTS = "10.0, 10.0, 2.0, 1.0, 4.0"
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+        name, name_ko, description, ingredients, ai_tags,
+        content='products', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+        INSERT INTO products_fts(rowid, name, name_ko, description, ingredients, ai_tags)
+        VALUES (new.id, new.name, new.name_ko, new.description, new.ingredients, new.ai_tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, name_ko, description, ingredients, ai_tags)
+        VALUES ('delete', old.id, old.name, old.name_ko, old.description, old.ingredients, old.ai_tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF
+        name, name_ko, description, ingredients, ai_tags ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, name_ko, description, ingredients, ai_tags)
+        VALUES ('delete', old.id, old.name, old.name_ko, old.description, old.ingredients, old.ai_tags);
+        INSERT INTO products_fts(rowid, name, name_ko, description, ingredients, ai_tags)
+        VALUES (new.id, new.name, new.name_ko, new.description, new.ingredients, new.ai_tags);
+    END
+    """,
+]
+
+# 'simple' 설정: 다국어(한/영) 상품명에 언어별 형태소 처리를 적용하지 않음
+POSTGRES_DDL = [
+    """
+    ALTER TABLE products ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(name_ko, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(ai_tags::text, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(ingredients, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_products_search_vector ON products USING GIN (search_vector)",
+]
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize_query(query: str, max_terms: int = 10) -> List[str]:
+    """검색어를 인덱스 질의용 토큰으로 분리 (FTS 연산자 문자 제거)"""
+    return [t.lower() for t in TOKEN_PATTERN.findall(query or "")][:max_terms]
+
+
+class ProductSearchIndex:
+    """상품 전문 검색 인덱스"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.dialect = engine.dialect.name
+
+    @property
+    def supported(self) -> bool:
+        return self.dialect in ("sqlite", "postgresql")
+
+    def ensure(self):
+        """인덱스 생성 (멱등). 기존 DB에 처음 만들 때는 기존 상품을 색인"""
+        if self.dialect == "sqlite":
+            with self.engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type='table' AND name='products_fts'")
+                ).first()
+                for ddl in SQLITE_DDL:
+                    conn.execute(text(ddl))
+                if not exists:
+                    conn.execute(text("INSERT INTO products_fts(products_fts) VALUES ('rebuild')"))
+                    logger.info("상품 검색 인덱스(FTS5) 생성 완료")
+
+        elif self.dialect == "postgresql":
+            # 생성 컬럼이므로 INSERT/UPDATE 시 Postgres가 자동으로 갱신
+            with self.engine.begin() as conn:
+                for ddl in POSTGRES_DDL:
+                    conn.execute(text(ddl))
+
+        else:
+            logger.warning(f"전문 검색 인덱스 미지원 DB ({self.dialect}): ILIKE 검색으로 동작")
+
+    def rebuild(self):
+        """인덱스 전체 재구성 (SQLite)"""
+        if self.dialect == "sqlite":
+            with self.engine.begin() as conn:
+                conn.execute(text("INSERT INTO products_fts(products_fts) VALUES ('rebuild')"))
+
+    def match_subquery(self, query: str, alternatives: Sequence[str] = ()):
+        """
+        (product_id, rank) 서브쿼리 반환 - rank 가 클수록 관련도 높음
+
+        ORM 쿼리에 join 하여 다른 필터와 함께 DB에서 처리합니다.
+        미지원 DB이거나 검색어가 비어 있으면 None.
+
+        Args:
+            alternatives: 대신 일치해도 되는 검색어 (검색어마다 토큰 간 AND, 검색어끼리 OR)
+        """
+        groups = []
+        for q in (query, *alternatives):
+            terms = tokenize_query(q)
+            if terms and terms not in groups:
+                groups.append(terms)
+        if not groups or not self.supported:
+            return None
+
+        if self.dialect == "sqlite":
+            # 각 토큰을 접두어 검색 ("olive"* "oil"*), 토큰 간 AND, 검색어끼리 OR
+            fts_query = " OR ".join("(" + " ".join(f'"{t}"*' for t in terms) + ")" for terms in groups)
+            stmt = text(
+                f"SELECT rowid AS product_id, -bm25(products_fts, {SQLITE_BM25_WEIGHTS}) AS rank "
+                "FROM products_fts WHERE products_fts MATCH :q"
+            ).bindparams(q=fts_query)
+        else:
+            ts_query = " | ".join("(" + " & ".join(f"{t}:*" for t in terms) + ")" for terms in groups)
+            stmt = text(
+                "SELECT id AS product_id, ts_rank_cd(search_vector, to_tsquery('simple', :q)) AS rank "
+                "FROM products WHERE search_vector @@ to_tsquery('simple', :q)"
+            ).bindparams(q=ts_query)
+
+        return stmt.columns(product_id=Integer, rank=Float).subquery("product_search")
+
+    def search(self, session, query: str, limit: int = 100) -> List[Tuple[int, float]]:
+        """관련도 순 (product_id, rank) 목록"""
+        sub = self.match_subquery(query)
+        if sub is None:
+            return []
+        rows = session.query(sub.c.product_id, sub.c.rank).order_by(sub.c.rank.desc()).limit(limit).all()
+        return [(row.product_id, row.rank) for row in rows]
@@ -0,0 +1,373 @@
+"""
+WeDealize Vector Index
+Product.embedding 근사 최근접 이웃(ANN) 인덱스 (유사 상품 / 의미 검색)
+
+- 벡터는 DB에 packed float32 로 저장 (models.database.Float32Vector)
+- hnswlib 가 있으면 HNSW 인덱스, 없으면 numpy 전수 검색(개발용)으로 동작
+- 증분 구축: 마지막 동기화 이후 변경된 상품만 추가 (updated_at 워터마크)
+- 디스크 저장: <path>/products.<버전>.hnsw (또는 .npz) + meta.json
+  인덱스 파일을 새 이름으로 쓴 뒤 meta.json 을 os.replace 로 교체 → 읽는 쪽은 항상 완전한 한 세대를 봄
+- 읽기 전용 프로세스(API)는 reload_if_changed() 로 워커가 저장한 새 세대를 다시 로드
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    HNSWLIB_AVAILABLE = False
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2 정규화 (코사인 유사도 = 내적)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class _HNSWBackend:
+    """hnswlib HNSW 인덱스"""
+
+    SUFFIX = ".hnsw"
+    LEGACY_FILENAME = "products.hnsw"
+
+    def __init__(self, dim: int, m: int, ef_construction: int, ef_search: int, initial_capacity: int):
+        self.dim = dim
+        self.ef_search = ef_search
+        self.index = hnswlib.Index(space="cosine", dim=dim)
+        self.index.init_index(
+            max_elements=initial_capacity,
+            ef_construction=ef_construction,
+            M=m,
+            allow_replace_deleted=True
+        )
+        self.index.set_ef(ef_search)
+        self.deleted: set = set()
+
+    def load(self, path: Path, deleted: Iterable[int]) -> bool:
+        if not path.exists():
+            return False
+        self.index.load_index(str(path), allow_replace_deleted=True)
+        self.index.set_ef(self.ef_search)
+        self.deleted = set(deleted)
+        return True
+
+    def save(self, path: Path):
+        self.index.save_index(str(path))
+
+    def _ensure_capacity(self, extra: int):
+        needed = self.index.get_current_count() + extra
+        capacity = self.index.get_max_elements()
+        if needed > capacity:
+            self.index.resize_index(max(needed, capacity * 2))
+
+    def add(self, ids: np.ndarray, vectors: np.ndarray):
+        for label in ids:
+            if int(label) in self.deleted:
+                self.index.unmark_deleted(int(label))
+                self.deleted.discard(int(label))
+        self._ensure_capacity(len(ids))
+        # 이미 있는 label 은 벡터가 갱신됨
+        self.index.add_items(vectors, ids)
+
+    def remove(self, ids: Iterable[int]):
+        for label in ids:
+            if label not in self.deleted:
+                try:
+                    self.index.mark_deleted(label)
+                    self.deleted.add(label)
+                except RuntimeError:
+                    pass  # 인덱스에 없는 label
+
+    def __len__(self) -> int:
+        return self.index.get_current_count() - len(self.deleted)
+
+    def search(self, vector: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+        self.index.set_ef(max(self.ef_search, k))
+        labels, distances = self.index.knn_query(vector, k=k)
+        return [(int(l), float(1.0 - d)) for l, d in zip(labels[0], distances[0])]
+
+
+class _FlatBackend:
+    """numpy 전수 검색 (hnswlib 미설치 개발 환경용)"""
+
+    SUFFIX = ".npz"
+    LEGACY_FILENAME = "products_flat.npz"
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.ids = np.empty(0, dtype=np.int64)
+        self.vectors = np.empty((0, dim), dtype=np.float32)
+        self.positions: Dict[int, int] = {}
+
+    def load(self, path: Path, deleted: Iterable[int]) -> bool:
+        if not path.exists():
+            return False
+        with np.load(path) as data:
+            self.ids, self.vectors = data["ids"], data["vectors"]
+        self.positions = {int(i): n for n, i in enumerate(self.ids)}
+        return True
+
+    def save(self, path: Path):
+        np.savez(path, ids=self.ids, vectors=self.vectors)
+
+    def add(self, ids: np.ndarray, vectors: np.ndarray):
+        vectors = normalize(vectors)
+        new_ids, new_rows = [], []
+        for label, vec in zip(ids, vectors):
+            pos = self.positions.get(int(label))
+            if pos is not None:
+                self.vectors[pos] = vec
+            else:
+                new_ids.append(int(label))
+                new_rows.append(vec)
+        if new_ids:
+            start = len(self.ids)
+            self.ids = np.concatenate([self.ids, np.asarray(new_ids, dtype=np.int64)])
+            self.vectors = np.vstack([self.vectors, np.asarray(new_rows, dtype=np.float32)])
+            for n, label in enumerate(new_ids):
+                self.positions[label] = start + n
+
+    def remove(self, ids: Iterable[int]):
+        keep = np.isin(self.ids, list(ids), invert=True)
+        self.ids, self.vectors = self.ids[keep], self.vectors[keep]
+        self.positions = {int(i): n for n, i in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, vector: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+        scores = self.vectors @ normalize(vector)[0]
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.ids[i]), float(scores[i])) for i in top]
+
+
+class VectorIndex:
+    """
+    상품 임베딩 ANN 인덱스
+
+    index = VectorIndex("./data/vector_index")
+    index.sync_from_db(session)               # 변경분만 추가 후 저장 (워커)
+    index.reload_if_changed()                 # 다른 프로세스가 저장한 새 세대 로드 (API)
+    index.search(query_vector, k=10)          # [(product_id, similarity), ...]
+    """
+
+    META_FILENAME = "meta.json"
+    KEEP_GENERATIONS = 2  # 읽는 중인 프로세스를 위해 직전 세대 파일은 남겨 둠
+
+    def __init__(
+        self,
+        path: str = "./data/vector_index",
+        dim: Optional[int] = None,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        initial_capacity: int = 100_000
+    ):
+        self.path = Path(path)
+        self.dim = dim
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.initial_capacity = initial_capacity
+        self.watermark: Optional[datetime] = None  # 마지막으로 동기화한 Product.updated_at
+        self.version: Optional[str] = None  # 로드 / 저장한 디스크 세대
+        self._backend = None
+        self._meta_mtime: Optional[int] = None
+        self._load()
+
+    @property
+    def backend_name(self) -> str:
+        return "hnsw" if HNSWLIB_AVAILABLE else "flat"
+
+    def __len__(self) -> int:
+        return len(self._backend) if self._backend else 0
+
+    def _create_backend(self, dim: int):
+        self.dim = dim
+        if HNSWLIB_AVAILABLE:
+            self._backend = _HNSWBackend(dim, self.m, self.ef_construction, self.ef_search, self.initial_capacity)
+        else:
+            if self._backend is None:
+                logger.warning("hnswlib 미설치: 벡터 인덱스를 전수 검색으로 동작합니다 (개발용)")
+            self._backend = _FlatBackend(dim)
+
+    def _meta_stat(self) -> Optional[int]:
+        try:
+            return (self.path / self.META_FILENAME).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load(self) -> bool:
+        meta_path = self.path / self.META_FILENAME
+        self._meta_mtime = self._meta_stat()
+        if self._meta_mtime is None:
+            return False
+        meta = json.loads(meta_path.read_text())
+        if meta.get("backend") != self.backend_name:
+            logger.warning(f"벡터 인덱스 백엔드 변경 ({meta.get('backend')} → {self.backend_name}): 재구축 필요")
+            return False
+
+        previous = (self._backend, self.dim)
+        self._create_backend(meta["dim"])
+        file_name = meta.get("file", self._backend.LEGACY_FILENAME)  # 세대 도입 이전 meta.json
+        if not self._backend.load(self.path / file_name, meta.get("deleted", [])):
+            # 세대 파일이 정리된 직후 등 → 기존 인덱스 유지
+            self._backend, self.dim = previous
+            return False
+        self.watermark = datetime.fromisoformat(meta["watermark"]) if meta.get("watermark") else None
+        self.version = meta.get("version")
+        logger.info(f"벡터 인덱스 로드: {len(self)}개 ({self.backend_name}, 세대 {self.version})")
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """
+        다른 프로세스가 새 세대를 저장했으면 다시 로드 (meta.json mtime 확인만 하므로 요청마다 호출해도 가벼움)
+
+        Returns:
+            다시 로드했는지
+        """
+        mtime = self._meta_stat()
+        if mtime is None or mtime == self._meta_mtime:
+            return False
+        meta = json.loads((self.path / self.META_FILENAME).read_text())
+        if meta.get("version") == self.version:
+            self._meta_mtime = mtime
+            return False
+        return self._load()
+
+    def save(self):
+        """
+        디스크에 새 세대로 저장
+
+        인덱스 파일은 새 이름으로 쓰고, meta.json 은 임시 파일에 쓴 뒤 os.replace 로 교체합니다.
+        저장 중에 읽는 프로세스는 이전 세대를 그대로 보게 됩니다.
+        """
+        if self._backend is None:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        version = f"{time.time_ns():x}-{os.getpid()}"
+        file_name = f"products.{version}{self._backend.SUFFIX}"
+        self._backend.save(self.path / file_name)
+
+        meta = {
+            "backend": self.backend_name,
+            "dim": self.dim,
+            "count": len(self),
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "deleted": sorted(getattr(self._backend, "deleted", [])),
+            "version": version,
+            "file": file_name,
+        }
+        meta_tmp = self.path / f"{self.META_FILENAME}.{version}.tmp"
+        with open(meta_tmp, "w") as f:
+            json.dump(meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(meta_tmp, self.path / self.META_FILENAME)
+        self.version = version
+        self._meta_mtime = self._meta_stat()
+        self._remove_old_generations()
+
+    def _remove_old_generations(self):
+        generations = sorted(
+            self.path.glob(f"products.*{self._backend.SUFFIX}"),
+            key=lambda p: p.stat().st_mtime_ns,
+            reverse=True
+        )
+        for old in generations[self.KEEP_GENERATIONS:]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def add(self, ids: Sequence[int], vectors: Sequence[Sequence[float]]):
+        """벡터 추가/갱신 (같은 ID면 교체)"""
+        if not len(ids):
+            return
+        data = np.asarray(vectors, dtype=np.float32)
+        if self._backend is None:
+            self._create_backend(data.shape[1])
+        if data.shape[1] != self.dim:
+            raise ValueError(f"임베딩 차원 불일치: {data.shape[1]} != {self.dim}")
+        self._backend.add(np.asarray(ids, dtype=np.int64), data)
+
+    def remove(self, ids: Iterable[int]):
+        """벡터 제거 (비활성 상품 등)"""
+        if self._backend is not None:
+            self._backend.remove([int(i) for i in ids])
+
+    def search(
+        self,
+        vector: Sequence[float],
+        k: int = 10,
+        exclude: Iterable[int] = ()
+    ) -> List[Tuple[int, float]]:
+        """코사인 유사도 상위 k개 (product_id, similarity)"""
+        if self._backend is None:
+            return []
+        excluded = set(exclude)
+        query = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        results = self._backend.search(query, k + len(excluded))
+        return [(pid, score) for pid, score in results if pid not in excluded][:k]
+
+    def sync_from_db(self, session, batch_size: int = 5000) -> int:
+        """
+        마지막 동기화 이후 변경된 상품 임베딩을 증분 반영 후 저장
+
+        다른 워커가 먼저 저장한 세대가 있으면 그것을 로드한 뒤 그 워터마크부터 반영합니다.
+
+        Returns:
+            반영된 상품 수
+        """
+        from ..models.database import Product
+
+        self.reload_if_changed()
+
+        q = session.query(Product.id, Product.embedding, Product.is_active, Product.updated_at)
+        if self.watermark:
+            q = q.filter(Product.updated_at > self.watermark)
+        q = q.order_by(Product.updated_at, Product.id)
+
+        synced = 0
+        ids, vectors, inactive = [], [], []
+        for row in q.yield_per(batch_size):
+            if row.embedding is not None and row.is_active is not False:
+                ids.append(row.id)
+                vectors.append(row.embedding)
+            else:
+                inactive.append(row.id)
+            self.watermark = max(self.watermark, row.updated_at) if self.watermark else row.updated_at
+
+            if len(ids) >= batch_size:
+                self.add(ids, vectors)
+                synced += len(ids)
+                ids, vectors = [], []
+
+        self.add(ids, vectors)
+        synced += len(ids)
+        self.remove(inactive)
+
+        if synced or inactive:
+            self.save()
+            logger.info(f"벡터 인덱스 동기화: {synced}개 추가/갱신, {len(inactive)}개 제거 (총 {len(self)}개)")
+        return synced
@@ -0,0 +1,12 @@
+"""
+pytest 설정: backend 를 패키지로 import (python -m backend.xxx 와 같은 경로)
+
+cd backend && python -m pytest -q
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
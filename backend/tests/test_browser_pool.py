@@ -0,0 +1,130 @@
+"""BrowserPool 대여 / 반납 (취소된 요청도 컨텍스트 자리를 돌려놓는지)"""
+
+import asyncio
+
+import pytest
+
+from backend.crawlers import browser_pool as browser_pool_module
+from backend.crawlers.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self, pool):
+        self.pool = pool
+        self.closed = False
+
+    def set_default_navigation_timeout(self, timeout_ms):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    async def goto(self, url, wait_until=None):
+        if url == "about:blank" and self.pool.hang_blank:
+            await asyncio.Event().wait()
+        if url.endswith("/slow"):
+            await asyncio.Event().wait()
+        return None
+
+    async def content(self):
+        return "<html><body>ok</body></html>"
+
+
+class FakeContext:
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        if self.pool.hang_new_page:
+            await asyncio.Event().wait()
+        return FakePage(self.pool)
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **options):
+        return FakeContext(self.pool)
+
+    async def close(self):
+        pass
+
+
+class FakePlaywright:
+    """hang_new_page / hang_blank 가 켜지면 해당 단계에서 끝없이 대기"""
+
+    def __init__(self):
+        self.hang_new_page = False
+        self.hang_blank = False
+        self.chromium = self
+
+    async def launch(self, headless=True):
+        return FakeBrowser(self)
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    playwright = FakePlaywright()
+    monkeypatch.setattr(browser_pool_module, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(browser_pool_module, "async_playwright", lambda: playwright, raising=False)
+    return playwright
+
+
+async def _cancelled_fetches(pool, url, count):
+    for _ in range(count):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.fetch_html(url), 0.05)
+
+
+def test_cancel_while_creating_page_returns_slot(fake_playwright):
+    async def main():
+        pool = BrowserPool(browsers=1, contexts_per_browser=2)
+        fake_playwright.hang_new_page = True
+        await _cancelled_fetches(pool, "https://supplier.example/", 2)
+        assert pool._idle.qsize() == 2 and not pool._leases
+
+        fake_playwright.hang_new_page = False
+        html = await asyncio.wait_for(pool.fetch_html("https://supplier.example/"), 1)
+        await pool.close()
+        return html
+
+    assert "ok" in asyncio.run(main())
+
+
+def test_cancel_while_releasing_returns_slot(fake_playwright):
+    async def main():
+        pool = BrowserPool(browsers=1, contexts_per_browser=2)
+        fake_playwright.hang_blank = True
+        # 페이지 이동 중 취소 (discard) + 빈 페이지 이동 중 취소 (반납 단계)
+        await _cancelled_fetches(pool, "https://supplier.example/slow", 2)
+        for _ in range(2):
+            page = await pool.acquire()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(pool.release(page), 0.05)
+        assert pool._idle.qsize() == 2 and not pool._leases
+
+        fake_playwright.hang_blank = False
+        html = await asyncio.wait_for(pool.fetch_html("https://supplier.example/"), 1)
+        await pool.close()
+        return html
+
+    assert "ok" in asyncio.run(main())
@@ -0,0 +1,152 @@
+"""EmailExtractor HTML 단일 패스 스캔 (이전 구현과의 결과 일치 + 벤치마크), 스트리밍 수신"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.crawlers.email_extractor import EmailExtractor, _legacy_scan
+
+BASE_URL = "https://supplier.example/"
+
+
+@pytest.fixture
+def extractor():
+    return EmailExtractor()
+
+
+# 링크 여는 태그 안에만 있는 이메일 (태그를 통째로 소비해도 빠지면 안 됨)
+ANCHOR_EMAIL_CASES = [
+    ('<a href="mailto:Sales Team <sales@supplier.example>">Sales</a>', "sales@supplier.example"),
+    ('<a href="mailto:?to=export@supplier.example&subject=Catalog">Export</a>', "export@supplier.example"),
+    ('<a href="https://mail.google.com/mail/?view=cm&fs=1&to=info%40supplier.example">Gmail</a>', "info@supplier.example"),
+    ('<a href="https://outlook.live.com/mail/deeplink/compose?to=trade@supplier.example">Outlook</a>', "trade@supplier.example"),
+    ('<a class="obf" data-email="hello@supplier.example" href="#">Email us</a>', "hello@supplier.example"),
+    ('<a href="/contact" title="ceo@supplier.example">CEO</a>', "ceo@supplier.example"),
+    ("<a href='mailto:orders@supplier.example'>Orders</a>", "orders@supplier.example"),
+]
+
+# href 안의 전화번호
+ANCHOR_PHONE_CASES = [
+    ('<a href="tel:+86 531 8888 9999">Call</a>', "+86 531 8888 9999"),
+    ('<a href="callto:+86 531 8888 9999">Call</a>', "+86 531 8888 9999"),
+    ('<a href="https://wa.me/?phone=+86%20531%208888%209999">WhatsApp</a>', "+86 531 8888 9999"),
+]
+
+
+def supplier_page(sections: int = 1) -> str:
+    """공급사 홈페이지 형태의 HTML (본문 / 링크 / 스크립트 / 푸터)"""
+    body = []
+    for n in range(sections):
+        body.append(
+            f'<div class="product"><h2>Extra Virgin Olive Oil {n}</h2>'
+            f'<p>Cold pressed, 500ml bottle, MOQ 1200 pcs. Item code 2024-{n:05d}.</p>'
+            f'<a href="/products/olive-oil-{n}">Details</a>'
+            f'<script>var cfg = {{"id": {n}, "sku": "OO-{n}", "ts": 1700000000}};</script></div>'
+        )
+    return (
+        "<html><head><title>Supplier</title><style>.a{color:#333}</style></head><body>"
+        '<nav><a href="/">Home</a><a href="/about-us">About</a><a href="/products">Products</a></nav>'
+        + "".join(body)
+        + '<p>Write to sales@supplier.example or call +39 055 123 4567.</p>'
+        '<footer><a href="/contact">Contact us</a> <a href="mailto:export@supplier.example">export</a>'
+        '<a data-email="info@supplier.example" href="#">mail</a></footer>'
+        "</body></html>"
+    )
+
+
+@pytest.mark.parametrize("html, email", ANCHOR_EMAIL_CASES)
+def test_anchor_tag_emails(extractor, html, email):
+    scan = extractor._scan_html(f"<p>Welcome</p>{html}", BASE_URL)
+    assert email in scan.emails
+
+
+@pytest.mark.parametrize("html, phone", ANCHOR_PHONE_CASES)
+def test_anchor_href_phones(extractor, html, phone):
+    scan = extractor._scan_html(html, BASE_URL)
+    assert phone in scan.phones
+
+
+def test_short_numbers_in_href_are_not_phones(extractor):
+    scan = extractor._scan_html('<a href="/catalog/2024/12">Catalog</a>', BASE_URL)
+    assert scan.phones == []
+
+
+def test_contact_candidates(extractor):
+    scan = extractor._scan_html(supplier_page(), BASE_URL)
+    assert scan.contact_candidates[0] == "https://supplier.example/contact"
+    assert "https://supplier.example/about-us" in scan.contact_candidates
+
+
+@pytest.mark.parametrize(
+    "html",
+    [supplier_page(), supplier_page(50)]
+    + [f"<p>Welcome</p>{html}" for html, _ in ANCHOR_EMAIL_CASES if "%40" not in html],
+)
+def test_emails_match_legacy_scan(extractor, html):
+    pytest.importorskip("bs4")
+    legacy = _legacy_scan(extractor, html, BASE_URL)
+    fast = extractor._scan_html(html, BASE_URL)
+    assert set(fast.emails) == set(legacy.emails)
+
+
+def test_single_pass_faster_than_legacy(extractor):
+    pytest.importorskip("bs4")
+    html = supplier_page(2000)
+
+    def best_of(scan, repeat: int = 3) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            scan()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    legacy_time = best_of(lambda: _legacy_scan(extractor, html, BASE_URL))
+    fast_time = best_of(lambda: extractor._scan_html(html, BASE_URL))
+    assert fast_time < legacy_time
+
+
+def _stream_page(extractor: EmailExtractor, html: str, chunk_size: int = 4096):
+    """MockTransport 로 html 을 청크 단위 스트리밍 → (받은 본문, partial)"""
+    httpx = pytest.importorskip("httpx")
+    data = html.encode("utf-8")
+
+    async def chunks():
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": "text/html; charset=utf-8"}, content=chunks())
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await extractor._stream_get(client, BASE_URL, {})
+        return response.text, response.extensions["partial"]
+
+    return asyncio.run(run())
+
+
+def test_stop_after_footer_ignores_article_footers():
+    extractor = EmailExtractor(stop_after_footer=True)
+    articles = "".join(
+        f"<article><p>{'Olive oil news. ' * 200}</p><footer>Posted {n}</footer></article>" for n in range(10)
+    )
+    html = (
+        f"<html><body>{articles}{'<p>filler</p>' * 2000}"
+        "<footer>Contact: export@supplier.example</footer></body>"
+        f"<script>{'x' * 50000}</script></html>"
+    )
+
+    text, partial = _stream_page(extractor, html)
+    assert "export@supplier.example" in text
+    assert partial
+    assert len(text) < len(html)
+
+
+def test_without_stop_after_footer_reads_whole_page():
+    extractor = EmailExtractor()
+    html = "<html><body><footer>sales@supplier.example</footer></body><script>tail()</script></html>"
+    text, partial = _stream_page(extractor, html, chunk_size=16)
+    assert text == html
+    assert not partial
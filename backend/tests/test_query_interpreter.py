@@ -0,0 +1,57 @@
+"""QueryInterpreter 규칙 기반 해석 (한 글자 한글 패턴의 단어 경계)"""
+
+import pytest
+
+from backend.agents.query_interpreter import QueryInterpreter
+
+
+@pytest.fixture(scope="module")
+def interpreter():
+    return QueryInterpreter()
+
+
+@pytest.mark.parametrize("query", ["가능하면 유기농 커피 원두", "이김치 공급업체", "빵빵한 포장"])
+def test_single_syllable_inside_word_is_not_matched(interpreter, query):
+    result = interpreter.interpret(query)
+    assert not {"noodles", "seaweed", "bread"} & set(result.keywords)
+
+
+def test_single_syllable_inside_word_lowers_confidence(interpreter):
+    result = interpreter.interpret("가능하면 유기농 커피 원두")
+    assert result.keywords == ["coffee beans"]
+    assert "가능하면" in result.unmatched
+    assert result.confidence < 0.7
+
+
+@pytest.mark.parametrize("query, keyword", [
+    ("김 공급업체", "seaweed"),
+    ("한국산 꿀을 찾아줘", "honey"),
+    ("쌀, 수출업체", "rice"),
+    ("햄 제품 추천", "ham"),
+])
+def test_single_syllable_standalone_is_matched(interpreter, query, keyword):
+    result = interpreter.interpret(query)
+    assert keyword in result.keywords
+    assert result.confidence == 1.0
+
+
+def test_lowercase_us_is_not_a_country(interpreter):
+    result = interpreter.interpret("contact us for sauces")
+    assert result.countries == []
+    assert result.keywords == ["sauce"]
+
+
+@pytest.mark.parametrize("query", ["I need rice suppliers in the US", "rice from the U.S.", "USA rice exporters"])
+def test_us_abbreviation_is_a_country(interpreter, query):
+    assert interpreter.interpret(query).countries == ["USA"]
+
+
+def test_intent_words_are_not_keywords(interpreter):
+    result = interpreter.interpret("please contact us, we need a quote for honey suppliers")
+    assert result.keywords == ["honey"]
+
+
+def test_terms_keep_the_users_product_words(interpreter):
+    result = interpreter.interpret("고추장 수출업체")
+    assert result.keywords == ["gochujang"]
+    assert result.terms == ["고추장"]
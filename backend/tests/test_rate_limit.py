@@ -0,0 +1,50 @@
+"""TokenBucket 대기 / 취소 (취소된 대기의 토큰 반환)"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.crawlers.rate_limit import TokenBucket
+
+
+def test_waiters_wait_in_turn():
+    async def main():
+        bucket = TokenBucket(rate=20.0)
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+        return time.monotonic() - started
+
+    # 첫 토큰은 바로, 나머지 3개는 0.05초 간격
+    assert 0.13 <= asyncio.run(main()) < 0.3
+
+
+def test_cancelled_waiters_refund_tokens():
+    async def main():
+        bucket = TokenBucket(rate=10.0)
+        await bucket.acquire()
+        for _ in range(5):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(bucket.acquire(), 0.01)
+        started = time.monotonic()
+        await bucket.acquire()
+        return time.monotonic() - started
+
+    # 취소된 5건이 토큰을 계속 차지하면 약 0.6초, 반환하면 다음 토큰까지(0.1초 미만)만 대기
+    assert asyncio.run(main()) < 0.15
+
+
+def test_cancel_keeps_later_waiter_schedule():
+    async def main():
+        bucket = TokenBucket(rate=10.0)
+        await bucket.acquire()
+        first = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        started = time.monotonic()
+        await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) < 0.15
@@ -0,0 +1,53 @@
+"""ProductSearchIndex (SQLite FTS5) 검색어 / 대체 검색어 일치"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models.database import Base, Product, Supplier
+from backend.services.search_index import ProductSearchIndex
+
+
+@pytest.fixture
+def indexed_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    index = ProductSearchIndex(engine)
+    index.ensure()
+    session = sessionmaker(bind=engine)()
+    supplier = Supplier(name="K Foods", country="South Korea")
+    session.add(supplier)
+    session.flush()
+    session.add_all([
+        Product(supplier_id=supplier.id, name="Red pepper paste", name_ko="고추장"),
+        Product(supplier_id=supplier.id, name="Gochujang hot paste"),
+        Product(supplier_id=supplier.id, name="Acacia honey"),
+    ])
+    session.commit()
+    yield index, session
+    session.close()
+
+
+def _names(index, session, query, alternatives=()):
+    sub = index.match_subquery(query, alternatives)
+    rows = session.query(Product.name).join(sub, Product.id == sub.c.product_id).all()
+    return sorted(name for name, in rows)
+
+
+def test_terms_within_query_are_and(indexed_session):
+    index, session = indexed_session
+    assert _names(index, session, "gochujang paste") == ["Gochujang hot paste"]
+    assert _names(index, session, "gochujang honey") == []
+
+
+def test_alternatives_are_or(indexed_session):
+    index, session = indexed_session
+    # 영문 키워드만으로는 name_ko 로만 일치하는 상품을 찾지 못함
+    assert _names(index, session, "gochujang") == ["Gochujang hot paste"]
+    assert _names(index, session, "gochujang", ["고추장"]) == ["Gochujang hot paste", "Red pepper paste"]
+
+
+def test_empty_alternatives_are_ignored(indexed_session):
+    index, session = indexed_session
+    assert _names(index, session, "honey", ["", "honey"]) == ["Acacia honey"]
+    assert index.match_subquery("", [""]) is None